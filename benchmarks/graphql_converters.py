@@ -0,0 +1,76 @@
+"""
+Cost of converting a 50-edge ``characters`` page and a full season to strawberry types.
+
+Compares the ``singledispatch`` based ``ModelConverter`` with the ``CompiledModelConverter``. Rows are plain
+model instances, no database is involved.
+
+Usage:
+    python benchmarks/graphql_converters.py [iterations]
+"""
+
+import sys
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from futuramaapi.db.models import CharacterModel, EpisodeModel, SeasonModel
+from futuramaapi.routers.graphql.conversion import CompiledModelConverter, ConverterBase, ModelConverter
+from futuramaapi.routers.graphql.schemas import Characters, Season
+
+
+def _get_characters(count: int, /) -> list[CharacterModel]:
+    return [
+        CharacterModel(
+            id=id_,
+            name=f"Character {id_}",
+            gender=CharacterModel.CharacterGender.MALE,
+            status=CharacterModel.CharacterStatus.ALIVE,
+            species=CharacterModel.CharacterSpecies.HUMAN,
+            created_at=datetime.now(UTC),
+            image=None,
+        )
+        for id_ in range(1, count + 1)
+    ]
+
+
+def _get_season(episodes: int, /) -> SeasonModel:
+    return SeasonModel(
+        id=1,
+        episodes=[
+            EpisodeModel(
+                id=id_,
+                name=f"Episode {id_}",
+                air_date=datetime.now(UTC).date(),
+                duration=22,
+                created_at=datetime.now(UTC),
+            )
+            for id_ in range(1, episodes + 1)
+        ],
+    )
+
+
+def _measure(converter: ConverterBase, iterations: int, characters: list[Any], season: SeasonModel, /) -> float:
+    for _ in range(min(iterations, 100)):
+        converter.get_edges(Characters, characters)
+        converter.to_strawberry(Season, season)
+
+    started: float = time.perf_counter()
+    for _ in range(iterations):
+        converter.get_edges(Characters, characters)
+        converter.to_strawberry(Season, season)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main(iterations: int, /) -> None:
+    characters: list[CharacterModel] = _get_characters(50)
+    season: SeasonModel = _get_season(26)
+
+    baseline: float = _measure(ModelConverter(), iterations, characters, season)
+    print(f"{'converter':<28}{'us/page':>12}{'speedup':>10}")
+    print(f"{ModelConverter.__name__:<28}{baseline:>12.1f}{1:>9.1f}x")
+    compiled: float = _measure(CompiledModelConverter(), iterations, characters, season)
+    print(f"{CompiledModelConverter.__name__:<28}{compiled:>12.1f}{baseline / compiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
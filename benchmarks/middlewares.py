@@ -0,0 +1,93 @@
+"""
+Per-request overhead of the API middleware stack on the ``/api/characters/{id}`` path.
+
+Compares the former ``BaseHTTPMiddleware`` based ``APIRequestsCounter`` with the pure ASGI one. The endpoint
+does not touch the database, so the difference is the middleware machinery only.
+
+Usage:
+    python benchmarks/middlewares.py [requests]
+"""
+
+import asyncio
+import sys
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message
+
+from futuramaapi.middlewares.counter import APIRequestsCounter, requests_counter
+
+
+class BaseHTTPAPIRequestsCounter(BaseHTTPMiddleware):
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        if request.url.path.startswith("/api"):
+            requests_counter.add(request.url.__str__().split("?")[0][:64])
+
+        return await call_next(request)
+
+
+async def get_character(request: Request) -> JSONResponse:
+    return JSONResponse({"id": request.path_params["character_id"], "name": "Philip J. Fry"})
+
+
+def _build_app(middleware: type | None, /) -> ASGIApp:
+    return Starlette(
+        routes=[Route("/api/characters/{character_id:int}", get_character)],
+        middleware=[Middleware(middleware)] if middleware is not None else [],
+    )
+
+
+async def _request(app: ASGIApp, /) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "https",
+        "server": ("futuramaapi.com", 443),
+        "path": "/api/characters/1",
+        "raw_path": b"/api/characters/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"futuramaapi.com")],
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_: Message) -> None:
+        return None
+
+    await app(scope, receive, send)
+
+
+async def _measure(app: ASGIApp, requests: int, /) -> float:
+    for _ in range(min(requests, 1000)):
+        await _request(app)
+
+    started: float = time.perf_counter()
+    for _ in range(requests):
+        await _request(app)
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def main(requests: int, /) -> None:
+    baseline: float = await _measure(_build_app(None), requests)
+    print(f"{'middleware':<28}{'us/request':>12}{'overhead, us':>14}")
+    print(f"{'none':<28}{baseline:>12.1f}{0:>14.1f}")
+    for middleware in (BaseHTTPAPIRequestsCounter, APIRequestsCounter):
+        elapsed: float = await _measure(_build_app(middleware), requests)
+        print(f"{middleware.__name__:<28}{elapsed:>12.1f}{elapsed - baseline:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
@@ -0,0 +1,99 @@
+"""
+CPU cost of one character move delivered to many SSE clients of the same character.
+
+Compares building and encoding the event per client, as the former per-client loops did, with the
+``NotificationHub`` encoding it once and fanning the bytes out through per-client queues.
+
+Usage:
+    python benchmarks/notifications.py [clients]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import UTC, datetime
+
+from sse_starlette import ServerSentEvent
+
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.routers.services.characters.get_character import GetCharacterResponse
+from futuramaapi.routers.services.notifications.hub import NotificationHub
+from futuramaapi.routers.services.notifications.sse_character import CharacterNotificationResponse
+
+_TICKS: int = 10
+
+
+def _get_character() -> GetCharacterResponse:
+    return GetCharacterResponse.model_validate(
+        CharacterModel(
+            id=1,
+            name="Philip J. Fry",
+            gender=CharacterModel.CharacterGender.MALE,
+            status=CharacterModel.CharacterStatus.ALIVE,
+            species=CharacterModel.CharacterSpecies.HUMAN,
+            created_at=datetime.now(UTC),
+            image=None,
+        )
+    )
+
+
+async def _per_client(character: GetCharacterResponse, clients: int, /) -> float:
+    async def client() -> None:
+        for _ in range(_TICKS):
+            # Stands in for the per-client timer, cheaper than the former sleep and disconnect polling.
+            await asyncio.sleep(0)
+            data = CharacterNotificationResponse.model_validate(
+                {"item": character, "notification": {"x": 1, "y": 2}}
+            ).model_dump(mode="json")
+            ServerSentEvent(data=data).encode()
+
+    started: float = time.process_time()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return time.process_time() - started
+
+
+async def _hub(character: GetCharacterResponse, clients: int, /) -> float:
+    hub: NotificationHub = NotificationHub(queue_size=_TICKS + 1)
+    tick: asyncio.Event = asyncio.Event()
+
+    async def ticker() -> bytes:
+        await tick.wait()
+        tick.clear()
+        response = CharacterNotificationResponse(
+            item=character,
+            notification=CharacterNotificationResponse.Notification(x=1, y=2),
+        )
+        return ServerSentEvent(data=response.model_dump_json()).encode()
+
+    async def client() -> None:
+        received: int = 0
+        async for _ in hub.subscribe(character.id, ticker):
+            received += 1
+            if received == _TICKS:
+                return
+
+    tasks: list[asyncio.Task] = [asyncio.create_task(client()) for _ in range(clients)]
+    await asyncio.sleep(0)
+
+    started: float = time.process_time()
+    for _ in range(_TICKS):
+        tick.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return time.process_time() - started
+
+
+async def main(clients: int, /) -> None:
+    character: GetCharacterResponse = _get_character()
+    per_client: float = await _per_client(character, clients)
+    hub: float = await _hub(character, clients)
+
+    print(f"{clients} clients, {_TICKS} moves")
+    print(f"{'delivery':<12}{'cpu, ms':>10}{'us/event':>10}")
+    for name, elapsed in (("per-client", per_client), ("hub", hub)):
+        print(f"{name:<12}{elapsed * 1000:>10.1f}{elapsed / (clients * _TICKS) * 1_000_000:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
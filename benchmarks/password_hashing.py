@@ -0,0 +1,77 @@
+"""
+Latency of catalog reads served while a burst of logins, one every 10ms, is being verified.
+
+Compares blocking ``hasher.verify`` calls with ``hasher.averify``, which runs in the hasher thread pool. Catalog
+reads are plain dict lookups issued at a fixed interval, so their latency is the time the event loop was busy.
+
+Usage:
+    python benchmarks/password_hashing.py [logins]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from futuramaapi.helpers.hashers import HasherBusyError, PasswordHasherPBKDF2
+
+_PASSWORD: str = "Password1"  # noqa: S105
+_READ_INTERVAL: float = 0.005
+_LOGIN_INTERVAL: float = 0.01
+
+
+async def _read_catalog(catalog: dict[int, str], stop: asyncio.Event, latencies: list[float], /) -> None:
+    while not stop.is_set():
+        started: float = time.perf_counter()
+        await asyncio.sleep(_READ_INTERVAL)
+        catalog.get(1)
+        latencies.append((time.perf_counter() - started - _READ_INTERVAL) * 1000)
+
+
+async def _measure(login: Callable[[], Awaitable[bool]], logins: int, /) -> tuple[float, float, float, int]:
+    catalog: dict[int, str] = {1: "Philip J. Fry"}
+    stop: asyncio.Event = asyncio.Event()
+    latencies: list[float] = []
+    reader: asyncio.Task = asyncio.create_task(_read_catalog(catalog, stop, latencies))
+
+    async def delayed_login(delay: float, /) -> bool:
+        await asyncio.sleep(delay)
+        return await login()
+
+    started: float = time.perf_counter()
+    results: list[bool | BaseException] = await asyncio.gather(
+        *(delayed_login(i * _LOGIN_INTERVAL) for i in range(logins)),
+        return_exceptions=True,
+    )
+    elapsed: float = time.perf_counter() - started
+
+    stop.set()
+    await reader
+
+    rejected: int = sum(isinstance(result, HasherBusyError) for result in results)
+    quantiles: list[float] = statistics.quantiles(latencies, n=100, method="inclusive")
+    return quantiles[49], quantiles[98], elapsed, rejected
+
+
+async def main(logins: int, /) -> None:
+    hasher: PasswordHasherPBKDF2 = PasswordHasherPBKDF2()
+    encoded: str = hasher.encode(_PASSWORD)
+
+    async def blocking_login() -> bool:
+        return hasher.verify(_PASSWORD, encoded)
+
+    async def offloaded_login() -> bool:
+        return await hasher.averify(_PASSWORD, encoded)
+
+    print(f"{logins} logins, hasher pool: {hasher.max_workers} threads, {hasher.max_pending} pending")
+    print(f"{'login':<12}{'p50 read, ms':>14}{'p99 read, ms':>14}{'burst, s':>10}{'rejected':>10}")
+    for name, login in (("verify", blocking_login), ("averify", offloaded_login)):
+        p50, p99, elapsed, rejected = await _measure(login, logins)
+        print(f"{name:<12}{p50:>14.2f}{p99:>14.2f}{elapsed:>10.2f}{rejected:>10}")
+
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 16))
@@ -4,6 +4,7 @@ from ._base import (
     ApiClientProxyError,
     ApiClientReadTimeoutError,
     ApiClientTooManyRedirectsError,
+    BaseApiClientError,
     BaseClient,
     HTTPVersion,
     RequestData,
@@ -11,6 +12,7 @@ from ._base import (
     ResponseData,
 )
 from ._httpx import HTTPXClient
+from ._registry import ClientRegistry, client_registry
 
 __all__ = [
     "ApiClientConnectTimeoutError",
@@ -18,10 +20,13 @@ __all__ = [
     "ApiClientProxyError",
     "ApiClientReadTimeoutError",
     "ApiClientTooManyRedirectsError",
+    "BaseApiClientError",
     "BaseClient",
+    "ClientRegistry",
     "HTTPVersion",
     "HTTPXClient",
     "RequestData",
     "RequestTimeout",
     "ResponseData",
+    "client_registry",
 ]
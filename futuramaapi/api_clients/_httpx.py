@@ -28,6 +28,7 @@ class HTTPXClient(BaseClient):
         self,
         max_connections: int = 256,
         max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = 5.0,
         read_timeout: float | None = 5.0,
         write_timeout: float | None = 5.0,
         connect_timeout: float | None = 5.0,
@@ -38,6 +39,7 @@ class HTTPXClient(BaseClient):
     ) -> None:
         self._max_connections: int = max_connections
         self._max_keepalive_connections: int | None = max_keepalive_connections
+        self._keepalive_expiry: float | None = keepalive_expiry
         self._read_timeout: float | None = read_timeout
         self._write_timeout: float | None = write_timeout
         self._connect_timeout: float | None = connect_timeout
@@ -65,6 +67,7 @@ class HTTPXClient(BaseClient):
         return httpx.Limits(
             max_connections=self._max_connections,
             max_keepalive_connections=self._max_keepalive_connections,
+            keepalive_expiry=self._keepalive_expiry,
         )
 
     @property
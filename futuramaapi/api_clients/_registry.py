@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from asyncio import Semaphore
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+import httpx
+
+from futuramaapi.core import settings
+
+from ._base import BaseClient
+from ._httpx import HTTPXClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from ._base import RequestData, ResponseData
+
+
+class _HostSlots:
+    """Per-host concurrency limit, entries are dropped once a host has no requests in flight."""
+
+    def __init__(self, limit: int, /) -> None:
+        self._limit: int = limit
+        self._slots: dict[str, tuple[Semaphore, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @asynccontextmanager
+    async def acquire(self, host: str, /) -> AsyncIterator[None]:
+        semaphore, users = self._slots.get(host, (None, 0))
+        if semaphore is None:
+            semaphore = Semaphore(self._limit)
+        self._slots[host] = (semaphore, users + 1)
+
+        try:
+            async with semaphore:
+                yield
+        finally:
+            semaphore, users = self._slots[host]
+            if users == 1:
+                del self._slots[host]
+            else:
+                self._slots[host] = (semaphore, users - 1)
+
+
+class _BorrowedClient(BaseClient):
+    """
+    View of the registry's shared client.
+
+    Lifecycle calls are no-ops, the registry owns the connections, so services can keep using
+    ``async with client`` while borrowing it.
+    """
+
+    def __init__(self, registry: ClientRegistry, /) -> None:
+        self._registry: ClientRegistry = registry
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def request(
+        self,
+        request_data: RequestData,
+        /,
+    ) -> ResponseData:
+        return await self._registry.request(request_data)
+
+
+class ClientRegistry:
+    """Process-wide HTTP client with keep-alive connection reuse and per-host connection limits.
+
+    Initialized once per process, in the FastAPI lifespan and on dramatiq worker boot, and shared by
+    all outbound requests, so repeated requests to the same host skip the TCP connect and TLS handshake.
+
+    Usage:
+        >>> async def foo():
+        >>>     await client_registry.initialize()
+        >>>     response = await client_registry.get().request(request_data)
+        >>>     await client_registry.shutdown()
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 256,
+        max_connections_per_host: int = 32,
+        keepalive_expiry: float | None = 30.0,
+    ) -> None:
+        self._max_connections: int = max_connections
+        self._keepalive_expiry: float | None = keepalive_expiry
+        self._host_slots: _HostSlots = _HostSlots(max_connections_per_host)
+
+        self._client: HTTPXClient | None = None
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._client is not None
+
+    def _build_client(self) -> HTTPXClient:
+        return HTTPXClient(
+            max_connections=self._max_connections,
+            keepalive_expiry=self._keepalive_expiry,
+        )
+
+    async def initialize(self) -> None:
+        if self._client is not None:
+            raise RuntimeError("Client registry already initialized.")
+
+        client: HTTPXClient = self._build_client()
+        await client.initialize()
+        self._client = client
+
+    async def shutdown(self) -> None:
+        if self._client is None:
+            return
+
+        client: HTTPXClient = self._client
+        self._client = None
+        await client.shutdown()
+
+    def get(self) -> BaseClient:
+        """Borrow the shared client, fall back to a dedicated one outside of an initialized process."""
+        if self._client is None:
+            return self._build_client()
+
+        return _BorrowedClient(self)
+
+    async def request(
+        self,
+        request_data: RequestData,
+        /,
+    ) -> ResponseData:
+        if self._client is None:
+            raise RuntimeError("Client registry is not initialized.")
+
+        async with self._host_slots.acquire(httpx.URL(request_data.url).netloc.decode()):
+            return await self._client.request(request_data)
+
+
+client_registry: ClientRegistry = ClientRegistry(
+    max_connections=settings.http_client_max_connections,
+    max_connections_per_host=settings.http_client_max_connections_per_host,
+    keepalive_expiry=settings.http_client_keepalive_expiry,
+)
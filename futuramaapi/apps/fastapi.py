@@ -11,11 +11,18 @@ from fastapi_pagination import add_pagination
 from starlette.routing import Host, Mount, Route, WebSocketRoute
 
 from futuramaapi.__version__ import __version__
+from futuramaapi.api_clients import client_registry
 from futuramaapi.core import feature_flags, settings
+from futuramaapi.db.auth_sessions import auth_session_sweeper
+from futuramaapi.db.catalog import catalog, catalog_refresher
 from futuramaapi.db.session import session_manager
+from futuramaapi.helpers.hashers import HasherBusyError, hasher
 from futuramaapi.middlewares.cors import CORSMiddleware
-from futuramaapi.middlewares.counter import APIRequestsCounter
+from futuramaapi.middlewares.counter import APIRequestsCounter, requests_counter
 from futuramaapi.middlewares.secure import HTTPSRedirectMiddleware
+from futuramaapi.middlewares.timing import ServerTimingMiddleware
+from futuramaapi.routers.services.links.redirect_link import link_clicks
+from futuramaapi.routers.services.sitemaps.get_sitemap import sitemap
 from futuramaapi.utils import metadata
 
 if TYPE_CHECKING:
@@ -35,8 +42,10 @@ class FuturamaAPI(FastAPI):
         "/openapi.json",
         "/robots.txt",
         "/sitemap.xml",
+        "/sitemaps/",
         "/static",
         "/health",
+        "/metrics",
         "/logout",
         "/api/",
         "/s/",
@@ -54,7 +63,26 @@ class FuturamaAPI(FastAPI):
 
     @asynccontextmanager
     async def _lifespan(self, _: Self, /) -> AsyncGenerator[None, Any]:
+        if feature_flags.cache_catalog:
+            await catalog.load()
+            await catalog_refresher.start()
+        if feature_flags.count_api_requests:
+            await requests_counter.start()
+        await client_registry.initialize()
+        await auth_session_sweeper.start()
+        await link_clicks.start()
+        await sitemap.build(url.path for url in self.public_urls)
+
         yield
+
+        await link_clicks.stop()
+        await auth_session_sweeper.stop()
+        await client_registry.shutdown()
+        hasher.shutdown()
+        if feature_flags.count_api_requests:
+            await requests_counter.stop()
+        if feature_flags.cache_catalog:
+            await catalog_refresher.stop()
         await session_manager.close()
 
     @staticmethod
@@ -84,6 +112,10 @@ class FuturamaAPI(FastAPI):
         if feature_flags.count_api_requests:
             self.add_middleware(APIRequestsCounter)
 
+        # Added last to be the outermost middleware, so the total covers the whole request.
+        if feature_flags.server_timing:
+            self.add_middleware(ServerTimingMiddleware)
+
     def _setup_routers(self) -> None:
         from futuramaapi.routers import api_router, graphql_router, views_router  # noqa: PLC0415
 
@@ -101,6 +133,7 @@ class FuturamaAPI(FastAPI):
         from futuramaapi.routers.services import (  # noqa: PLC0415
             ConflictError,
             EmptyUpdateError,
+            InvalidCursorError,
             NotFoundError,
             RegistrationDisabledError,
             ServiceError,
@@ -133,6 +166,10 @@ class FuturamaAPI(FastAPI):
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 default_message="No data to update.",
             ),
+            InvalidCursorError: _ExceptionValue(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                default_message="Invalid cursor.",
+            ),
         }
 
         exc_value = exception_to_value[type(exc)]
@@ -143,10 +180,23 @@ class FuturamaAPI(FastAPI):
             },
         )
 
+    @staticmethod
+    def _hasher_busy_handler(_: Request, __: HasherBusyError) -> Response:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "detail": "Too many authentication requests, try again later.",
+            },
+            headers={
+                "Retry-After": "1",
+            },
+        )
+
     def _setup_exceptions(self) -> None:
         from futuramaapi.routers.services import ServiceError  # noqa: PLC0415
 
         self.add_exception_handler(ServiceError, self._exception_handler)
+        self.add_exception_handler(HasherBusyError, self._hasher_busy_handler)
 
     def setup(self) -> None:
         super().setup()
@@ -188,10 +238,12 @@ class FuturamaAPI(FastAPI):
     @property
     def public_urls(self) -> list[Route | WebSocketRoute | Mount | Host]:
         urls: list[Route | WebSocketRoute | Mount | Host] = []
+        paths: set[str] = set()
         route: Route | WebSocketRoute | Mount | Host
         for route in self.routes:
-            if self._is_route_public(route) and route.path not in [u.path for u in urls]:
+            if route.path not in paths and self._is_route_public(route):
                 urls.append(route)
+                paths.add(route.path)
 
         return urls
 
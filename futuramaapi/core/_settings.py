@@ -174,10 +174,12 @@ class _EnvSource(EnvSettingsSource):
         value: Any,
         value_is_complex: bool,
     ) -> Any:
-        if get_origin(field.annotation) is list:
-            return _parse_list(value)
         if field_name == "database_url":
             return PostgresDsn(_fix_postgres_url(value))
+        if field_name == "database_replica_urls":
+            return [PostgresDsn(_fix_postgres_url(url)) for url in _parse_list(value) if url]
+        if get_origin(field.annotation) is list:
+            return _parse_list(value)
         return super().prepare_field_value(field_name, field, value, value_is_complex)
 
 
@@ -197,10 +199,23 @@ class Settings(BaseSettings):
         return self.backend_url.host
 
     database_url: PostgresDsn
+    database_replica_urls: list[PostgresDsn] = Field(
+        default=[],
+        description="Comma separated read replicas of the database, read-only sessions are spread across them.",
+    )
+    database_replica_retry_after: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds a read replica that failed to connect is skipped.",
+    )
     project_root: Path = Path(__file__).parent.parent.parent.resolve()
     static: Path = Path("static")
 
     secret_key: SecretStr
+    debug_token: SecretStr | None = Field(
+        default=None,
+        description="X-Debug-Token header value revealing request profiles, never revealed if unset.",
+    )
     email: EmailSettings = email_settings
     redis: RedisSettings = redis_settings
     sentry: SentrySettings = sentry_settings
@@ -214,6 +229,137 @@ class Settings(BaseSettings):
     pool_timeout: int = 30
     pool_recycle: int = -1
 
+    catalog_refresh_interval: float = Field(
+        default=10 * 60,
+        gt=0,
+        description=(
+            "Seconds between reloads of the cached catalog, or of the id indexes of random rows without the catalog, "
+            "so changes to their tables are picked up."
+        ),
+    )
+
+    requests_counter_flush_interval: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between flushes of the buffered API requests counter.",
+    )
+    requests_counter_flush_threshold: int = Field(
+        default=1000,
+        gt=0,
+        description="Buffered API requests that trigger an early flush.",
+    )
+
+    http_client_max_connections: int = Field(
+        default=256,
+        gt=0,
+        description="Connections of the process-wide outbound HTTP client.",
+    )
+    http_client_max_connections_per_host: int = Field(
+        default=32,
+        gt=0,
+        description="Concurrent outbound requests to a single host, e.g. a popular callback receiver.",
+    )
+    http_client_keepalive_expiry: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds an idle outbound connection is kept open for reuse.",
+    )
+
+    auth_cache_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds verified tokens and authenticated users are cached per process, 0 disables the cache.",
+    )
+    auth_cache_max_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="Verified tokens and authenticated users cached per process.",
+    )
+
+    auth_session_sweep_interval: float = Field(
+        default=60 * 60,
+        gt=0,
+        description="Seconds between deletions of expired cookie auth sessions.",
+    )
+
+    notifications_queue_size: int = Field(
+        default=8,
+        gt=0,
+        description="Undelivered SSE events per client before the client is disconnected as too slow.",
+    )
+
+    link_cache_ttl: float = Field(
+        default=60 * 60,
+        ge=0,
+        description="Seconds a short link target is cached per process, 0 disables the cache.",
+    )
+    link_cache_max_size: int = Field(
+        default=10_000,
+        gt=0,
+        description="Short link targets cached per process.",
+    )
+    link_clicks_flush_interval: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between flushes of the buffered short link clicks.",
+    )
+    link_clicks_flush_threshold: int = Field(
+        default=1000,
+        gt=0,
+        description="Buffered short link clicks that trigger an early flush.",
+    )
+
+    index_page_cache_ttl: float = Field(
+        default=10.0,
+        ge=0,
+        description="Seconds the landing page rendered for anonymous visitors is cached, 0 disables the cache.",
+    )
+
+    callback_lease: float = Field(
+        default=5 * 60,
+        gt=0,
+        description="Seconds claimed callbacks wait for delivery before other workers can claim them again.",
+    )
+
+    callback_sweep_interval: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds between checks for due callbacks no delivery has been enqueued for.",
+    )
+
+    graphql_document_cache_ttl: float = Field(
+        default=24 * 60 * 60,
+        ge=0,
+        description="Seconds parsed GraphQL documents and persisted queries are cached per process, 0 disables it.",
+    )
+    graphql_document_cache_max_size: int = Field(
+        default=1000,
+        gt=0,
+        description="Parsed GraphQL documents and persisted queries cached per process.",
+    )
+
+    graphql_max_cost: int = Field(
+        default=2000,
+        gt=0,
+        description="Estimated cost of a GraphQL operation above which it's rejected before execution.",
+    )
+    graphql_max_depth: int = Field(
+        default=10,
+        gt=0,
+        description="Nesting depth of a GraphQL operation above which it's rejected before execution.",
+    )
+
+    password_hasher_max_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Threads hashing and verifying passwords.",
+    )
+    password_hasher_max_pending: int = Field(
+        default=64,
+        gt=0,
+        description="Password hashing jobs per process, running or queued, before new ones are rejected.",
+    )
+
     worker: WorkerSettings = WorkerSettings()
 
     @cached_property
@@ -264,8 +410,11 @@ class FeatureFlags(BaseSettings):
     activate_users: bool = False
     enable_sentry: bool = False
     count_api_requests: bool = True
+    cache_catalog: bool = True
     user_signup: bool = True
     user_deletion: bool = False
+    expose_metrics: bool = False
+    server_timing: bool = False
 
 
 feature_flags = FeatureFlags()
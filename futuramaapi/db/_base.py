@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple, Self
 from uuid import UUID, uuid4
 
 from sqlalchemy import UUID as COLUMN_UUID
-from sqlalchemy import Column, DateTime, Row, Select, select
+from sqlalchemy import Column, DateTime, Integer, Row, Select, any_, bindparam, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.inspection import Inspectable
@@ -40,6 +41,7 @@ class FilterStatementKwargs(NamedTuple):
     order_by: str | None = "id"
     order_by_direction: Literal["asc", "desc"] = "asc"
     extra: dict | None = None
+    after: tuple[Any, ...] | None = None
 
 
 class DeclarativeBaseNoMeta(_DeclarativeBaseNoMeta):
@@ -102,8 +104,13 @@ class Base(
         return getattr(cls, field_name)
 
     @classmethod
-    async def count(cls, session: AsyncSession, /) -> int:
-        cursor: Result = await session.execute(func.count(cls.id))
+    async def count(cls, session: AsyncSession, /, *, extra: dict | None = None) -> int:
+        statement: Select[tuple[int]] = select(func.count(cls.id))
+        cond_list: list = cls.get_cond_list(**extra) if extra is not None else []
+        if cond_list:
+            statement = statement.where(*cond_list)
+
+        cursor: Result = await session.execute(statement)
         return cursor.scalar()
 
     @staticmethod
@@ -147,6 +154,19 @@ class Base(
         except NoResultFound as err:
             raise ModelDoesNotExistError() from err
 
+    @classmethod
+    async def get_many(cls, session: AsyncSession, ids: Sequence[int], /) -> Sequence[Self]:
+        """Fetch rows by primary keys in one ``WHERE id = ANY(:ids)`` query, missing ids are skipped."""
+        statement: Select[tuple[Self]] = select(cls).where(
+            cls.id == any_(bindparam("ids", list(ids), type_=ARRAY(Integer))),
+        )
+        options: list[Load] = cls.get_options()
+        if options:
+            statement = statement.options(*options)
+
+        cursor: Result = await session.execute(statement)
+        return cursor.scalars().all()
+
     @classmethod
     def get_order_by(
         cls,
@@ -164,6 +184,41 @@ class Base(
             return field.desc()
         return field.asc()
 
+    @classmethod
+    def get_keyset_fields(cls, *, field_name: str | None = None) -> tuple[InstrumentedAttribute, ...]:
+        if field_name is None or field_name.lower() == "id":
+            return (cls.id,)
+
+        return cls.__table__.c[field_name.lower()], cls.id
+
+    @classmethod
+    def get_keyset(cls, instance: Self, /, *, field_name: str | None = None) -> tuple[Any, ...]:
+        return tuple(getattr(instance, field.key) for field in cls.get_keyset_fields(field_name=field_name))
+
+    @classmethod
+    def validate_keyset(cls, keyset: tuple[Any, ...], /, *, field_name: str | None = None) -> None:
+        fields: tuple[InstrumentedAttribute, ...] = cls.get_keyset_fields(field_name=field_name)
+        if len(keyset) != len(fields) or not all(
+            type(value) is field.type.python_type for field, value in zip(fields, keyset, strict=False)
+        ):
+            raise ValueError("Invalid keyset.")
+
+    @classmethod
+    def get_keyset_cond(
+        cls,
+        after: tuple[Any, ...],
+        /,
+        *,
+        field_name: str | None = None,
+        direction: Literal["asc", "desc"] = "asc",
+    ) -> ColumnElement[bool]:
+        cls.validate_keyset(after, field_name=field_name)
+
+        fields: tuple[InstrumentedAttribute, ...] = cls.get_keyset_fields(field_name=field_name)
+        if direction == "desc":
+            return tuple_(*fields) < tuple_(*after)
+        return tuple_(*fields) > tuple_(*after)
+
     @classmethod
     def get_filter_statement(
         cls,
@@ -173,15 +228,26 @@ class Base(
         # TODO: I mean fix ignoring
         statement: Select[tuple[Base]] = cls.select_(cls)  # type: ignore[call-arg]
         statement = statement.order_by(
-            cls.get_order_by(
-                field_name=kwargs.order_by,
-                direction=kwargs.order_by_direction,
+            *(
+                cls.get_order_by(
+                    field_name=field.key,
+                    direction=kwargs.order_by_direction,
+                )
+                for field in cls.get_keyset_fields(field_name=kwargs.order_by)
             )
         )
 
         cond_list: list = []
         if kwargs.extra is not None:
             cond_list = cls.get_cond_list(**kwargs.extra)
+        if kwargs.after is not None:
+            cond_list.append(
+                cls.get_keyset_cond(
+                    kwargs.after,
+                    field_name=kwargs.order_by,
+                    direction=kwargs.order_by_direction,
+                )
+            )
         if cond_list:
             statement = statement.where(*cond_list)
         options: list[Load] = cls.get_options()
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import time
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from futuramaapi.core import settings
+from futuramaapi.helpers.caches import Revocations, TTLCache
+
+from .models import AuthSessionModel, UserModel
+from .session import session_manager
+
+logger = logging.getLogger(__name__)
+
+# Shared by the caches of auth sessions and authenticated users, keyed by ``session:<key>`` and ``user:<id>``.
+auth_revocations: Revocations = Revocations(prefix="auth:revoked", ttl=settings.auth_cache_ttl)
+
+
+@dataclass(frozen=True, slots=True)
+class SessionUser:
+    """The part of a user server-rendered pages need."""
+
+    id: int
+    name: str
+    surname: str
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.name} {self.surname}"
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedAuthSession:
+    cached_at: float
+    expires_at: datetime
+    user: SessionUser
+
+
+class AuthSessionCache:
+    """
+    Cookie auth sessions by key, with the user they belong to.
+
+    Valid sessions are looked up with a single query and cached until ``ttl`` passes or the session expires,
+    whichever comes first. Expiring a session through ``expire`` and changing a user are published to
+    ``revocations``, every process checks them on a cache hit, so a logged out cookie is rejected by all workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = settings.auth_cache_ttl,
+        max_size: int = settings.auth_cache_max_size,
+        revocations: Revocations = auth_revocations,
+    ) -> None:
+        self._sessions: TTLCache[str, _CachedAuthSession] = TTLCache(ttl=ttl, max_size=max_size)
+        self._revocations: Revocations = revocations
+
+    @staticmethod
+    def _get_statement(key: str, /) -> Select:
+        return (
+            select(
+                AuthSessionModel.expired,
+                AuthSessionModel.created_at,
+                UserModel.id,
+                UserModel.name,
+                UserModel.surname,
+            )
+            .join(AuthSessionModel.user)
+            .where(AuthSessionModel.key == key)
+        )
+
+    async def _get_cached(self, key: str, now: datetime, /) -> _CachedAuthSession | None:
+        cached: _CachedAuthSession | None = self._sessions.get(key)
+        if cached is None or cached.expires_at <= now:
+            return None
+
+        if await self._revocations.is_revoked(cached.cached_at, f"session:{key}", f"user:{cached.user.id}"):
+            self._sessions.delete(key)
+            return None
+
+        return cached
+
+    async def get_user(self, session: AsyncSession, key: str, /) -> SessionUser | None:
+        now: datetime = datetime.now(tz=UTC)
+        cached: _CachedAuthSession | None = await self._get_cached(key, now)
+        if cached is not None:
+            return cached.user
+
+        # Taken before the query, so a revocation committed while the row is read is never missed.
+        cached_at: float = time()
+        row = (await session.execute(self._get_statement(key))).one_or_none()
+        if row is None or row.expired:
+            return None
+
+        expires_at: datetime = AuthSessionModel.get_expires_at(row.created_at)
+        if expires_at <= now:
+            return None
+
+        user: SessionUser = SessionUser(id=row.id, name=row.name, surname=row.surname)
+        self._sessions.set(
+            key,
+            _CachedAuthSession(cached_at=cached_at, expires_at=expires_at, user=user),
+            ttl=(expires_at - now).total_seconds(),
+        )
+        return user
+
+    async def expire(self, session: AsyncSession, key: str, /) -> None:
+        await AuthSessionModel.do_expire(session, key)
+        self._sessions.delete(key)
+        await self._revocations.revoke(f"session:{key}")
+
+    async def invalidate_user(self, user_id: int, /) -> None:
+        """Drop the sessions of a user in every process, must be called once the change is committed."""
+        for key, cached in list(self._sessions.items()):
+            if cached.user.id == user_id:
+                self._sessions.delete(key)
+
+        await self._revocations.revoke(f"user:{user_id}")
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+
+auth_session_cache: AuthSessionCache = AuthSessionCache()
+
+
+class AuthSessionSweeper:
+    """Periodically deletes expired and logged out sessions, so ``auth_sessions`` does not grow unbounded."""
+
+    def __init__(self, *, interval: float = settings.auth_session_sweep_interval) -> None:
+        self.interval: float = interval
+
+        self._task: asyncio.Task | None = None
+
+    async def sweep(self) -> int:
+        async with session_manager.session() as session:
+            return await AuthSessionModel.delete_expired(session)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                deleted: int = await self.sweep()
+            except Exception:
+                logger.exception("Failed to sweep expired auth sessions")
+            else:
+                logger.info("Expired auth sessions swept, deleted=%s", deleted)
+
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            raise RuntimeError("Auth session sweeper has been started.")
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            raise RuntimeError("Auth session sweeper has not been started.")
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+auth_session_sweeper: AuthSessionSweeper = AuthSessionSweeper()
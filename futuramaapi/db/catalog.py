@@ -0,0 +1,238 @@
+import asyncio
+import logging
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import NamedTuple
+
+from fastapi_storages import StorageImage
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from futuramaapi.core import settings
+
+from .models import CharacterModel, EpisodeModel, SeasonModel
+from .sampling import character_ids, episode_ids, season_ids
+from .search import character_names
+from .session import session_manager
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogRef(NamedTuple):
+    id: int
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogCharacter:
+    id: int
+    name: str
+    gender: CharacterModel.CharacterGender
+    status: CharacterModel.CharacterStatus
+    species: CharacterModel.CharacterSpecies
+    created_at: datetime
+    image: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogEpisode:
+    id: int
+    name: str | None
+    air_date: date | None
+    duration: int | None
+    production_code: str | None
+    broadcast_number: int | None
+    created_at: datetime
+    season: CatalogRef
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogSeason:
+    id: int
+    created_at: datetime
+    episodes: tuple[CatalogEpisode, ...]
+
+
+class _Snapshot(NamedTuple):
+    characters: dict[int, CatalogCharacter]
+    episodes: dict[int, CatalogEpisode]
+    seasons: dict[int, CatalogSeason]
+
+
+def _get_image_url(image: StorageImage | str | None, /) -> str | None:
+    if isinstance(image, StorageImage):
+        return str(settings.build_url(path=image._name))
+
+    return image
+
+
+class Catalog:
+    """
+    Read-through, in-memory copy of the immutable catalog: characters, episodes and seasons.
+
+    The catalog is empty until ``load`` is called, services must fall back to the database while
+    ``is_loaded`` is ``False``. Rows are kept ordered by primary key. Loading the catalog also refreshes
+    the random sampling id indexes.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: _Snapshot | None = None
+        self.loaded_at: datetime | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def _loaded_snapshot(self) -> _Snapshot:
+        if self._snapshot is None:
+            raise RuntimeError("Catalog is not loaded.")
+
+        return self._snapshot
+
+    @property
+    def characters(self) -> Mapping[int, CatalogCharacter]:
+        return self._loaded_snapshot.characters
+
+    @property
+    def episodes(self) -> Mapping[int, CatalogEpisode]:
+        return self._loaded_snapshot.episodes
+
+    @property
+    def seasons(self) -> Mapping[int, CatalogSeason]:
+        return self._loaded_snapshot.seasons
+
+    @staticmethod
+    async def _get_characters(session: AsyncSession, /) -> dict[int, CatalogCharacter]:
+        result = await session.execute(select(CharacterModel).order_by(CharacterModel.id.asc()))
+        return {
+            character.id: CatalogCharacter(
+                id=character.id,
+                name=character.name,
+                gender=character.gender,
+                status=character.status,
+                species=character.species,
+                created_at=character.created_at,
+                image=_get_image_url(character.image),
+            )
+            for character in result.scalars()
+        }
+
+    @staticmethod
+    async def _get_episodes(session: AsyncSession, /) -> dict[int, CatalogEpisode]:
+        result = await session.execute(select(EpisodeModel).order_by(EpisodeModel.id.asc()))
+        return {
+            episode.id: CatalogEpisode(
+                id=episode.id,
+                name=episode.name,
+                air_date=episode.air_date,
+                duration=episode.duration,
+                production_code=episode.production_code,
+                broadcast_number=episode.broadcast_number,
+                created_at=episode.created_at,
+                season=CatalogRef(episode.season_id),
+            )
+            for episode in result.scalars()
+        }
+
+    @staticmethod
+    async def _get_seasons(
+        session: AsyncSession,
+        episodes: dict[int, CatalogEpisode],
+        /,
+    ) -> dict[int, CatalogSeason]:
+        season_episodes: dict[int, list[CatalogEpisode]] = {}
+        for episode in episodes.values():
+            season_episodes.setdefault(episode.season.id, []).append(episode)
+
+        result = await session.execute(select(SeasonModel).order_by(SeasonModel.id.asc()))
+        return {
+            season.id: CatalogSeason(
+                id=season.id,
+                created_at=season.created_at,
+                episodes=tuple(season_episodes.get(season.id, ())),
+            )
+            for season in result.scalars()
+        }
+
+    async def load(self) -> None:
+        """Load the catalog from the database, replacing the current snapshot atomically."""
+        session: AsyncSession
+        async with session_manager.session(readonly=True) as session:
+            characters: dict[int, CatalogCharacter] = await self._get_characters(session)
+            episodes: dict[int, CatalogEpisode] = await self._get_episodes(session)
+            seasons: dict[int, CatalogSeason] = await self._get_seasons(session, episodes)
+
+        self._snapshot = _Snapshot(
+            characters=characters,
+            episodes=episodes,
+            seasons=seasons,
+        )
+        self.loaded_at = datetime.now(UTC)
+        character_ids.set(characters)
+        character_names.set({id_: character.name for id_, character in characters.items()})
+        episode_ids.set(episodes)
+        season_ids.set(seasons)
+        logger.info(
+            "Catalog loaded: characters=%s, episodes=%s, seasons=%s",
+            len(characters),
+            len(episodes),
+            len(seasons),
+        )
+
+    async def refresh(self) -> None:
+        """Invalidation hook, call after the catalog tables have been changed, ``CatalogRefresher`` calls it."""
+        await self.load()
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self.loaded_at = None
+        character_ids.clear()
+        character_names.clear()
+        episode_ids.clear()
+        season_ids.clear()
+
+
+catalog: Catalog = Catalog()
+
+
+class CatalogRefresher:
+    """
+    Periodically refreshes the catalog, so changes to its tables are picked up by every process.
+
+    Everything derived from the catalog follows, e.g. the sitemap is rebuilt once ``Catalog.loaded_at`` changes.
+    """
+
+    def __init__(self, *, interval: float = settings.catalog_refresh_interval) -> None:
+        self.interval: float = interval
+
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            # Loaded at startup already.
+            await asyncio.sleep(self.interval)
+
+            try:
+                await catalog.refresh()
+            except Exception:
+                logger.exception("Failed to refresh the catalog")
+
+    async def start(self) -> None:
+        if self._task is not None:
+            raise RuntimeError("Catalog refresher has been started.")
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            raise RuntimeError("Catalog refresher has not been started.")
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+catalog_refresher: CatalogRefresher = CatalogRefresher()
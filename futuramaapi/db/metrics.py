@@ -0,0 +1,102 @@
+from contextvars import ContextVar
+from functools import partial
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from futuramaapi.helpers.metrics import Counter, Gauge, Histogram, metrics
+from futuramaapi.helpers.profiling import RequestProfile, current_profile
+
+DEFAULT_QUERY_SOURCE: str = "other"
+
+# What the queries of the current task are attributed to, set by services for the duration of a call.
+query_source: ContextVar[str] = ContextVar("query_source", default=DEFAULT_QUERY_SOURCE)
+
+_QUERY_STARTED_AT: str = "query_started_at"
+
+queries: Counter = metrics.counter(
+    "db_queries_total",
+    "Queries executed.",
+    labels=["source"],
+)
+query_rows: Counter = metrics.counter(
+    "db_query_rows_total",
+    "Rows returned or affected by queries.",
+    labels=["source"],
+)
+query_duration: Histogram = metrics.histogram(
+    "db_query_duration_seconds",
+    "Query execution time.",
+    labels=["source"],
+)
+pool_wait: Histogram = metrics.histogram(
+    "db_pool_wait_seconds",
+    "Time spent checking out a connection, including waiting for the pool and connecting.",
+    labels=["database"],
+)
+pool_checked_out: Gauge = metrics.gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out.",
+    labels=["database"],
+)
+pool_overflow: Gauge = metrics.gauge(
+    "db_pool_overflow_connections",
+    "Connections opened beyond the pool size, negative while the pool is not full.",
+    labels=["database"],
+)
+pool_size: Gauge = metrics.gauge(
+    "db_pool_size",
+    "Configured size of the pool.",
+    labels=["database"],
+)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Pool recording checkout times, labelled by the pool's ``logging_name``."""
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at: float = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            elapsed: float = perf_counter() - started_at
+            pool_wait.observe(elapsed, self.logging_name or "")
+            profile: RequestProfile | None = current_profile.get()
+            if profile is not None:
+                profile.add("db-pool", elapsed)
+
+
+def _before_cursor_execute(conn: Connection, *_: Any) -> None:
+    # A connection runs one statement at a time, the start of a failed statement is simply overwritten by the next.
+    conn.info[_QUERY_STARTED_AT] = perf_counter()
+
+
+def _after_cursor_execute(conn: Connection, cursor: Any, statement: str, *_: Any) -> None:
+    elapsed: float = perf_counter() - conn.info.pop(_QUERY_STARTED_AT)
+    source: str = query_source.get()
+    queries.inc(source)
+    query_rows.inc(source, amount=max(cursor.rowcount, 0))
+    query_duration.observe(elapsed, source)
+
+    profile: RequestProfile | None = current_profile.get()
+    if profile is not None:
+        profile.add_statement(statement, elapsed)
+
+
+def _read_pool(engine: AsyncEngine, method: str, /) -> int:
+    # The pool is replaced when the engine is disposed, always read the current one.
+    return getattr(engine.pool, method)()
+
+
+def instrument_engine(engine: AsyncEngine, name: str, /) -> None:
+    """Record the queries and pool usage of ``engine``, its pool must be an ``InstrumentedPool``."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+    pool_checked_out.set_function(partial(_read_pool, engine, "checkedout"), name)
+    pool_overflow.set_function(partial(_read_pool, engine, "overflow"), name)
+    pool_size.set_function(partial(_read_pool, engine, "size"), name)
@@ -0,0 +1,40 @@
+"""Add name trigram indexes
+
+Revision ID: 5b2e8f1c9d3a
+Revises: 8e79c0472843
+Create Date: 2026-10-17 11:02:41.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "5b2e8f1c9d3a"
+down_revision: str | None = "8e79c0472843"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_characters_name_trgm",
+        "characters",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_username_trgm",
+        "users",
+        ["username"],
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_username_trgm", table_name="users")
+    op.drop_index("ix_characters_name_trgm", table_name="characters")
+    # The extension is kept, dropping it would fail if anything else depends on it.
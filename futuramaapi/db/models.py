@@ -1,4 +1,5 @@
 import uuid
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from functools import partial
@@ -12,12 +13,18 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     Date,
+    Delete,
     ForeignKey,
+    Index,
     Integer,
     SmallInteger,
     UniqueConstraint,
     Update,
+    column,
+    delete,
+    or_,
     update,
+    values,
 )
 from sqlalchemy.dialects.postgresql import ENUM, Insert, insert  # TODO: engine agnostic.
 from sqlalchemy.ext.asyncio.session import AsyncSession
@@ -169,6 +176,16 @@ class CharacterModel(Base):
         back_populates="character",
     )
 
+    __table_args__ = (
+        # Makes ``ILIKE '%query%'`` and similarity searches on names indexable.
+        Index(
+            "ix_characters_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     @property
     def relative_image_url(self) -> str | None:
         if self.image is None:
@@ -259,6 +276,15 @@ class UserModel(Base):
         back_populates="user",
     )
 
+    __table_args__ = (
+        Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+    )
+
     @property
     def full_name(self) -> str:
         return f"{self.name} {self.surname}"
@@ -341,6 +367,20 @@ class LinkModel(Base):
     def get_select_in_load() -> list[Load]:
         return [selectinload(LinkModel.user)]
 
+    @classmethod
+    async def count_clicks(cls, counts: Mapping[int, int], /) -> None:
+        """Add clicks per link id with one ``UPDATE ... FROM (VALUES ...)`` statement."""
+        if not counts:
+            return
+
+        clicks = values(column("id", BigInteger), column("delta", BigInteger), name="clicks").data(list(counts.items()))
+        statement: Update = update(cls).where(cls.id == clicks.c.id).values(counter=cls.counter + clicks.c.delta)
+
+        session: AsyncSession
+        async with session_manager.session() as session:
+            await session.execute(statement)
+            await session.commit()
+
 
 class SecretMessageModel(Base):
     __tablename__ = "secret_messages"
@@ -412,13 +452,16 @@ class AuthSessionModel(Base):
         back_populates="active_sessions",
     )
 
+    @classmethod
+    def get_expires_at(cls, created_at: datetime, /) -> datetime:
+        return created_at.replace(tzinfo=UTC) + timedelta(seconds=cls.cookie_expiration_time)
+
     @property
     def valid(self) -> bool:
         if self.expired:
             return False
 
-        final_date = self.created_at.replace(tzinfo=UTC) + timedelta(seconds=self.cookie_expiration_time)
-        return final_date > datetime.now(tz=UTC)
+        return self.get_expires_at(self.created_at) > datetime.now(tz=UTC)
 
     @staticmethod
     def get_select_in_load() -> list[Load]:
@@ -431,6 +474,20 @@ class AuthSessionModel(Base):
         await session.execute(statement)
         await session.commit()
 
+    @classmethod
+    async def delete_expired(cls, session: AsyncSession, /) -> int:
+        created_before: datetime = datetime.now(tz=UTC) - timedelta(seconds=cls.cookie_expiration_time)
+        statement: Delete = delete(AuthSessionModel).where(
+            or_(
+                AuthSessionModel.expired.is_(True),
+                AuthSessionModel.created_at < created_before,
+            )
+        )
+
+        result = await session.execute(statement)
+        await session.commit()
+        return result.rowcount
+
 
 class RequestsCounterModel(Base):
     __tablename__ = "requests_counter"
@@ -449,14 +506,14 @@ class RequestsCounterModel(Base):
     )
 
     @classmethod
-    async def count_url(cls, url: str, /) -> None:
-        statement: Insert = (
-            insert(cls)
-            .values({"url": url})
-            .on_conflict_do_update(
-                constraint="requests_counter_url_key",
-                set_={"counter": cls.counter + 1},
-            )
+    async def count_urls(cls, counts: Mapping[str, int], /) -> None:
+        if not counts:
+            return
+
+        statement: Insert = insert(cls).values([{"url": url, "counter": counter} for url, counter in counts.items()])
+        statement = statement.on_conflict_do_update(
+            constraint="requests_counter_url_key",
+            set_={"counter": cls.counter + statement.excluded.counter},
         )
 
         session: AsyncSession
@@ -0,0 +1,68 @@
+import random
+from collections.abc import Iterable, Iterator
+from time import monotonic
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from futuramaapi.core import settings
+
+from ._base import Base
+from .models import CharacterModel, EpisodeModel, SeasonModel
+
+
+class IdIndex:
+    """
+    Dense in-memory index of a model's primary keys, used for uniform random sampling.
+
+    Picking ids takes constant time, rows are then taken from the catalog or looked up by primary key,
+    instead of sorting the whole table with ``ORDER BY random()``. The catalog refreshes the index when it is
+    (re)loaded, otherwise it is loaded lazily with ``load`` and reloaded once ``is_expired``, so new rows get
+    sampled too.
+    """
+
+    def __init__(self, model: type[Base], /, *, ttl: float = settings.catalog_refresh_interval) -> None:
+        self.model: type[Base] = model
+        self.ttl: float = ttl
+
+        self._ids: tuple[int, ...] | None = None
+        self._loaded_at: float | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._ids is not None
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the index is not loaded or was loaded more than ``ttl`` seconds ago."""
+        return self._loaded_at is None or monotonic() - self._loaded_at >= self.ttl
+
+    def __len__(self) -> int:
+        return len(self._ids or ())
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids or ())
+
+    def set(self, ids: Iterable[int], /) -> None:
+        self._ids = tuple(ids)
+        self._loaded_at = monotonic()
+
+    async def load(self, session: AsyncSession, /) -> None:
+        result = await session.execute(select(self.model.id))
+        self.set(result.scalars())
+
+    def clear(self) -> None:
+        self._ids = None
+        self._loaded_at = None
+
+    def sample(self, k: int = 1, /) -> list[int]:
+        """Return up to ``k`` distinct random ids."""
+        if self._ids is None:
+            raise RuntimeError(f"{self.model.__name__} id index is not loaded.")
+
+        return random.sample(self._ids, min(k, len(self._ids)))
+
+
+character_ids: IdIndex = IdIndex(CharacterModel)
+episode_ids: IdIndex = IdIndex(EpisodeModel)
+season_ids: IdIndex = IdIndex(SeasonModel)
@@ -0,0 +1,121 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping
+from itertools import groupby, takewhile
+from operator import itemgetter
+from typing import NamedTuple
+
+_WORD: re.Pattern[str] = re.compile(r"[^\W_]+")
+
+
+def get_words(text: str, /) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+def get_trigrams(text: str, /) -> frozenset[str]:
+    """
+    Trigrams of ``text`` the way ``pg_trgm`` extracts them.
+
+    Words are lowercased and padded with two spaces in front and one behind, so ``"Fry"`` gives
+    ``"  f", " fr", "fry", "ry "``.
+    """
+    trigrams: set[str] = set()
+    for word in get_words(text):
+        padded: str = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(trigrams)
+
+
+class SearchMatch(NamedTuple):
+    id: int
+    similarity: float
+    is_prefix: bool
+
+
+class NGramIndex:
+    """
+    In-memory trigram index of short texts by id, ranking matches like ``pg_trgm`` ``similarity``.
+
+    Meant for small, rarely changing sets such as the character catalog: searching only visits the texts sharing
+    a trigram with the query, and word prefixes are looked up in a sorted list for autocomplete.
+    """
+
+    def __init__(self, *, threshold: float = 0.3) -> None:
+        self.threshold: float = threshold
+
+        self._trigrams: dict[int, frozenset[str]] = {}
+        self._lengths: dict[int, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._words: list[tuple[str, int]] = []
+        self._word_ids: dict[str, frozenset[int]] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self._trigrams)
+
+    def __len__(self) -> int:
+        return len(self._trigrams)
+
+    def set(self, texts: Mapping[int, str], /) -> None:
+        trigrams: dict[int, frozenset[str]] = {id_: get_trigrams(text) for id_, text in texts.items()}
+        postings: dict[str, list[int]] = {}
+        for id_, text_trigrams in trigrams.items():
+            for trigram in text_trigrams:
+                postings.setdefault(trigram, []).append(id_)
+
+        self._trigrams = trigrams
+        self._lengths = {id_: len(text) for id_, text in texts.items()}
+        self._postings = postings
+        self._words = sorted({(word, id_) for id_, text in texts.items() for word in get_words(text)})
+        self._word_ids = {
+            word: frozenset(id_ for _, id_ in group) for word, group in groupby(self._words, key=itemgetter(0))
+        }
+
+    def clear(self) -> None:
+        self.set({})
+
+    def _get_prefixed(self, query: str, /) -> frozenset[int]:
+        words: list[str] = get_words(query)
+        if not words:
+            return frozenset()
+
+        # Every word of the query but the last one, which is still being typed, must be complete.
+        prefix: str = words[-1]
+        ids: frozenset[int] = frozenset(
+            id_
+            for _, id_ in takewhile(
+                lambda item: item[0].startswith(prefix),
+                self._words[bisect_left(self._words, (prefix, -1)) :],
+            )
+        )
+        for word in words[:-1]:
+            ids &= self._word_ids.get(word, frozenset())
+        return ids
+
+    def _get_similar(self, query_trigrams: frozenset[str], /) -> dict[int, float]:
+        shared: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._postings.get(trigram, ()))
+
+        return {id_: count / (len(query_trigrams) + len(self._trigrams[id_]) - count) for id_, count in shared.items()}
+
+    def search(self, query: str, /, *, limit: int = 10) -> list[SearchMatch]:
+        """
+        Texts matching ``query``, best first.
+
+        Texts with a word starting with the last word of the query come first, then the rest ranked by
+        trigram similarity, texts less similar than ``threshold`` are left out.
+        """
+        similar: dict[int, float] = self._get_similar(get_trigrams(query))
+        prefixed: frozenset[int] = self._get_prefixed(query)
+
+        matches: list[SearchMatch] = [
+            SearchMatch(id=id_, similarity=similar.get(id_, 0.0), is_prefix=id_ in prefixed)
+            for id_ in prefixed.union(id_ for id_, similarity in similar.items() if similarity >= self.threshold)
+        ]
+        matches.sort(key=lambda match: (not match.is_prefix, -match.similarity, self._lengths[match.id], match.id))
+        return matches[:limit]
+
+
+character_names: NGramIndex = NGramIndex()
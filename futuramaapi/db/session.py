@@ -1,21 +1,110 @@
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any
 
 from pydantic import PostgresDsn
+from sqlalchemy import Connection, Dialect, Engine, event
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from futuramaapi.core import settings
 
+from .metrics import InstrumentedPool, instrument_engine
+
 logger = logging.getLogger(__name__)
 
 
+class _Replica:
+    """Read replica engine, skipped for ``retry_after`` seconds once connecting to it fails."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        session_maker: async_sessionmaker[AsyncSession],
+        /,
+        *,
+        retry_after: float,
+    ) -> None:
+        self.engine: AsyncEngine = engine
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self._retry_after: float = retry_after
+        self._failed_at: float | None = None
+
+        event.listen(engine.sync_engine, "do_connect", self._connect)
+
+    def _connect(self, dialect: Dialect, connection_record: ConnectionPoolEntry, cargs: tuple, cparams: dict) -> Any:
+        # Tracks failures of connections opened after a session was bound, e.g. once the pool recycled them.
+        try:
+            connection = dialect.connect(*cargs, **cparams)
+        except Exception:
+            self.mark_failed()
+            raise
+
+        self.mark_available()
+        return connection
+
+    @property
+    def is_available(self) -> bool:
+        return self._failed_at is None or monotonic() - self._failed_at >= self._retry_after
+
+    @property
+    def busy(self) -> int:
+        return self.engine.pool.checkedout()  # type: ignore[attr-defined]
+
+    def mark_failed(self) -> None:
+        self._failed_at = monotonic()
+
+    def mark_available(self) -> None:
+        self._failed_at = None
+
+
+class _ReadonlySession(Session):
+    """
+    Sync session of the read-only sessions created by ``SessionManager.create_session``.
+
+    The replica is picked when the first statement needs a connection, through the same fallback as
+    ``SessionManager.session``, the session then stays bound to it until it's closed.
+    """
+
+    def __init__(self, *args: Any, manager: "SessionManager", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._manager: SessionManager = manager
+        self._readonly_bind: Engine | None = None
+
+    def get_bind(self, mapper: Any = None, *, bind: Any = None, **kwargs: Any) -> Engine | Connection:
+        if bind is not None:
+            return super().get_bind(mapper, bind=bind, **kwargs)
+
+        if self._readonly_bind is None:
+            self._readonly_bind = self._manager._get_readonly_bind()
+
+        return self._readonly_bind
+
+    def close(self) -> None:
+        super().close()
+        self._readonly_bind = None
+
+
 class SessionManager:
+    """
+    Sessions of the primary database and, optionally, its read replicas.
+
+    Read-only sessions go to the least busy available replica, ties are broken round-robin. A replica that
+    can't be connected to is skipped for ``replica_retry_after`` seconds, its sessions fall back to the primary.
+    """
+
     def __init__(  # noqa: PLR0913
         self,
         host: PostgresDsn,
         /,
         *,
+        replicas: Sequence[PostgresDsn] = (),
+        replica_retry_after: float = settings.database_replica_retry_after,
         echo: bool = False,
         max_overflow: int = settings.pool_max_overflow,
         pool_size: int = settings.pool_size,
@@ -24,36 +113,143 @@ class SessionManager:
         autocommit: bool = False,
         expire_on_commit: bool = False,
     ) -> None:
-        self.engine: AsyncEngine = create_async_engine(
+        self._echo: bool = echo
+        self._max_overflow: int = max_overflow
+        self._pool_size: int = pool_size
+        self._pool_timeout: int = pool_timeout
+        self._pool_recycle: int = pool_recycle
+        self._autocommit: bool = autocommit
+        self._expire_on_commit: bool = expire_on_commit
+
+        self.engine: AsyncEngine = self._create_engine(host, "primary")
+        self._session_maker: async_sessionmaker[AsyncSession] = self._create_session_maker(self.engine)
+
+        self._replicas: list[_Replica] = []
+        for number, replica in enumerate(replicas, start=1):
+            engine: AsyncEngine = self._create_engine(replica, f"replica-{number}")
+            self._replicas.append(
+                _Replica(engine, self._create_session_maker(engine), retry_after=replica_retry_after),
+            )
+        self._replica_turn: int = 0
+        self._readonly_session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            autocommit=self._autocommit,
+            expire_on_commit=self._expire_on_commit,
+            sync_session_class=_ReadonlySession,
+            manager=self,
+        )
+
+        # Negative overflow means the pool grows without a limit.
+        self._max_connections: int | None = pool_size + max_overflow if max_overflow >= 0 else None
+        self._is_closed: bool = False
+
+    def _create_engine(self, host: PostgresDsn, name: str, /) -> AsyncEngine:
+        engine: AsyncEngine = create_async_engine(
             str(host),
-            echo=echo,
-            max_overflow=max_overflow,
-            pool_size=pool_size,
-            pool_timeout=pool_timeout,
-            pool_recycle=pool_recycle,
+            echo=self._echo,
+            max_overflow=self._max_overflow,
+            pool_size=self._pool_size,
+            pool_timeout=self._pool_timeout,
+            pool_recycle=self._pool_recycle,
+            poolclass=InstrumentedPool,
+            pool_logging_name=name,
         )
+        instrument_engine(engine, name)
+        return engine
 
-        self._session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
-            autocommit=autocommit,
-            bind=self.engine,
-            expire_on_commit=expire_on_commit,
+    def _create_session_maker(self, engine: AsyncEngine, /) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            autocommit=self._autocommit,
+            bind=engine,
+            expire_on_commit=self._expire_on_commit,
         )
-        self._is_closed: bool = False
+
+    def has_spare_connections(self, count: int = 1, /) -> bool:
+        """Whether ``count`` more connections can be checked out without waiting for the primary pool."""
+        if self._max_connections is None:
+            return True
+
+        return self.engine.pool.checkedout() + count <= self._max_connections  # type: ignore[attr-defined]
+
+    def _get_replicas(self) -> list[_Replica]:
+        """Available replicas, least busy first, replicas equally busy rotate between calls."""
+        available: list[_Replica] = [replica for replica in self._replicas if replica.is_available]
+        if not available:
+            return []
+
+        turn: int = self._replica_turn % len(available)
+        self._replica_turn += 1
+        available = available[turn:] + available[:turn]
+        return sorted(available, key=lambda replica: replica.busy)
+
+    async def _get_readonly_session(self) -> AsyncSession:
+        for replica in self._get_replicas():
+            session: AsyncSession = replica.session_maker()
+            try:
+                # Connect eagerly, a failing replica must be detected before any query runs on it.
+                await session.connection()
+            except (DBAPIError, OSError):
+                logger.warning("Read replica is unavailable, falling back", exc_info=True)
+                replica.mark_failed()
+                await session.close()
+                continue
+
+            replica.mark_available()
+            return session
+
+        return self._session_maker()
+
+    def _get_readonly_bind(self) -> Engine:
+        """Sync counterpart of ``_get_readonly_session``, runs in the greenlet of the first statement."""
+        for replica in self._get_replicas():
+            try:
+                # The connection goes back to the pool and is reused by the statement.
+                replica.engine.sync_engine.connect().close()
+            except (DBAPIError, OSError):
+                logger.warning("Read replica is unavailable, falling back", exc_info=True)
+                replica.mark_failed()
+                continue
+
+            replica.mark_available()
+            return replica.engine.sync_engine
+
+        return self.engine.sync_engine
+
+    def create_session(self, *, readonly: bool = False) -> AsyncSession:
+        """
+        Create a session, its connection is only checked out by the first query.
+
+        A read-only session picks its replica at that point, falling back to the next replica or the primary like
+        ``session`` does. The caller must close the session.
+        """
+        if self._is_closed:
+            raise RuntimeError("SessionManager has been closed.")
+
+        if readonly and self._replicas:
+            return self._readonly_session_maker()
+
+        return self._session_maker()
 
     async def close(self) -> None:
         if self._is_closed:
             raise RuntimeError("SessionManager has been closed.")
 
         await self.engine.dispose()
+        for replica in self._replicas:
+            await replica.engine.dispose()
 
         self._is_closed = True
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(self, *, readonly: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session, sessions opened with ``readonly`` may be served by a read replica.
+
+        Replicas lag behind the primary, only open read-only sessions for reads that tolerate stale data.
+        """
         if self._is_closed:
             raise RuntimeError("SessionManager has been closed.")
 
-        session = self._session_maker()
+        session: AsyncSession = await self._get_readonly_session() if readonly else self._session_maker()
         try:
             yield session
         except Exception:
@@ -63,9 +259,17 @@ class SessionManager:
             await session.close()
 
 
-session_manager: SessionManager = SessionManager(settings.database_url)
+session_manager: SessionManager = SessionManager(
+    settings.database_url,
+    replicas=settings.database_replica_urls,
+)
 
 
 async def get_async_session():
     async with session_manager.session() as session:
         yield session
+
+
+async def get_async_readonly_session():
+    async with session_manager.session(readonly=True) as session:
+        yield session
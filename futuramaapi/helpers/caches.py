@@ -0,0 +1,111 @@
+import logging
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from time import monotonic, time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from futuramaapi.core import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache[K: Hashable, V]:
+    """
+    In-process, size-bounded cache with per-entry expiry.
+
+    The least recently used entry is evicted once ``max_size`` is reached. Entries are local to the process,
+    so invalidation does not reach other workers, keep ``ttl`` short for anything that can change or share
+    invalidations through ``Revocations``.
+    """
+
+    def __init__(self, *, ttl: float, max_size: int) -> None:
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, /) -> V | None:
+        entry: tuple[float, V] | None = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, /, *, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """Live entries, expired ones are skipped but not evicted."""
+        now: float = monotonic()
+        for key, (expires_at, value) in self._entries.items():
+            if expires_at > now:
+                yield key, value
+
+    def delete(self, key: K, /) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class Revocations:
+    """
+    Revocation times of cached entries, shared by all processes through Redis.
+
+    Processes caching entries in a ``TTLCache`` check the keys of an entry on a cache hit and drop the entry when
+    any of them was revoked after it was cached, so an invalidation reaches every worker at once. Revocations
+    are kept for ``ttl``, entries are never cached longer than that. Lookups failing on Redis count as revoked,
+    the caller falls back to the database.
+    """
+
+    def __init__(self, *, prefix: str, ttl: float) -> None:
+        self.prefix: str = prefix
+        self.ttl: float = ttl
+
+    @staticmethod
+    def _get_client() -> Redis:
+        return Redis(connection_pool=settings.redis.pool)
+
+    async def revoke(self, *keys: str) -> None:
+        if not keys or self.ttl <= 0:
+            return
+
+        revoked_at: float = time()
+        try:
+            async with self._get_client().pipeline(transaction=False) as pipeline:
+                for key in keys:
+                    pipeline.set(f"{self.prefix}:{key}", revoked_at, px=max(int(self.ttl * 1000), 1))
+                await pipeline.execute()
+        except RedisError:
+            logger.exception("Failed to revoke cached entries, keys=%s", keys)
+
+    async def is_revoked(self, cached_at: float, /, *keys: str) -> bool:
+        """Whether any of ``keys`` was revoked since ``cached_at``, a ``time`` taken before the entry was read."""
+        if not keys:
+            return False
+
+        try:
+            revoked_at: list[str | None] = await self._get_client().mget([f"{self.prefix}:{key}" for key in keys])
+        except RedisError:
+            logger.exception("Failed to check revocations of cached entries, keys=%s", keys)
+            return True
+
+        return any(value is not None and float(value) >= cached_at for value in revoked_at)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Mapping
+from contextlib import suppress
+from types import MappingProxyType
+
+from .metrics import Gauge, metrics
+
+logger = logging.getLogger(__name__)
+
+pending_hits: Gauge = metrics.gauge(
+    "buffered_counter_pending_hits",
+    "Hits buffered by a counter and not yet flushed.",
+    labels=["counter"],
+)
+
+
+class BufferedCounter[K: (int, str)](ABC):
+    """
+    In-memory aggregator of hits per key.
+
+    Hits are accumulated as per-key deltas and written in one go every ``flush_interval`` seconds or as soon
+    as ``flush_threshold`` hits are buffered. Deltas of a failed write are kept for the next flush.
+    """
+
+    name: str = "counter"
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float,
+        flush_threshold: int,
+    ) -> None:
+        self.flush_interval: float = flush_interval
+        self.flush_threshold: int = flush_threshold
+
+        self._counts: Counter[K] = Counter()
+        self._total: int = 0
+        self._flush_requested: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        pending_hits.set_function(lambda: self._total, self.name)
+
+    @abstractmethod
+    async def write(self, counts: Mapping[K, int], /) -> None:
+        """Add ``counts`` to the stored counters, must be atomic per key and keep the order of ``counts``."""
+
+    @property
+    def pending(self) -> Mapping[K, int]:
+        """Buffered, not yet flushed, hits per key."""
+        return MappingProxyType(self._counts)
+
+    @property
+    def pending_total(self) -> int:
+        return self._total
+
+    def add(self, key: K, /) -> None:
+        self._counts[key] += 1
+        self._total += 1
+        if self._total >= self.flush_threshold:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        if not self._counts:
+            return
+
+        counts: Counter[K] = self._counts
+        self._counts, self._total = Counter(), 0
+        try:
+            # Keys are sorted to lock rows in the same order across workers and avoid deadlocks.
+            await self.write({key: counts[key] for key in sorted(counts)})
+        except BaseException:
+            # Keep the hits for the next flush.
+            self._counts.update(counts)
+            self._total += counts.total()
+            raise
+
+    async def _safe_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to flush %s, pending=%s", self.name, self.pending_total)
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+
+            self._flush_requested.clear()
+            await self._safe_flush()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            raise RuntimeError(f"{self.name.capitalize()} has been started.")
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            raise RuntimeError(f"{self.name.capitalize()} has not been started.")
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+        await self._safe_flush()
@@ -0,0 +1,33 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any
+
+type CursorValue = int | str | float | bool
+
+
+def encode_cursor(values: tuple[CursorValue, ...], /) -> str:
+    """Encode keyset values, e.g. ``(order_by, id)`` of the last row, into an opaque cursor."""
+    raw: bytes = json.dumps(values, separators=(",", ":")).encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, /) -> tuple[CursorValue, ...]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises ``ValueError`` if the cursor is malformed.
+    """
+    try:
+        values: Any = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor.") from None
+
+    if (
+        not isinstance(values, list)
+        or not values
+        or not all(isinstance(value, int | str | float | bool) for value in values)
+    ):
+        raise ValueError("Invalid cursor.")
+
+    return tuple(values)
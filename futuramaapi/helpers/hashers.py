@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import logging
@@ -5,9 +6,15 @@ import math
 import secrets
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from pydantic import BaseModel
 
+from futuramaapi.core import settings
+
+from .metrics import metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +22,10 @@ class HasherBaseException(Exception):
     """Hasher Base Exception."""
 
 
+class HasherBusyError(HasherBaseException):
+    """Hasher Busy Error."""
+
+
 class DecodedPassword(BaseModel):
     algorithm: str
     hash: str
@@ -28,6 +39,51 @@ class PasswordHasherBase(ABC):
     separator: str = "."
     random_string_chars: str = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
 
+    def __init__(
+        self,
+        *,
+        max_workers: int = settings.password_hasher_max_workers,
+        max_pending: int = settings.password_hasher_max_pending,
+    ) -> None:
+        self.max_workers: int = max_workers
+        self.max_pending: int = max_pending
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: int = 0
+
+    @property
+    def pending(self) -> int:
+        """Hashing jobs running or waiting for a worker thread."""
+        return self._pending
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hasher",
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    async def _run[T](self, func: Callable[[], T], /) -> T:
+        # ``pbkdf2_hmac`` releases the GIL, so hashing in threads keeps the event loop responsive and scales
+        # with cores. Jobs beyond ``max_pending`` are rejected instead of queueing up behind each other.
+        if self._pending >= self.max_pending:
+            raise HasherBusyError()
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func)
+        finally:
+            self._pending -= 1
+
     @staticmethod
     def pbkdf2(
         password: bytes,
@@ -68,6 +124,10 @@ class PasswordHasherBase(ABC):
     @abstractmethod
     def verify(self, password, encoded, /) -> bool: ...
 
+    async def averify(self, password: str, encoded: str, /) -> bool:
+        """``verify`` in the hasher thread pool, raises ``HasherBusyError`` when the pool is saturated."""
+        return await self._run(partial(self.verify, password, encoded))
+
     def _check_encode_args(self, password: str, salt: str, /):
         if not password:
             raise ValueError() from None
@@ -84,6 +144,17 @@ class PasswordHasherBase(ABC):
         iterations: int | None = None,
     ) -> str: ...
 
+    async def aencode(
+        self,
+        password: str,
+        /,
+        *,
+        salt: str | None = None,
+        iterations: int | None = None,
+    ) -> str:
+        """``encode`` in the hasher thread pool, raises ``HasherBusyError`` when the pool is saturated."""
+        return await self._run(partial(self.encode, password, salt=salt, iterations=iterations))
+
     @abstractmethod
     def decode(self, encoded, /) -> DecodedPassword: ...
 
@@ -144,3 +215,7 @@ class PasswordHasherPBKDF2(PasswordHasherBase):
 
 
 hasher = PasswordHasherPBKDF2()
+metrics.gauge(
+    "password_hasher_pending_jobs",
+    "Password hashing jobs running or queued.",
+).set_function(lambda: hasher.pending)
@@ -0,0 +1,184 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from typing import ClassVar
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float, /) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], /) -> str:
+    if not names:
+        return ""
+
+    escaped: Iterator[str] = (value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped, strict=True)) + "}"
+
+
+class Metric(ABC):
+    """
+    Metric rendered in the Prometheus text exposition format.
+
+    Series are kept in a dict keyed by label values, recording is a dict lookup and an addition, so metrics
+    can be updated on every query without measurable overhead.
+    """
+
+    type: ClassVar[str]
+
+    def __init__(self, name: str, description: str, /, *, labels: Sequence[str] = ()) -> None:
+        self.name: str = name
+        self.description: str = description
+        self.labels: tuple[str, ...] = tuple(labels)
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]: ...
+
+    def render(self) -> str:
+        return "\n".join(
+            [
+                f"# HELP {self.name} {self.description}",
+                f"# TYPE {self.name} {self.type}",
+                *self._samples(),
+            ],
+        )
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, description: str, /, *, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, description, labels=labels)
+
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def _samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """Gauge read from callbacks when rendered, one callback per series."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, description: str, /, *, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, description, labels=labels)
+
+        self._callbacks: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, callback: Callable[[], float], /, *labels: str) -> None:
+        self._callbacks[labels] = callback
+
+    def _samples(self) -> Iterator[str]:
+        for labels, callback in self._callbacks.items():
+            yield f"{self.name}{_format_labels(self.labels, labels)} {_format_value(callback())}"
+
+
+class _HistogramSeries:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int, /) -> None:
+        self.buckets: list[int] = [0] * size
+        self.count: int = 0
+        self.sum: float = 0.0
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        /,
+        *,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, description, labels=labels)
+
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, /, *labels: str) -> None:
+        series: _HistogramSeries | None = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+
+        # Observations are stored per bucket, cumulative counts are only computed when rendered.
+        series.buckets[bisect_left(self.buckets, value)] += 1
+        series.count += 1
+        series.sum += value
+
+    def get_count(self, *labels: str) -> int:
+        series: _HistogramSeries | None = self._series.get(labels)
+        return 0 if series is None else series.count
+
+    def _samples(self) -> Iterator[str]:
+        names: tuple[str, ...] = (*self.labels, "le")
+        for labels, series in self._series.items():
+            cumulative: int = 0
+            for bound, count in zip((*self.buckets, float("inf")), series.buckets, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(names, (*labels, _format_value(bound)))} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_value(series.sum)}"
+            yield f"{self.name}_count{_format_labels(self.labels, labels)} {series.count}"
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics.
+
+    Usage:
+        >>> queries: Counter = metrics.counter("queries_total", "Queries.", labels=["service"])
+        >>> queries.inc("GetCharacterService")
+        >>> metrics.render()
+    """
+
+    content_type: ClassVar[str] = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, *, prefix: str = "") -> None:
+        self.prefix: str = prefix
+        self._metrics: dict[str, Metric] = {}
+
+    def _register[M: Metric](self, metric: M, /) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str, /, *, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(f"{self.prefix}{name}", description, labels=labels))
+
+    def gauge(self, name: str, description: str, /, *, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(f"{self.prefix}{name}", description, labels=labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        /,
+        *,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(f"{self.prefix}{name}", description, labels=labels, buckets=buckets))
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+metrics: MetricsRegistry = MetricsRegistry(prefix="futuramaapi_")
@@ -0,0 +1,104 @@
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+_WHITESPACE: re.Pattern = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
+class _Phase:
+    duration: float = 0.0
+    count: int = 0
+
+
+@dataclass(slots=True)
+class _Statement:
+    statement: str
+    duration: float
+
+
+@dataclass(slots=True)
+class RequestProfile:
+    """
+    Phase timings of a single request.
+
+    Phases are summed, e.g. every query adds to ``db``. Statements are only kept when ``record_statements``
+    is set, they're needed for the debug payload only.
+    """
+
+    record_statements: bool = False
+    # The payload is sent as a header, keep it well within proxies' header size limits.
+    max_statements: int = 20
+    max_statement_length: int = 200
+    started_at: float = field(default_factory=perf_counter)
+
+    phases: dict[str, _Phase] = field(default_factory=dict)
+    statements: list[_Statement] = field(default_factory=list)
+
+    def add(self, name: str, duration: float, /) -> None:
+        phase: _Phase | None = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = _Phase()
+
+        phase.duration += duration
+        phase.count += 1
+
+    def add_statement(self, statement: str, duration: float, /) -> None:
+        self.add("db", duration)
+        if not self.record_statements or len(self.statements) >= self.max_statements:
+            return
+
+        self.statements.append(
+            _Statement(
+                statement=_WHITESPACE.sub(" ", statement).strip()[: self.max_statement_length],
+                duration=duration,
+            ),
+        )
+
+    @property
+    def total(self) -> float:
+        return perf_counter() - self.started_at
+
+    def get_server_timing(self) -> str:
+        """Value of the ``Server-Timing`` header, durations are in milliseconds."""
+        metrics: list[str] = [
+            f'{name};dur={phase.duration * 1000:.2f};desc="{phase.count}x"' for name, phase in self.phases.items()
+        ]
+        metrics.append(f"total;dur={self.total * 1000:.2f}")
+        return ", ".join(metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "phases": {
+                name: {"duration_ms": round(phase.duration * 1000, 3), "count": phase.count}
+                for name, phase in self.phases.items()
+            },
+            "statements": [
+                {"statement": statement.statement, "duration_ms": round(statement.duration * 1000, 3)}
+                for statement in self.statements
+            ],
+        }
+
+
+# Profile of the request being handled, only set while profiling is enabled.
+current_profile: ContextVar[RequestProfile | None] = ContextVar("current_profile", default=None)
+
+
+@contextmanager
+def profile_phase(name: str, /) -> Iterator[None]:
+    """Add the time spent in the block to the ``name`` phase of the current request, if it's profiled."""
+    profile: RequestProfile | None = current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    started_at: float = perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, perf_counter() - started_at)
@@ -1,22 +1,51 @@
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from collections.abc import Mapping
 
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from futuramaapi.core import settings
 from futuramaapi.db.models import RequestsCounterModel
+from futuramaapi.helpers.counters import BufferedCounter
 
 
-def _get_url(request: Request, /) -> str:
+def _get_url(scope: Scope, /) -> str:
     # Quick fix
-    return request.url.__str__().split("?")[0][:64]
+    return URL(scope=scope).__str__().split("?")[0][:64]
+
+
+class RequestsCounter(BufferedCounter[str]):
+    """
+    In-memory aggregator of API requests per URL.
 
+    Hits are written with a single multi-row upsert.
+    """
 
-class APIRequestsCounter(BaseHTTPMiddleware):
-    async def dispatch(
+    name: str = "requests counter"
+
+    def __init__(
         self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        if request.url.path.startswith("/api"):
-            await RequestsCounterModel.count_url(_get_url(request))
+        *,
+        flush_interval: float = settings.requests_counter_flush_interval,
+        flush_threshold: int = settings.requests_counter_flush_threshold,
+    ) -> None:
+        super().__init__(
+            flush_interval=flush_interval,
+            flush_threshold=flush_threshold,
+        )
+
+    async def write(self, counts: Mapping[str, int], /) -> None:
+        await RequestsCounterModel.count_urls(counts)
+
+
+requests_counter: RequestsCounter = RequestsCounter()
+
+
+class APIRequestsCounter:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/api"):
+            requests_counter.add(_get_url(scope))
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -3,17 +3,15 @@ from typing import ClassVar
 
 from starlette import status
 from starlette.datastructures import URL
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import RedirectResponse, Response
-from starlette.types import Scope
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from futuramaapi.core import settings
 
 logger = logging.getLogger(__name__)
 
 
-class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
+class HTTPSRedirectMiddleware:
     https_port: int = 443
     http_port: int = 80
     insecure_to_secure: ClassVar[dict[str, str]] = {
@@ -21,6 +19,9 @@ class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
         "ws": "wss",
     }
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
     def is_secure(self, headers: dict):
         try:
             host: str = headers["host"]
@@ -52,18 +53,20 @@ class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
     def headers_to_dict(headers: list, /) -> dict:
         return {h[0].decode(): h[1].decode() for h in headers}
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        headers: dict = self.headers_to_dict(request.scope["headers"])
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers: dict = self.headers_to_dict(scope["headers"])
         if self.is_secure(headers):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        url: URL = self._fix_url(request.scope)
-        return RedirectResponse(
+        url: URL = self._fix_url(scope)
+        response: RedirectResponse = RedirectResponse(
             url,
             status_code=status.HTTP_301_MOVED_PERMANENTLY,
-            headers={h[0].decode(): h[1].decode() for h in request.scope["headers"]},
+            headers=headers,
         )
+        await response(scope, receive, send)
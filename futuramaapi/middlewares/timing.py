@@ -0,0 +1,55 @@
+import json
+from secrets import compare_digest
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from futuramaapi.core import settings
+from futuramaapi.helpers.profiling import RequestProfile, current_profile
+
+
+class ServerTimingMiddleware:
+    """
+    Profile requests and report the phase timings in the ``Server-Timing`` header.
+
+    Requests sending the ``debug_header`` with the configured ``settings.debug_token`` also get the profile,
+    with the executed statements, as JSON in the ``X-Request-Profile`` header. Only added to the app when the
+    ``server_timing`` feature flag is on, so it costs nothing otherwise.
+    """
+
+    debug_header: str = "x-debug-token"
+    profile_header: str = "X-Request-Profile"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    def is_trusted(self, headers: Headers, /) -> bool:
+        if settings.debug_token is None or self.debug_header not in headers:
+            return False
+
+        return compare_digest(
+            headers[self.debug_header].encode(),
+            settings.debug_token.get_secret_value().encode(),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile: RequestProfile = RequestProfile(record_statements=self.is_trusted(Headers(scope=scope)))
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers: MutableHeaders = MutableHeaders(scope=message)
+                headers.append("Server-Timing", profile.get_server_timing())
+                if profile.record_statements:
+                    headers.append(self.profile_header, json.dumps(profile.to_dict(), separators=(",", ":")))
+
+            await send(message)
+
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_profile.reset(token)
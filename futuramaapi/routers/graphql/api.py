@@ -2,9 +2,16 @@ import strawberry
 from strawberry.fastapi import GraphQLRouter
 
 from .dependencies import get_context
+from .extensions import DocumentCache, QueryCostLimiter
 from .schemas import Query
 
-schema = strawberry.Schema(Query)
+schema = strawberry.Schema(
+    Query,
+    extensions=[
+        DocumentCache,
+        QueryCostLimiter,
+    ],
+)
 
 router = GraphQLRouter(
     schema,
@@ -1,19 +1,45 @@
+from asyncio import Lock
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from strawberry.dataloader import DataLoader
 from strawberry.fastapi import BaseContext
 
-from futuramaapi.db.session import get_async_session
+from futuramaapi.db import Base
+from futuramaapi.db.session import get_async_readonly_session
 
 
 class Context(BaseContext):
     def __init__(self, session: AsyncSession):
         self.session: AsyncSession = session
+        self.session_lock: Lock = Lock()
+
+        self._loaders: dict[type[Base], DataLoader[int, Base | None]] = {}
 
         super().__init__()
 
+    def get_loader(self, model: type[Base], /) -> DataLoader[int, Base | None]:
+        """
+        Per-request loader of ``model`` rows by id.
+
+        Lookups made in the same tick are coalesced into one query, results are cached for the rest of the request.
+        """
+        if model not in self._loaders:
+
+            async def load(ids: list[int]) -> list[Base | None]:
+                async with self.session_lock:
+                    rows = await model.get_many(self.session, ids)
+
+                by_id: dict[int, Base] = {row.id: row for row in rows}
+                return [by_id.get(id_) for id_ in ids]
+
+            self._loaders[model] = DataLoader(load_fn=load)
+
+        return self._loaders[model]
+
     @classmethod
     async def from_dependency(
         cls,
-        session: AsyncSession = Depends(get_async_session),  # noqa: B008
+        session: AsyncSession = Depends(get_async_readonly_session),  # noqa: B008
     ):
         return cls(session)
@@ -4,7 +4,8 @@ as happened, in this case there won't be a need to pass type, cls and so on.
 """
 
 from abc import ABC, abstractmethod
-from functools import singledispatch
+from collections.abc import Callable
+from functools import partial, singledispatch
 from typing import TYPE_CHECKING, Any, cast
 
 from fastapi_storages.base import StorageImage
@@ -127,4 +128,111 @@ class ModelConverter(ConverterBase):
         return None
 
 
-converter: ConverterBase = ModelConverter()
+type _Convert = Callable[[Any], Any]
+
+_EMPTY: dict[str, Any] = {}
+
+
+def _identity(data: Any, /) -> Any:
+    return data
+
+
+def _convert_str(data: Any, /) -> Any:
+    if isinstance(data, StorageImage):
+        return settings.build_url(path=data._name)
+
+    return data
+
+
+class CompiledModelConverter(ConverterBase):
+    """
+    Converter that compiles, once per strawberry type, a constructor made of field getters and per-type conversion
+    closures, so converting a row is a plain function call instead of a ``singledispatch`` walk over its fields.
+    """
+
+    def __init__(self) -> None:
+        self._constructors: dict[type, _Convert] = {}
+
+    def _compile_type(self, type_: Any, /) -> _Convert:  # noqa: PLR0911
+        if isinstance(type_, StrawberryOptional):
+            convert_optional: _Convert = self._compile_type(type_.of_type)
+            if convert_optional is _identity:
+                return _identity
+            return lambda data: None if data is None else convert_optional(data)
+
+        if isinstance(type_, StrawberryList):
+            convert_item: _Convert = self._compile_type(type_.of_type)
+            if convert_item is _identity:
+                return list
+            return lambda data: [convert_item(item) for item in data]
+
+        if isinstance(type_, StrawberryEnumDefinition):
+            return _identity
+
+        if isinstance(type_, StrawberryUnion):
+            return lambda data: _convert(type_, data)
+
+        if has_object_definition(type_):
+            if getattr(type_, "converter", self) is not self:
+                return type_.from_model
+            # Resolved on first use, types may reference each other.
+            return partial(self.to_strawberry, type_)
+
+        if type_ is str:
+            return _convert_str
+
+        return _identity
+
+    def get_constructor(self, cls: type, /) -> _Convert:
+        try:
+            return self._constructors[cls]
+        except KeyError:
+            pass
+
+        fields: tuple[tuple[str, _Convert], ...] = tuple(
+            (field.python_name, self._compile_type(field.type))
+            for field in cls.__strawberry_definition__.fields  # type: ignore[attr-defined]
+            if field.init
+        )
+        plain: tuple[str, ...] = tuple(name for name, convert in fields if convert is _identity)
+        converted: tuple[tuple[str, _Convert], ...] = tuple(
+            (name, convert) for name, convert in fields if convert is not _identity
+        )
+
+        def construct(model_instance: Any, /) -> Any:
+            # Loaded ORM attributes live in the instance ``__dict__``, reading it skips the attribute descriptors.
+            values: dict[str, Any] = getattr(model_instance, "__dict__", _EMPTY)
+            kwargs: dict[str, Any] = {
+                name: values[name] if name in values else getattr(model_instance, name, None) for name in plain
+            }
+            for name, convert in converted:
+                kwargs[name] = convert(values[name] if name in values else getattr(model_instance, name, None))
+
+            return cls(**kwargs)
+
+        self._constructors[cls] = construct
+        return construct
+
+    def to_strawberry[S](  # type: ignore[override]
+        self,
+        cls: type[S],
+        model_instance: Base,
+        /,
+    ) -> S:
+        return self.get_constructor(cls)(model_instance)
+
+    def get_edges[S](  # type: ignore[override]
+        self,
+        cls: type[S],
+        data: list[Base],
+        /,
+    ) -> list[S] | None:
+        field: StrawberryField = next(f for f in cls.__strawberry_definition__.fields if f.python_name == "edges")  # type: ignore[attr-defined]
+        if not field.init:
+            return None
+
+        construct: _Convert = self.get_constructor(cast("StrawberryList", field.type).of_type)
+        return [construct(item) for item in data]
+
+
+converter: ConverterBase = CompiledModelConverter()
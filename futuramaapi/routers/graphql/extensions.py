@@ -0,0 +1,368 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any, ClassVar, NamedTuple
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLNamedType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_composite_type,
+    is_list_type,
+)
+from graphql.execution.values import get_argument_values, get_variable_values
+from strawberry.extensions import SchemaExtension
+
+from futuramaapi.core import settings
+from futuramaapi.helpers.caches import TTLCache
+from futuramaapi.helpers.metrics import Counter, metrics
+
+from .validators import LimitsRule
+
+documents: Counter = metrics.counter(
+    "graphql_documents_total",
+    "GraphQL operations by document cache result.",
+    labels=["result"],
+)
+
+
+class PersistedQueryNotFoundError(GraphQLError):
+    def __init__(self) -> None:
+        super().__init__("PersistedQueryNotFound", extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})
+
+
+class PersistedQueryError(GraphQLError):
+    def __init__(self, message: str, /) -> None:
+        super().__init__(message, extensions={"code": "BAD_REQUEST"})
+
+
+class QueryTooExpensiveError(GraphQLError):
+    def __init__(self, message: str, /) -> None:
+        super().__init__(message, extensions={"code": "QUERY_TOO_EXPENSIVE"})
+
+
+@dataclass(slots=True)
+class _Document:
+    query: str
+    document: DocumentNode
+    # ``None`` until the document has been validated.
+    errors: list[GraphQLError] | None = None
+
+
+class DocumentCache(SchemaExtension):
+    """
+    Cache of parsed and validated documents, with automatic persisted queries.
+
+    Documents are cached by the SHA-256 hash of the query, so repeated queries skip parsing and validation.
+    Clients can send just the hash in the ``persistedQuery`` extension, following the Apollo APQ protocol:
+    unknown hashes get a ``PersistedQueryNotFound`` error and the client retries with the query and the hash,
+    which registers the query for the next requests.
+    """
+
+    version: ClassVar[int] = 1
+    cache: ClassVar[TTLCache[str, _Document]] = TTLCache(
+        ttl=settings.graphql_document_cache_ttl,
+        max_size=settings.graphql_document_cache_max_size,
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._hash: str | None = None
+        self._document: _Document | None = None
+
+    def _get_persisted_hash(self) -> str | None:
+        extensions: dict[str, Any] = self.execution_context.operation_extensions or {}
+        persisted_query: Any = extensions.get("persistedQuery")
+        if persisted_query is None:
+            return None
+
+        if not isinstance(persisted_query, dict) or persisted_query.get("version") != self.version:
+            raise PersistedQueryError("Unsupported persisted query version")
+
+        hash_: Any = persisted_query.get("sha256Hash")
+        if not isinstance(hash_, str):
+            raise PersistedQueryError("Persisted query hash must be a string")
+
+        return hash_
+
+    def on_operation(self) -> Iterator[None]:
+        query: str | None = self.execution_context.query
+        persisted_hash: str | None = self._get_persisted_hash()
+
+        if query is None:
+            if persisted_hash is None:
+                # Rejected by strawberry as a request without a query.
+                yield
+                return
+
+            self._document = self.cache.get(persisted_hash)
+            if self._document is None:
+                documents.inc("persisted_miss")
+                raise PersistedQueryNotFoundError()
+
+            self.execution_context.query = self._document.query
+        else:
+            self._hash = sha256(query.encode()).hexdigest()
+            if persisted_hash is not None and persisted_hash != self._hash:
+                raise PersistedQueryError("Provided sha does not match query")
+
+            self._document = self.cache.get(self._hash)
+
+        documents.inc("miss" if self._document is None else "hit")
+        yield
+
+    def on_parse(self) -> Iterator[None]:
+        if self._document is not None:
+            self.execution_context.graphql_document = self._document.document
+            yield
+            return
+
+        yield
+
+        if self._hash is not None and self.execution_context.graphql_document is not None:
+            self._document = _Document(
+                query=self.execution_context.query or "",
+                document=self.execution_context.graphql_document,
+            )
+            self.cache.set(self._hash, self._document)
+
+    def on_validate(self) -> Iterator[None]:
+        if self._document is not None and self._document.errors is not None:
+            self.execution_context.pre_execution_errors = self._document.errors
+            yield
+            return
+
+        yield
+
+        if self._document is not None:
+            self._document.errors = self.execution_context.pre_execution_errors or []
+
+
+class QueryCost(NamedTuple):
+    cost: int
+    depth: int
+
+
+class CostAnalyzer:
+    """
+    Static cost estimate of an operation.
+
+    Every selected field costs its weight once per item it resolves, so list fields cost their weight per item and
+    multiply the cost of their selections. Aliases of a field are counted separately. List sizes come from
+    ``list_sizes``, else from the ``limit`` argument of the paginated field above the list, else
+    ``default_list_size``. Weights and list sizes are keyed by ``Type.field``.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Any,
+        /,
+        *,
+        weights: Mapping[str, int],
+        list_sizes: Mapping[str, int],
+        default_list_size: int,
+    ) -> None:
+        self.schema: GraphQLSchema = schema
+        # Coerced variables, as returned by ``get_variable_values``.
+        self.variables: Any = variables
+        self.weights: Mapping[str, int] = weights
+        self.list_sizes: Mapping[str, int] = list_sizes
+        self.default_list_size: int = default_list_size
+
+        self._fragments: dict[str, FragmentDefinitionNode] = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def _get_type(self, parent_type: GraphQLNamedType, type_condition: Any, /) -> GraphQLNamedType:
+        if type_condition is None:
+            return parent_type
+
+        return self.schema.get_type(type_condition.name.value) or parent_type
+
+    def _get_fields(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        /,
+    ) -> Iterator[tuple[GraphQLNamedType, FieldNode]]:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield parent_type, selection
+            elif isinstance(selection, InlineFragmentNode):
+                yield from self._get_fields(
+                    self._get_type(parent_type, selection.type_condition),
+                    selection.selection_set,
+                )
+            elif isinstance(selection, FragmentSpreadNode) and selection.name.value in self._fragments:
+                fragment: FragmentDefinitionNode = self._fragments[selection.name.value]
+                yield from self._get_fields(
+                    self._get_type(parent_type, fragment.type_condition),
+                    fragment.selection_set,
+                )
+
+    def _get_weight(self, key: str, field: GraphQLField, /) -> int:
+        weight: int | None = self.weights.get(key)
+        if weight is not None:
+            return weight
+
+        # Objects are resolved, leaves are read from the resolved objects.
+        return 1 if is_composite_type(get_named_type(field.type)) else 0
+
+    def _get_size(self, key: str, field: GraphQLField, page_size: int | None, /) -> int:
+        if not is_list_type(get_nullable_type(field.type)):
+            return 1
+
+        return self.list_sizes.get(key, self.default_list_size if page_size is None else page_size)
+
+    def _get_page_size(self, field: GraphQLField, node: FieldNode, /) -> int | None:
+        if "limit" not in field.args:
+            return None
+
+        limit: Any = get_argument_values(field, node, self.variables).get("limit")
+        return self.default_list_size if limit is None else max(limit, 0)
+
+    def _visit(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: SelectionSetNode,
+        /,
+        *,
+        multiplier: int,
+        page_size: int | None,
+        depth: int,
+    ) -> QueryCost:
+        cost: int = 0
+        max_depth: int = depth
+        for type_, node in self._get_fields(parent_type, selection_set):
+            name: str = node.name.value
+            field: GraphQLField | None = getattr(type_, "fields", {}).get(name)
+            # Introspection is cheap and would otherwise exceed the depth of any real query.
+            if field is None or name.startswith("__"):
+                continue
+
+            key: str = f"{type_.name}.{name}"
+            items: int = multiplier * self._get_size(key, field, page_size)
+            cost += items * self._get_weight(key, field)
+            max_depth = max(max_depth, depth + 1)
+            if node.selection_set is None:
+                continue
+
+            child: QueryCost = self._visit(
+                get_named_type(field.type),
+                node.selection_set,
+                multiplier=items,
+                page_size=self._get_page_size(field, node),
+                depth=depth + 1,
+            )
+            cost += child.cost
+            max_depth = max(max_depth, child.depth)
+
+        return QueryCost(cost=cost, depth=max_depth)
+
+    def analyze(self, operation: OperationDefinitionNode, /) -> QueryCost:
+        root_type: GraphQLNamedType | None = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return QueryCost(cost=0, depth=0)
+
+        return self._visit(root_type, operation.selection_set, multiplier=1, page_size=None, depth=0)
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    Reject operations estimated too expensive or too deep, before any resolver touches the database.
+
+    Runs after validation, on the coerced variables, so limits passed as variables are accounted for. The estimate
+    is returned in the ``cost`` response extension. Fields not listed in ``weights`` cost 1 when they resolve
+    objects and nothing otherwise, see ``CostAnalyzer``.
+    """
+
+    weights: ClassVar[dict[str, int]] = {
+        # Pages and totals are a query each, weighted as much as a full page of rows, so that aliasing many pages
+        # in one operation is rejected.
+        "Query.characters": 50,
+        "Query.episodes": 50,
+        "Query.seasons": 50,
+        "Characters.total": 50,
+        "Episodes.total": 50,
+        "Seasons.total": 50,
+    }
+    list_sizes: ClassVar[dict[str, int]] = {
+        # Not paginated, the longest season.
+        "Season.episodes": 26,
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._cost: QueryCost | None = None
+
+    def _analyze(self) -> QueryCost | None:
+        schema: GraphQLSchema = self.execution_context.schema._schema
+        document: DocumentNode | None = self.execution_context.graphql_document
+        if document is None:
+            return None
+
+        operation: OperationDefinitionNode | None = get_operation_ast(document, self.execution_context.operation_name)
+        if operation is None:
+            return None
+
+        variables: Any = get_variable_values(
+            schema,
+            operation.variable_definitions or (),
+            self.execution_context.variables or {},
+        )
+        if isinstance(variables, list):
+            # Reported by the execution.
+            return None
+
+        return CostAnalyzer(
+            schema,
+            document,
+            variables,
+            weights=self.weights,
+            list_sizes=self.list_sizes,
+            default_list_size=LimitsRule.max_limit,
+        ).analyze(operation)
+
+    def on_execute(self) -> Iterator[None]:
+        self._cost = self._analyze()
+        if self._cost is not None:
+            if self._cost.depth > settings.graphql_max_depth:
+                raise QueryTooExpensiveError(
+                    f"Query depth {self._cost.depth} exceeds the maximum of {settings.graphql_max_depth}.",
+                )
+            if self._cost.cost > settings.graphql_max_cost:
+                raise QueryTooExpensiveError(
+                    f"Query cost {self._cost.cost} exceeds the maximum of {settings.graphql_max_cost}.",
+                )
+
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        if self._cost is None:
+            return {}
+
+        return {
+            "cost": {
+                "requested": self._cost.cost,
+                "maximum": settings.graphql_max_cost,
+                "depth": self._cost.depth,
+                "maximumDepth": settings.graphql_max_depth,
+            },
+        }
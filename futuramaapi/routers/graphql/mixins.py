@@ -1,14 +1,29 @@
-from typing import ClassVar, Self, cast
+from typing import Any, ClassVar, Final, Self, cast
 
+from aiocache import cached
 from fastapi_storages.base import StorageImage
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from strawberry.types.field import StrawberryField
 
 from futuramaapi.core import settings
 from futuramaapi.db import Base, FilterStatementKwargs, ModelDoesNotExistError
+from futuramaapi.helpers.cursors import encode_cursor
 
+from .context import Context
 from .conversion import ConverterBase, converter
 
+_TOTAL_TTL: Final[int] = 10 * 60
+
+
+def _get_total_key(_: Any, model: type[Base], session: AsyncSession, extra: dict | None, /) -> str:
+    filters: list[tuple[str, str]] = sorted((k, str(v)) for k, v in (extra or {}).items() if v is not None)
+    return f"graphql-total:{model.__tablename__}:{filters}"
+
+
+@cached(ttl=_TOTAL_TTL, key_builder=_get_total_key)
+async def _get_total(model: type[Base], session: AsyncSession, extra: dict | None, /) -> int:
+    return await model.count(session, extra=extra)
+
 
 class StrawberryDatabaseMixin:
     model: ClassVar[type[Base]]
@@ -43,13 +58,39 @@ class StrawberryDatabaseMixin:
         return cls.from_model(obj)
 
     @classmethod
-    async def paginate(cls, session: AsyncSession, kwargs: FilterStatementKwargs, /) -> Self:
-        total: int = await cls.model.count(session)
-        edges: list[Base] = cast("list[Base]", await cls.model.filter(session, kwargs))
+    async def load(cls, context: Context, id_: int, /) -> Self | None:
+        obj: Base | None = await context.get_loader(cls.model).load(id_)
+        if obj is None:
+            return None
+
+        return cls.from_model(obj)
+
+    @classmethod
+    async def get_total(cls, context: Context, extra: dict | None, /) -> int:
+        """Filtered total, cached per filter combination so hot filters cost no query."""
+        async with context.session_lock:
+            return await _get_total(cls.model, context.session, extra)
+
+    @classmethod
+    async def paginate(cls, context: Context, kwargs: FilterStatementKwargs, /) -> Self:
+        limit: int | None = kwargs.limit
+        # One extra row tells whether there is a next page.
+        async with context.session_lock:
+            edges: list[Base] = cast(
+                "list[Base]",
+                await cls.model.filter(context.session, kwargs._replace(limit=None if limit is None else limit + 1)),
+            )
+
+        next_cursor: str | None = None
+        if limit is not None and len(edges) > limit:
+            edges = edges[:limit]
+            if edges:
+                next_cursor = encode_cursor(cls.model.get_keyset(edges[-1], field_name=kwargs.order_by))
 
         return cls(
-            limit=kwargs.limit,  # type: ignore[call-arg]
+            limit=limit,  # type: ignore[call-arg]
             offset=kwargs.offset,  # type: ignore[call-arg]
-            total=total,  # type: ignore[call-arg]
             edges=cls.converter.get_edges(cls, edges),  # type: ignore[call-arg]
+            next_cursor=next_cursor,  # type: ignore[call-arg]
+            extra=kwargs.extra,  # type: ignore[call-arg]
         )
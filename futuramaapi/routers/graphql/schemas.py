@@ -7,6 +7,7 @@ from strawberry.types import Info
 
 from futuramaapi.db import Base, FilterStatementKwargs
 from futuramaapi.db.models import CharacterModel, EpisodeModel, SeasonModel
+from futuramaapi.helpers.cursors import decode_cursor
 
 from .mixins import StrawberryDatabaseMixin
 from .validators import LimitsRule
@@ -16,8 +17,17 @@ from .validators import LimitsRule
 class PageBase(StrawberryDatabaseMixin):
     limit: int
     offset: int
-    total: int
     edges: list[Any]
+    next_cursor: str | None = strawberry.field(
+        default=None,
+        description="Opaque cursor of the next page, pass it as `after`. Empty on the last page.",
+    )
+
+    extra: strawberry.Private[dict | None] = None
+
+    @strawberry.field(description="Total number of items matching the filters, counted only when selected.")
+    async def total(self, info: Info) -> int:
+        return await self.get_total(info.context, self.extra)
 
 
 @strawberry.type
@@ -130,7 +140,7 @@ class Query:
         info: Info,
         character_id: int,
     ) -> Character | None:
-        return await Character.get(info.context.session, character_id)
+        return await Character.load(info.context, character_id)
 
     @strawberry.field(
         extensions=[
@@ -145,6 +155,7 @@ class Query:
         gender: GenderFilter | None = None,
         status: StatusFilter | None = None,
         species: SpeciesFilter | None = None,
+        after: str | None = None,
     ) -> Characters:
         kwargs: FilterStatementKwargs = FilterStatementKwargs(
             offset=offset,
@@ -154,9 +165,10 @@ class Query:
                 "species": species,
                 "status": status,
             },
+            after=decode_cursor(after) if after is not None else None,
         )
 
-        return await Characters.paginate(info.context.session, kwargs)
+        return await Characters.paginate(info.context, kwargs)
 
     @strawberry.field()
     async def episode(
@@ -164,7 +176,7 @@ class Query:
         info: Info,
         episode_id: int,
     ) -> Episode | None:
-        return await Episode.get(info.context.session, episode_id)
+        return await Episode.load(info.context, episode_id)
 
     @strawberry.field(
         extensions=[
@@ -177,13 +189,15 @@ class Query:
         *,
         limit: int | None = 50,
         offset: int | None = 0,
+        after: str | None = None,
     ) -> Episodes:
         kwargs: FilterStatementKwargs = FilterStatementKwargs(
             offset=offset,
             limit=limit,
+            after=decode_cursor(after) if after is not None else None,
         )
 
-        return await Episodes.paginate(info.context.session, kwargs)
+        return await Episodes.paginate(info.context, kwargs)
 
     @strawberry.field()
     async def season(
@@ -191,7 +205,7 @@ class Query:
         info: Info,
         season_id: int,
     ) -> Season | None:
-        return await Season.get(info.context.session, season_id)
+        return await Season.load(info.context, season_id)
 
     @strawberry.field(
         extensions=[
@@ -204,10 +218,12 @@ class Query:
         *,
         limit: int | None = 50,
         offset: int | None = 0,
+        after: str | None = None,
     ) -> Seasons:
         kwargs: FilterStatementKwargs = FilterStatementKwargs(
             offset=offset,
             limit=limit,
+            after=decode_cursor(after) if after is not None else None,
         )
 
-        return await Seasons.paginate(info.context.session, kwargs)
+        return await Seasons.paginate(info.context, kwargs)
@@ -20,9 +20,15 @@ class LimitsRule(FieldExtension):
                 f"offset violation. Allowed range is {self.min_offset}-{GRAPHQL_MAX_INT}, current={offset}."
             )
 
+    @staticmethod
+    def _validate_after(after: str | None, offset: int, /) -> None:
+        if after is not None and offset:
+            raise ValueError("offset violation. Offset cannot be combined with after.")
+
     def validate_kwargs(self, kwargs: dict, /) -> None:
         self._validate_limit(kwargs["limit"])
         self._validate_offset(kwargs["offset"])
+        self._validate_after(kwargs.get("after"), kwargs["offset"])
 
     async def resolve_async(
         self,
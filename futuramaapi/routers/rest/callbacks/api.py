@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Path, status
+from fastapi import APIRouter, Path, status
 
 from futuramaapi.db import INT32
 from futuramaapi.routers.services.callbacks import (
@@ -55,7 +55,6 @@ async def create_characters_callback_request(
         ),
     ],
     request: CallbackRequest,
-    background_tasks: BackgroundTasks,
 ) -> CallbackResponse:
     """Create a request to get a character by ID.
 
@@ -69,7 +68,7 @@ async def create_characters_callback_request(
         request_data=request,
         id=character_id,
     )
-    return await service(background_tasks)
+    return await service()
 
 
 _episodes_callbacks_router = APIRouter()
@@ -100,7 +99,6 @@ async def create_episodes_callback_request(
         ),
     ],
     request: CallbackRequest,
-    background_tasks: BackgroundTasks,
 ) -> CallbackResponse:
     """Create a request to get an episode by ID.
 
@@ -114,7 +112,7 @@ async def create_episodes_callback_request(
         request_data=request,
         id=episode_id,
     )
-    return await service(background_tasks)
+    return await service()
 
 
 # Season related endpoints.
@@ -146,7 +144,6 @@ async def create_seasons_callback_request(
         ),
     ],
     request: CallbackRequest,
-    background_tasks: BackgroundTasks,
 ) -> CallbackResponse:
     """Create a request to get a season by ID.
 
@@ -160,4 +157,4 @@ async def create_seasons_callback_request(
         request_data=request,
         id=season_id,
     )
-    return await service(background_tasks)
+    return await service()
@@ -5,14 +5,21 @@ from fastapi_pagination import Page
 
 from futuramaapi.db import INT32
 from futuramaapi.routers.exceptions import NotFoundResponse
+from futuramaapi.routers.services import BULK_IDS_PATTERN, BULK_MAX_IDS, BulkResponse, CursorPage
 from futuramaapi.routers.services.characters.get_character import (
     GetCharacterResponse,
+    GetCharactersBulkService,
     GetCharacterService,
 )
 from futuramaapi.routers.services.characters.list_characters import (
+    ListCharactersCursorService,
     ListCharactersResponse,
     ListCharactersService,
 )
+from futuramaapi.routers.services.characters.search_characters import (
+    SearchCharacterResponse,
+    SearchCharactersService,
+)
 
 router: APIRouter = APIRouter(
     prefix="/characters",
@@ -20,6 +27,173 @@ router: APIRouter = APIRouter(
 )
 
 
+# Registered before ``/{character_id}``, otherwise ``bulk`` is matched as a character id.
+@router.get(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResponse[GetCharacterResponse],
+    name="characters_bulk",
+)
+async def get_characters_bulk(
+    ids: Annotated[
+        str,
+        Query(
+            description=f"Comma separated character ids, up to {BULK_MAX_IDS}.",
+            pattern=BULK_IDS_PATTERN,
+            examples=[
+                "1,2,3",
+            ],
+        ),
+    ],
+) -> BulkResponse[GetCharacterResponse]:
+    """Retrieve many characters at once.
+
+    Returns the characters in the order of the requested ids in a single request, instead of a request per character.
+    Ids that don't exist are returned as `null` and listed in `missing`.
+    """
+    service: GetCharactersBulkService = GetCharactersBulkService(ids=ids)
+    return await service()
+
+
+# Registered before ``/{character_id}``, otherwise ``cursor`` is matched as a character id.
+@router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[ListCharactersResponse],
+    name="characters_cursor",
+)
+async def list_characters_cursor(  # noqa: PLR0913
+    gender: Literal[
+        "male",
+        "!male",
+        "female",
+        "!female",
+        "unknown",
+        "!unknown",
+    ]
+    | None = None,
+    character_status: Annotated[
+        Literal[
+            "alive",
+            "!alive",
+            "dead",
+            "!dead",
+            "unknown",
+            "!unknown",
+        ]
+        | None,
+        Query(alias="status"),
+    ] = None,
+    species: Literal[
+        "human",
+        "!human",
+        "robot",
+        "!robot",
+        "head",
+        "!head",
+        "alien",
+        "!alien",
+        "mutant",
+        "!mutant",
+        "monster",
+        "!monster",
+        "unknown",
+        "!unknown",
+    ]
+    | None = None,
+    order_by: Annotated[
+        Literal["id"],
+        Query(alias="orderBy"),
+    ] = "id",
+    direction: Annotated[
+        Literal["asc", "desc"],
+        Query(alias="orderByDirection"),
+    ] = "asc",
+    query: Annotated[
+        str | None,
+        Query(
+            alias="query",
+            description="Name search query.",
+            max_length=128,
+        ),
+    ] = None,
+    after: Annotated[
+        str | None,
+        Query(
+            description="Cursor of the page to continue from, ``nextCursor`` of the previous page.",
+            max_length=256,
+        ),
+    ] = None,
+    size: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=100,
+        ),
+    ] = 50,
+    include_total: Annotated[
+        bool,
+        Query(
+            alias="includeTotal",
+            description="Count matching characters, costs an extra query.",
+        ),
+    ] = False,
+) -> CursorPage[ListCharactersResponse]:
+    """Retrieve characters with cursor pagination.
+
+    Accepts the same filters as the characters endpoint, but pages are addressed by an opaque cursor instead of
+    a page number, so deep pages are as fast as the first one. Pass `nextCursor` of the response as `after`
+    to get the next page, `nextCursor` is empty on the last page.
+
+    The total number of characters is only returned when `includeTotal=true` is passed.
+    """
+    service: ListCharactersCursorService = ListCharactersCursorService(
+        gender=gender,
+        character_status=character_status,
+        species=species,
+        order_by=order_by,
+        direction=direction,
+        query=query,
+        after=after,
+        size=size,
+        include_total=include_total,
+    )
+    return await service()
+
+
+# Registered before ``/{character_id}``, otherwise ``search`` is matched as a character id.
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SearchCharacterResponse],
+    name="characters_search",
+)
+async def search_characters(
+    query: Annotated[
+        str,
+        Query(
+            description="Name, or the beginning of it, to search for.",
+            min_length=1,
+            max_length=128,
+        ),
+    ],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=25,
+        ),
+    ] = 10,
+) -> list[SearchCharacterResponse]:
+    """Search characters by name.
+
+    Meant for autocomplete: characters having a name word starting with the last typed word come first, then
+    the characters with similar names, so misspelled queries still find the character.
+    """
+    service: SearchCharactersService = SearchCharactersService(query=query, limit=limit)
+    return await service()
+
+
 @router.get(
     "/{character_id}",
     status_code=status.HTTP_200_OK,
@@ -1,15 +1,18 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Path, status
+from fastapi import APIRouter, Path, Query, status
 from fastapi_pagination import Page
 
 from futuramaapi.db import INT32
 from futuramaapi.routers.exceptions import NotFoundResponse
+from futuramaapi.routers.services import BULK_IDS_PATTERN, BULK_MAX_IDS, BulkResponse, CursorPage
 from futuramaapi.routers.services.episodes.get_episode import (
     GetEpisodeResponse,
+    GetEpisodesBulkService,
     GetEpisodeService,
 )
 from futuramaapi.routers.services.episodes.list_episodes import (
+    ListEpisodesCursorService,
     ListEpisodesResponse,
     ListEpisodesService,
 )
@@ -20,6 +23,79 @@ router: APIRouter = APIRouter(
 )
 
 
+# Registered before ``/{episode_id}``, otherwise ``bulk`` is matched as an episode id.
+@router.get(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResponse[GetEpisodeResponse],
+    name="episodes_bulk",
+)
+async def get_episodes_bulk(
+    ids: Annotated[
+        str,
+        Query(
+            description=f"Comma separated episode ids, up to {BULK_MAX_IDS}.",
+            pattern=BULK_IDS_PATTERN,
+            examples=[
+                "1,2,3",
+            ],
+        ),
+    ],
+) -> BulkResponse[GetEpisodeResponse]:
+    """Retrieve many episodes at once.
+
+    Returns the episodes in the order of the requested ids in a single request, instead of a request per episode.
+    Ids that don't exist are returned as `null` and listed in `missing`.
+    """
+    service: GetEpisodesBulkService = GetEpisodesBulkService(ids=ids)
+    return await service()
+
+
+# Registered before ``/{episode_id}``, otherwise ``cursor`` is matched as an episode id.
+@router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[ListEpisodesResponse],
+    name="episodes_cursor",
+)
+async def list_episodes_cursor(
+    after: Annotated[
+        str | None,
+        Query(
+            description="Cursor of the page to continue from, ``nextCursor`` of the previous page.",
+            max_length=256,
+        ),
+    ] = None,
+    size: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=100,
+        ),
+    ] = 50,
+    include_total: Annotated[
+        bool,
+        Query(
+            alias="includeTotal",
+            description="Count episodes, costs an extra query.",
+        ),
+    ] = False,
+) -> CursorPage[ListEpisodesResponse]:
+    """Retrieve episodes with cursor pagination.
+
+    Pages are addressed by an opaque cursor instead of a page number, so deep pages are as fast as the first one.
+    Pass `nextCursor` of the response as `after` to get the next page, `nextCursor` is empty on the last page.
+
+    The total number of episodes is only returned when `includeTotal=true` is passed.
+    """
+    service: ListEpisodesCursorService = ListEpisodesCursorService(
+        after=after,
+        size=size,
+        include_total=include_total,
+    )
+    return await service()
+
+
 @router.get(
     "/{episode_id}",
     status_code=status.HTTP_200_OK,
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, status
+from typing import Annotated
+
+from fastapi import APIRouter, Query, status
 
 from futuramaapi.routers.exceptions import NotFoundResponse
 from futuramaapi.routers.services.randoms.get_random_character import (
@@ -13,6 +15,10 @@ from futuramaapi.routers.services.randoms.get_random_season import (
     GetRandomSeasonResponse,
     GetRandomSeasonService,
 )
+from futuramaapi.routers.services.randoms.list_random_characters import (
+    ListRandomCharactersResponse,
+    ListRandomCharactersService,
+)
 
 router: APIRouter = APIRouter(
     prefix="/random",
@@ -45,6 +51,32 @@ async def get_random_character() -> GetRandomCharacterResponse:
     return await service()
 
 
+@router.get(
+    "/characters",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ListRandomCharactersResponse],
+    name="random_characters",
+)
+async def list_random_characters(
+    count: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=50,
+            description="Number of distinct characters to return.",
+        ),
+    ] = 10,
+) -> list[ListRandomCharactersResponse]:
+    """Retrieve random characters.
+
+    This endpoint returns up to `count` distinct, randomly selected Futurama characters in a single request.
+    Each item includes the same details as the random character endpoint. Fewer items are returned only if
+    there are fewer characters than requested.
+    """
+    service: ListRandomCharactersService = ListRandomCharactersService(count=count)
+    return await service()
+
+
 @router.get(
     "/episode",
     status_code=status.HTTP_200_OK,
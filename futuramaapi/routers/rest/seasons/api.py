@@ -1,12 +1,14 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Path, status
+from fastapi import APIRouter, Path, Query, status
 from fastapi_pagination import Page
 
 from futuramaapi.db import INT32
 from futuramaapi.routers.exceptions import NotFoundResponse
+from futuramaapi.routers.services import BULK_IDS_PATTERN, BULK_MAX_IDS, BulkResponse
 from futuramaapi.routers.services.seasons.get_season import (
     GetSeasonResponse,
+    GetSeasonsBulkService,
     GetSeasonService,
 )
 from futuramaapi.routers.services.seasons.list_seasons import (
@@ -20,6 +22,34 @@ router: APIRouter = APIRouter(
 )
 
 
+# Registered before ``/{season_id}``, otherwise ``bulk`` is matched as a season id.
+@router.get(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResponse[GetSeasonResponse],
+    name="seasons_bulk",
+)
+async def get_seasons_bulk(
+    ids: Annotated[
+        str,
+        Query(
+            description=f"Comma separated season ids, up to {BULK_MAX_IDS}.",
+            pattern=BULK_IDS_PATTERN,
+            examples=[
+                "1,2,3",
+            ],
+        ),
+    ],
+) -> BulkResponse[GetSeasonResponse]:
+    """Retrieve many seasons at once.
+
+    Returns the seasons in the order of the requested ids in a single request, instead of a request per season.
+    Ids that don't exist are returned as `null` and listed in `missing`.
+    """
+    service: GetSeasonsBulkService = GetSeasonsBulkService(ids=ids)
+    return await service()
+
+
 @router.get(
     "/{season_id}",
     status_code=status.HTTP_200_OK,
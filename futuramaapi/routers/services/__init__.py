@@ -4,26 +4,38 @@ from ._base import (
     BaseUserAuthenticatedService,
     ConflictError,
     EmptyUpdateError,
+    InvalidCursorError,
     NotFoundError,
     RegistrationDisabledError,
     ServiceError,
     UnauthorizedError,
     UserDeletionDisabledError,
     ValidationError,
+    invalidate_user,
 )
 from ._base_template import BaseTemplateService
+from ._bulk import BULK_IDS_PATTERN, BULK_MAX_IDS, BaseBulkSessionService, BulkResponse
+from ._cursor import BaseCursorSessionService, CursorPage
 
 __all__ = [
+    "BULK_IDS_PATTERN",
+    "BULK_MAX_IDS",
+    "BaseBulkSessionService",
+    "BaseCursorSessionService",
     "BaseService",
     "BaseSessionService",
     "BaseTemplateService",
     "BaseUserAuthenticatedService",
+    "BulkResponse",
     "ConflictError",
+    "CursorPage",
     "EmptyUpdateError",
+    "InvalidCursorError",
     "NotFoundError",
     "RegistrationDisabledError",
     "ServiceError",
     "UnauthorizedError",
     "UserDeletionDisabledError",
     "ValidationError",
+    "invalidate_user",
 ]
@@ -1,19 +1,30 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 import jwt
 from fastapi_pagination import Page
 from jwt import ExpiredSignatureError, InvalidSignatureError, InvalidTokenError
-from sqlalchemy import Select, select
+from sqlalchemy import Select, inspect, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from futuramaapi.core import settings
+from futuramaapi.db.auth_sessions import auth_revocations, auth_session_cache
+from futuramaapi.db.metrics import DEFAULT_QUERY_SOURCE, query_source
 from futuramaapi.db.models import UserModel
 from futuramaapi.db.session import session_manager
+from futuramaapi.helpers.caches import TTLCache
+from futuramaapi.helpers.metrics import Counter, Histogram, metrics
 from futuramaapi.helpers.pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from contextvars import Token
+
 TResponse = TypeVar(
     "TResponse",
     bound=BaseModel | Sequence[BaseModel] | Page[BaseModel] | None,
@@ -48,22 +59,108 @@ class EmptyUpdateError(ValidationError):
     """Empty Update Error."""
 
 
+class InvalidCursorError(ValidationError):
+    """Invalid Cursor Error."""
+
+
 class UserDeletionDisabledError(ServiceError):
     """User Deletion Disabled Error."""
 
 
+# Verified access token -> decoded claims.
+token_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    ttl=settings.auth_cache_ttl,
+    max_size=settings.auth_cache_max_size,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedUser:
+    cached_at: float
+    columns: dict[str, Any]
+
+
+# Credentials are never kept in memory longer than a request, cached users carry a placeholder instead. It is only
+# ever rendered masked and is never written back, since unchanged columns aren't flushed. Services verifying
+# the password load the user themselves.
+_REDACTED_USER_COLUMNS: dict[str, Any] = {"password": "**********"}
+# User id -> column values of the user, with ``_REDACTED_USER_COLUMNS`` left out.
+user_cache: TTLCache[int, _CachedUser] = TTLCache(
+    ttl=settings.auth_cache_ttl,
+    max_size=settings.auth_cache_max_size,
+)
+
+
+async def invalidate_user(user_id: int, /) -> None:
+    """
+    Drop the cached user in every process, must be called by anything changing a user row once it's committed.
+
+    Other processes drop the user on their next cache hit, see ``Revocations``.
+    """
+    user_cache.delete(user_id)
+    await auth_session_cache.invalidate_user(user_id)
+
+
+service_duration: Histogram = metrics.histogram(
+    "service_duration_seconds",
+    "Service call time, including its queries.",
+    labels=["service"],
+)
+service_errors: Counter = metrics.counter(
+    "service_errors_total",
+    "Service calls that raised.",
+    labels=["service"],
+)
+
+
+def _instrument(call: Callable[..., Awaitable[Any]], /) -> Callable[..., Awaitable[Any]]:
+    @wraps(call)
+    async def wrapper(self: "BaseService", *args: Any, **kwargs: Any) -> Any:
+        # Services calling ``super().__call__`` or other services are recorded once, by the outermost call.
+        if query_source.get() != DEFAULT_QUERY_SOURCE:
+            return await call(self, *args, **kwargs)
+
+        name: str = type(self).__name__
+        token: Token[str] = query_source.set(name)
+        started_at: float = perf_counter()
+        try:
+            return await call(self, *args, **kwargs)
+        except Exception:
+            service_errors.inc(name)
+            raise
+        finally:
+            service_duration.observe(perf_counter() - started_at, name)
+            query_source.reset(token)
+
+    return wrapper
+
+
 class BaseService[TResponse](BaseModel, ABC):
     """Base interface for async application services."""
 
     context: dict[str, Any] | None = None
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        if "__call__" in cls.__dict__ and not getattr(cls.__call__, "__isabstractmethod__", False):
+            cls.__call__ = _instrument(cls.__call__)  # type: ignore[method-assign]
+
     @abstractmethod
     async def __call__(self, *args, **kwargs) -> TResponse:
         """Execute service logic."""
 
 
 class BaseSessionService[TResponse](BaseService[TResponse], ABC):
-    """Base service with managed database session."""
+    """
+    Base service with managed database session.
+
+    Attributes:
+        readonly: Whether the service only reads, its session may then be served by a read replica.
+    """
+
+    readonly: ClassVar[bool] = False
 
     def __init__(self, /, **data: Any) -> None:
         super().__init__(**data)
@@ -72,11 +169,21 @@ class BaseSessionService[TResponse](BaseService[TResponse], ABC):
 
     @property
     def session(self) -> AsyncSession:
+        """Session of the service, created on first use, so paths not touching the database never acquire one."""
         if self._session is None:
-            raise RuntimeError("Session is not initialized")
+            self._session = session_manager.create_session(readonly=self.readonly)
 
         return self._session
 
+    async def _close_session(self) -> None:
+        """Close the session and return its connection to the pool, ``self.session`` opens a new one if used again."""
+        if self._session is None:
+            return
+
+        session: AsyncSession = self._session
+        self._session = None
+        await session.close()
+
     @abstractmethod
     async def process(self, *args, **kwargs) -> TResponse:
         """
@@ -85,11 +192,18 @@ class BaseSessionService[TResponse](BaseService[TResponse], ABC):
         A database session is available via ``self.session``.
         """
 
-    async def __call__(self, *args, **kwargs) -> TResponse:
-        async with session_manager.session() as session:
-            self._session = session
+    async def _execute(self, *args, **kwargs) -> TResponse:
+        return await self.process(*args, **kwargs)
 
-            return await self.process(*args, **kwargs)
+    async def __call__(self, *args, **kwargs) -> TResponse:
+        try:
+            return await self._execute(*args, **kwargs)
+        except Exception:
+            if self._session is not None:
+                await self._session.rollback()
+            raise
+        finally:
+            await self._close_session()
 
 
 class BaseUserAuthenticatedService[TResponse](BaseSessionService[TResponse], ABC):
@@ -114,6 +228,10 @@ class BaseUserAuthenticatedService[TResponse](BaseSessionService[TResponse], ABC
         *,
         algorithm="HS256",
     ) -> dict[str, Any]:
+        decoded_token: dict[str, Any] | None = token_cache.get(self.token)
+        if decoded_token is not None:
+            return decoded_token
+
         try:
             decoded_token: dict[str, Any] = jwt.decode(
                 self.token,
@@ -126,22 +244,60 @@ class BaseUserAuthenticatedService[TResponse](BaseSessionService[TResponse], ABC
         if decoded_token["type"] != "access":
             raise UnauthorizedError() from None
 
+        # Never serve a token from the cache past its expiration.
+        expires_at: float | None = decoded_token.get("exp")
+        token_cache.set(self.token, decoded_token, ttl=None if expires_at is None else expires_at - time())
         return decoded_token
 
-    @property
-    def __get_user_statement(self) -> Select[tuple[UserModel]]:
-        decoded_token: dict[str, Any] = self.__get_decoded_token()
-        return select(UserModel).where(UserModel.id == decoded_token["user"]["id"])
+    @staticmethod
+    def __get_user_statement(pk: int, /) -> Select[tuple[UserModel]]:
+        return select(UserModel).where(UserModel.id == pk)
+
+    @staticmethod
+    async def __get_cached_user(pk: int, /) -> UserModel | None:
+        cached: _CachedUser | None = user_cache.get(pk)
+        if cached is None:
+            return None
+
+        if await auth_revocations.is_revoked(cached.cached_at, f"user:{pk}"):
+            user_cache.delete(pk)
+            return None
+
+        # Every request gets its own detached copy, changes are flushed once it's added to the session.
+        user: UserModel = UserModel(**cached.columns, **_REDACTED_USER_COLUMNS)
+        make_transient_to_detached(user)
+        return user
+
+    @staticmethod
+    def __cache_user(user: UserModel, cached_at: float, /) -> None:
+        user_cache.set(
+            user.id,
+            _CachedUser(
+                cached_at=cached_at,
+                columns={
+                    attr.key: getattr(user, attr.key)
+                    for attr in inspect(UserModel).column_attrs
+                    if attr.key not in _REDACTED_USER_COLUMNS
+                },
+            ),
+        )
 
     async def __set_user(self) -> None:
+        pk: int = self.__get_decoded_token()["user"]["id"]
+        self._user = await self.__get_cached_user(pk)
+        if self._user is not None:
+            return
+
+        # Taken before the query, so a revocation committed while the row is read is never missed.
+        cached_at: float = time()
         try:
-            self._user = (await self.session.execute(self.__get_user_statement)).scalars().one()
+            self._user = (await self.session.execute(self.__get_user_statement(pk))).scalars().one()
         except NoResultFound:
             raise UnauthorizedError() from None
 
-    async def __call__(self, *args, **kwargs) -> TResponse:
-        async with session_manager.session() as session:
-            self._session = session
-            await self.__set_user()
+        self.__cache_user(self._user, cached_at)
+
+    async def _execute(self, *args, **kwargs) -> TResponse:
+        await self.__set_user()
 
-            return await self.process(*args, **kwargs)
+        return await self.process(*args, **kwargs)
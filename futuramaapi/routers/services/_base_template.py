@@ -1,16 +1,20 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from typing import Any, ClassVar
 
 from fastapi import Request
+from fastapi.responses import HTMLResponse
 from pydantic import Field
-from sqlalchemy import Result, Select, select
-from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.templating import _TemplateResponse
 
 from futuramaapi.__version__ import __version__
 from futuramaapi.core import settings
-from futuramaapi.db.models import AuthSessionModel, UserModel
+from futuramaapi.db.auth_sessions import SessionUser, auth_session_cache
+from futuramaapi.db.session import session_manager
+from futuramaapi.helpers.caches import TTLCache
+from futuramaapi.helpers.profiling import profile_phase
 from futuramaapi.helpers.pydantic import BaseModel
 from futuramaapi.helpers.templates import templates
 from futuramaapi.utils import config, metadata
@@ -38,15 +42,22 @@ class _ProjectContext(BaseModel):
 _project_context: _ProjectContext = _ProjectContext()
 
 
-class BaseTemplateService(BaseSessionService[_TemplateResponse], ABC):
+async def _run_in_session[T](query: Callable[[AsyncSession], Awaitable[T]], /, *, readonly: bool = False) -> T:
+    async with session_manager.session(readonly=readonly) as session:
+        return await query(session)
+
+
+class BaseTemplateService(BaseSessionService[HTMLResponse], ABC):
     """
     Base service for rendering templates with a populated request context.
 
     Attributes:
         template_name: Name of the template to render. Must be set in subclasses.
+        page_cache: Rendered pages by path, served to visitors without an auth cookie. Disabled if not set.
     """
 
     template_name: ClassVar[str]
+    page_cache: ClassVar[TTLCache[str, bytes] | None] = None
 
     _cookie_auth_key: ClassVar[str] = "Authorization"
 
@@ -64,37 +75,62 @@ class BaseTemplateService(BaseSessionService[_TemplateResponse], ABC):
         return self.context["request"]
 
     @property
-    def __auth_session_statement(self) -> Select[tuple[AuthSessionModel]]:
-        return (
-            select(AuthSessionModel)
-            .where(AuthSessionModel.key == self.request.cookies[self._cookie_auth_key])
-            .options(selectinload(AuthSessionModel.user))
-        )
-
-    async def _get_current_user(self) -> UserModel | None:
-        if self._cookie_auth_key not in self.request.cookies:
-            return None
+    def is_anonymous(self) -> bool:
+        return self._cookie_auth_key not in self.request.cookies
 
-        result: Result[tuple[AuthSessionModel]] = await self.session.execute(self.__auth_session_statement)
-        try:
-            auth_session: AuthSessionModel = result.scalars().one()
-        except NoResultFound:
-            return None
+    async def _gather(self, *queries: Callable[[AsyncSession], Awaitable[Any]]) -> list[Any]:
+        """
+        Run independent read-only queries concurrently, each on its own pooled connection.
 
-        if not auth_session.valid:
+        Falls back to running them one by one on ``self.session`` while the pool can't spare the connections,
+        so a busy process doesn't queue up on the pool for a single page.
+        """
+        if len(queries) > 1 and session_manager.has_spare_connections(len(queries)):
+            return list(await asyncio.gather(*(_run_in_session(query, readonly=True) for query in queries)))
+
+        return [await query(self.session) for query in queries]
+
+    async def _get_current_user(self, session: AsyncSession, /) -> SessionUser | None:
+        if self.is_anonymous:
             return None
 
-        return auth_session.user
+        return await auth_session_cache.get_user(session, self.request.cookies[self._cookie_auth_key])
 
     async def _get_context(self) -> dict[str, Any]:
-        context: dict[str, Any] = await self.get_context()
+        context: dict[str, Any]
+        current_user: SessionUser | None
+        if self.is_anonymous:
+            context, current_user = await self.get_context(), None
+        elif session_manager.has_spare_connections():
+            context, current_user = await asyncio.gather(
+                self.get_context(),
+                _run_in_session(self._get_current_user),
+            )
+        else:
+            context = await self.get_context()
+            current_user = await self._get_current_user(self.session)
+
         context["_project"] = _project_context
-        context["current_user"] = await self._get_current_user()
+        context["current_user"] = current_user
         return context
 
-    async def process(self, *args, **kwargs) -> _TemplateResponse:
-        return templates.TemplateResponse(
-            self.request,
-            self.template_name,
-            context=await self._get_context(),
-        )
+    async def _render(self) -> _TemplateResponse:
+        context: dict[str, Any] = await self._get_context()
+        with profile_phase("render"):
+            return templates.TemplateResponse(
+                self.request,
+                self.template_name,
+                context=context,
+            )
+
+    async def process(self, *args, **kwargs) -> HTMLResponse:
+        if self.page_cache is None or not self.is_anonymous:
+            return await self._render()
+
+        content: bytes | None = self.page_cache.get(self.request.url.path)
+        if content is not None:
+            return HTMLResponse(content)
+
+        response: _TemplateResponse = await self._render()
+        self.page_cache.set(self.request.url.path, bytes(response.body))
+        return response
@@ -0,0 +1,80 @@
+from abc import ABC
+from collections.abc import Mapping, Sequence
+from typing import Any, ClassVar
+
+from pydantic import Field, field_validator
+
+from futuramaapi.db import INT32, Base
+from futuramaapi.helpers.pydantic import BaseModel
+
+from ._base import BaseSessionService
+
+BULK_MAX_IDS: int = 100
+# Comma separated ids, validated by the endpoints so that malformed ids are rejected with 422.
+BULK_IDS_PATTERN: str = rf"^\d{{1,10}}(,\d{{1,10}}){{0,{BULK_MAX_IDS - 1}}}$"
+
+
+class BulkResponse[TItem](BaseModel):
+    items: list[TItem | None] = Field(
+        description="Items in the order of the requested ids, ``null`` for the ids that don't exist.",
+    )
+    missing: list[int] = Field(
+        description="Requested ids that don't exist.",
+    )
+
+
+class BaseBulkSessionService[TItem](BaseSessionService[BulkResponse[TItem]], ABC):
+    """
+    Base service fetching many items by id at once.
+
+    Items are fetched with a single ``Base.get_many`` query, or from ``get_cached_items`` when it returns the
+    items, so one request replaces a request per id. Ids are accepted as a list or a comma separated string.
+    """
+
+    readonly: ClassVar[bool] = True
+
+    model: ClassVar[type[Base]]
+    item_model: ClassVar[type[BaseModel]]
+
+    ids: list[int] = Field(
+        min_length=1,
+        max_length=BULK_MAX_IDS,
+    )
+
+    @field_validator("ids", mode="before")
+    @classmethod
+    def split_ids(cls, value: Any, /) -> Any:
+        if isinstance(value, str):
+            return value.split(",")
+        return value
+
+    @property
+    def _unique_ids(self) -> list[int]:
+        # Ids out of the column range can't exist, and would fail the query.
+        return [id_ for id_ in dict.fromkeys(self.ids) if 0 < id_ <= INT32]
+
+    def get_cached_items(self) -> Mapping[int, Any] | None:
+        """
+        In-memory items by id.
+
+        Return ``None`` to fetch the items from the database.
+        """
+        return None
+
+    def _get_response(self, items: Mapping[int, Any], /) -> BulkResponse[TItem]:
+        found: list[Any | None] = [items.get(id_) for id_ in self.ids]
+        return BulkResponse[self.item_model](  # type: ignore[valid-type]
+            items=found,
+            missing=list(dict.fromkeys(id_ for id_, item in zip(self.ids, found, strict=True) if item is None)),
+        )
+
+    async def process(self, *args, **kwargs) -> BulkResponse[TItem]:
+        items: Mapping[int, Any] | None = self.get_cached_items()
+        if items is not None:
+            return self._get_response(items)
+
+        if not self._unique_ids:
+            return self._get_response({})
+
+        models: Sequence[Any] = await self.model.get_many(self.session, self._unique_ids)
+        return self._get_response({model.id: model for model in models})
@@ -0,0 +1,133 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import Any, ClassVar, Literal
+
+from pydantic import Field
+from sqlalchemy import Select, func
+
+from futuramaapi.db import Base
+from futuramaapi.helpers.cursors import decode_cursor, encode_cursor
+from futuramaapi.helpers.pydantic import BaseModel
+
+from ._base import BaseSessionService, InvalidCursorError
+
+
+class CursorPage[TItem](BaseModel):
+    items: list[TItem]
+    size: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor of the next page, pass it as ``after``. Empty on the last page.",
+    )
+    total: int | None = Field(
+        default=None,
+        description="Total number of items, only returned when requested.",
+    )
+
+
+class BaseCursorSessionService[TItem](BaseSessionService[CursorPage[TItem]], ABC):
+    """
+    Base service for keyset (cursor) pagination over ``(order_by, id)``.
+
+    Unlike offset pagination the cost of a page does not depend on its depth, and the total count is
+    only queried when ``include_total`` is set.
+    """
+
+    readonly: ClassVar[bool] = True
+
+    model: ClassVar[type[Base]]
+    item_model: ClassVar[type[BaseModel]]
+
+    after: str | None = None
+    size: int = Field(50, ge=1, le=100)
+    include_total: bool = False
+
+    order_by: str = "id"
+    direction: Literal["asc", "desc"] = "asc"
+
+    @property
+    @abstractmethod
+    def statement(self) -> Select:
+        """Filtered statement, ordering and the keyset condition are added by the service."""
+
+    def get_cached_items(self) -> Sequence[Any] | None:
+        """
+        Filtered in-memory items ordered by keyset ascending, regardless of ``direction``.
+
+        Return ``None`` to paginate in the database.
+        """
+        return None
+
+    def _get_after(self) -> tuple[Any, ...] | None:
+        if self.after is None:
+            return None
+
+        try:
+            after: tuple[Any, ...] = decode_cursor(self.after)
+            self.model.validate_keyset(after, field_name=self.order_by)
+        except ValueError:
+            raise InvalidCursorError() from None
+
+        return after
+
+    def _get_keyset(self, item: Any, /) -> tuple[Any, ...]:
+        return self.model.get_keyset(item, field_name=self.order_by)
+
+    def _get_page(self, items: Sequence[Any], /, *, total: int | None = None) -> CursorPage[TItem]:
+        next_cursor: str | None = None
+        if len(items) > self.size:
+            items = items[: self.size]
+            next_cursor = encode_cursor(self._get_keyset(items[-1]))
+
+        return CursorPage[self.item_model](  # type: ignore[valid-type]
+            items=items,
+            size=self.size,
+            next_cursor=next_cursor,
+            total=total,
+        )
+
+    def _paginate_cached(self, items: Sequence[Any], /) -> CursorPage[TItem]:
+        after: tuple[Any, ...] | None = self._get_after()
+        total: int | None = len(items) if self.include_total else None
+
+        if self.direction == "desc":
+            end: int = len(items) if after is None else bisect_left(items, after, key=self._get_keyset)
+            return self._get_page(items[max(end - self.size - 1, 0) : end][::-1], total=total)
+
+        start: int = 0 if after is None else bisect_right(items, after, key=self._get_keyset)
+        return self._get_page(items[start : start + self.size + 1], total=total)
+
+    async def _count(self) -> int:
+        statement: Select = self.statement.with_only_columns(func.count(), maintain_column_froms=True)
+        return (await self.session.execute(statement)).scalar_one()
+
+    async def _paginate(self) -> CursorPage[TItem]:
+        after: tuple[Any, ...] | None = self._get_after()
+
+        statement: Select = self.statement
+        if after is not None:
+            statement = statement.where(
+                self.model.get_keyset_cond(
+                    after,
+                    field_name=self.order_by,
+                    direction=self.direction,
+                )
+            )
+        statement = statement.order_by(
+            *(
+                self.model.get_order_by(field_name=field.key, direction=self.direction)
+                for field in self.model.get_keyset_fields(field_name=self.order_by)
+            )
+        ).limit(self.size + 1)
+
+        items: Sequence[Any] = (await self.session.execute(statement)).scalars().all()
+        total: int | None = await self._count() if self.include_total else None
+        return self._get_page(items, total=total)
+
+    async def process(self, *args, **kwargs) -> CursorPage[TItem]:
+        items: Sequence[Any] | None = self.get_cached_items()
+        if items is not None:
+            return self._paginate_cached(items)
+
+        return await self._paginate()
@@ -69,7 +69,7 @@ class AuthCookieSessionUserService(BaseSessionService[RedirectResponse]):
                 status_code=status.HTTP_302_FOUND,
             )
 
-        if not self.hasher.verify(self.password.get_secret_value(), user.password):
+        if not await self.hasher.averify(self.password.get_secret_value(), user.password):
             return RedirectResponse(
                 url=f"/auth?messageType={UserAuthMessageType.incorrect_login}",
                 status_code=status.HTTP_302_FOUND,
@@ -2,15 +2,11 @@ from typing import ClassVar
 
 from fastapi import Request, status
 from fastapi.responses import RedirectResponse
-from sqlalchemy import Update, update
 
-from futuramaapi.db.models import AuthSessionModel
+from futuramaapi.db.auth_sessions import auth_session_cache
 from futuramaapi.routers.services import BaseSessionService
 
 
-class CookieAuthKeyIsNotDefinedError(Exception): ...
-
-
 class LogoutCookieSessionUserService(BaseSessionService[RedirectResponse]):
     cookie_auth_key: ClassVar[str] = "Authorization"
 
@@ -24,25 +20,15 @@ class LogoutCookieSessionUserService(BaseSessionService[RedirectResponse]):
 
         return self.context["request"]
 
-    @property
-    def _expire_session_statement(self) -> Update:
-        try:
-            key: str = self.request.cookies[self.cookie_auth_key]
-        except KeyError:
-            raise CookieAuthKeyIsNotDefinedError() from None
-
-        return update(AuthSessionModel).where(AuthSessionModel.key == key).values(expired=True)
-
     async def process(self, *args, **kwargs) -> RedirectResponse:
-        try:
-            await self.session.execute(self._expire_session_statement)
-        except CookieAuthKeyIsNotDefinedError:
+        key: str | None = self.request.cookies.get(self.cookie_auth_key)
+        if key is None:
             return RedirectResponse(
                 "/auth",
                 status_code=status.HTTP_302_FOUND,
             )
 
-        await self.session.commit()
+        await auth_session_cache.expire(self.session, key)
 
         response: RedirectResponse = RedirectResponse(
             "/auth",
@@ -101,7 +101,7 @@ class SignupCookieSessionUserService(BaseSessionService[RedirectResponse]):
             surname=self.surname,
             email=self.email,
             username=self.username,
-            password=self.hasher.encode(self.password.get_secret_value()),
+            password=await self.hasher.aencode(self.password.get_secret_value()),
         )
         self.session.add(user)
 
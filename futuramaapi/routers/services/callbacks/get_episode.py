@@ -1,7 +1,5 @@
-from fastapi import BackgroundTasks
-
 from futuramaapi.routers.services import BaseService
-from futuramaapi.workers._background_tasks.tasks.callbacks.get_episode import get_episode_callback_task
+from futuramaapi.workers._dramatiq.tasks import schedule_callback
 
 from ._base import (
     CallbackRequest,
@@ -13,10 +11,10 @@ class GetEpisodeCallbackService(BaseService):
     request_data: CallbackRequest
     id: int
 
-    async def __call__(self, background_tasks: BackgroundTasks, *args, **kwargs) -> CallbackResponse:
+    async def __call__(self, *args, **kwargs) -> CallbackResponse:
         response: CallbackResponse = CallbackResponse()
-        await get_episode_callback_task(
-            background_tasks,
+        await schedule_callback(
+            "Episode",
             self.id,
             response.delay,
             self.request_data.callback_url,
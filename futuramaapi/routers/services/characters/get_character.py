@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 from datetime import datetime
+from typing import ClassVar
 
 from fastapi_storages import StorageImage
 from pydantic import HttpUrl, field_validator
@@ -6,9 +8,11 @@ from sqlalchemy import Select, select
 from sqlalchemy.exc import NoResultFound
 
 from futuramaapi.core import settings
+from futuramaapi.db import Base
+from futuramaapi.db.catalog import CatalogCharacter, catalog
 from futuramaapi.db.models import CharacterModel
 from futuramaapi.helpers.pydantic import BaseModel
-from futuramaapi.routers.services import BaseSessionService, NotFoundError
+from futuramaapi.routers.services import BaseBulkSessionService, BaseSessionService, NotFoundError
 
 
 class GetCharacterResponse(BaseModel):
@@ -31,16 +35,38 @@ class GetCharacterResponse(BaseModel):
 
 
 class GetCharacterService(BaseSessionService[GetCharacterResponse]):
+    readonly: ClassVar[bool] = True
+
     pk: int
 
     @property
     def statement(self) -> Select[tuple[CharacterModel]]:
         return select(CharacterModel).where(CharacterModel.id == self.pk)
 
+    def _get_cached(self) -> GetCharacterResponse:
+        try:
+            return GetCharacterResponse.model_validate(catalog.characters[self.pk])
+        except KeyError:
+            raise NotFoundError("Character not found") from None
+
     async def process(self, *args, **kwargs) -> GetCharacterResponse:
+        if catalog.is_loaded:
+            return self._get_cached()
+
         try:
             result: CharacterModel = (await self.session.execute(self.statement)).scalars().one()
         except NoResultFound:
             raise NotFoundError("Character not found") from None
 
         return GetCharacterResponse.model_validate(result)
+
+
+class GetCharactersBulkService(BaseBulkSessionService[GetCharacterResponse]):
+    model: ClassVar[type[Base]] = CharacterModel
+    item_model: ClassVar[type[BaseModel]] = GetCharacterResponse
+
+    def get_cached_items(self) -> Mapping[int, CatalogCharacter] | None:
+        if not catalog.is_loaded:
+            return None
+
+        return catalog.characters
@@ -1,12 +1,18 @@
-from typing import Literal
+import re
+from enum import Enum
+from typing import ClassVar, Literal
 
 from fastapi_pagination import Page
+from fastapi_pagination import paginate as paginate_items
 from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import Field
 from sqlalchemy import ColumnElement, Select, UnaryExpression, select
 
+from futuramaapi.db import Base
+from futuramaapi.db.catalog import CatalogCharacter, catalog
 from futuramaapi.db.models import CharacterModel
-from futuramaapi.routers.services import BaseSessionService
+from futuramaapi.helpers.pydantic import BaseModel
+from futuramaapi.routers.services import BaseCursorSessionService, BaseSessionService
 
 from .get_character import GetCharacterResponse
 
@@ -15,7 +21,37 @@ class ListCharactersResponse(GetCharacterResponse):
     pass
 
 
-class ListCharactersService(BaseSessionService[Page[ListCharactersResponse]]):
+def _like_to_regex(pattern: str, /) -> re.Pattern[str]:
+    # Mirrors PostgreSQL ``ILIKE`` semantics with the default backslash escape character.
+    regex: str = ""
+    escaped: bool = False
+    for char in pattern:
+        if escaped:
+            regex += re.escape(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "%":
+            regex += ".*"
+        elif char == "_":
+            regex += "."
+        else:
+            regex += re.escape(char)
+
+    return re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+
+def _is_enum_matched(value: Enum, filter_: str | None, /) -> bool:
+    if filter_ is None:
+        return True
+
+    if filter_.startswith("!"):
+        return value.name != filter_[1:].upper()
+
+    return value.name == filter_.upper()
+
+
+class _CharactersFilterMixin(BaseModel):
     gender: str | None
     character_status: str | None
     species: str | None
@@ -28,7 +64,7 @@ class ListCharactersService(BaseSessionService[Page[ListCharactersResponse]]):
     )
 
     @property
-    def __where(self) -> list[ColumnElement[bool]]:
+    def where(self) -> list[ColumnElement[bool]]:
         where: list[ColumnElement[bool]] = []
 
         if self.gender is not None:
@@ -54,6 +90,21 @@ class ListCharactersService(BaseSessionService[Page[ListCharactersResponse]]):
 
         return where
 
+    def filter_cached(self) -> list[CatalogCharacter]:
+        query: re.Pattern[str] | None = _like_to_regex(self.query) if self.query is not None else None
+        return [
+            character
+            for character in catalog.characters.values()
+            if _is_enum_matched(character.gender, self.gender)
+            and _is_enum_matched(character.status, self.character_status)
+            and _is_enum_matched(character.species, self.species)
+            and (query is None or query.fullmatch(character.name) is not None)
+        ]
+
+
+class ListCharactersService(_CharactersFilterMixin, BaseSessionService[Page[ListCharactersResponse]]):
+    readonly: ClassVar[bool] = True
+
     @property
     def __order_by(self) -> UnaryExpression[CharacterModel]:
         order_by = CharacterModel.str_to_field(self.order_by)
@@ -65,10 +116,35 @@ class ListCharactersService(BaseSessionService[Page[ListCharactersResponse]]):
     @property
     def statement(self) -> Select[tuple[CharacterModel]]:
         statement: Select[tuple[CharacterModel]] = select(CharacterModel)
-        return statement.where(*self.__where).order_by(self.__order_by)
+        return statement.where(*self.where).order_by(self.__order_by)
+
+    def _get_cached(self) -> Page[ListCharactersResponse]:
+        characters: list[CatalogCharacter] = self.filter_cached()
+        if self.direction == "desc":
+            characters.reverse()
+
+        return paginate_items(characters, safe=True)
 
     async def process(self, *args, **kwargs) -> Page[ListCharactersResponse]:
+        if catalog.is_loaded:
+            return self._get_cached()
+
         return await paginate(
             self.session,
             self.statement,
         )
+
+
+class ListCharactersCursorService(_CharactersFilterMixin, BaseCursorSessionService[ListCharactersResponse]):
+    model: ClassVar[type[Base]] = CharacterModel
+    item_model: ClassVar[type[BaseModel]] = ListCharactersResponse
+
+    @property
+    def statement(self) -> Select[tuple[CharacterModel]]:
+        return select(CharacterModel).where(*self.where)
+
+    def get_cached_items(self) -> list[CatalogCharacter] | None:
+        if not catalog.is_loaded:
+            return None
+
+        return self.filter_cached()
@@ -0,0 +1,79 @@
+import re
+from typing import ClassVar
+
+from pydantic import Field
+from sqlalchemy import ColumnElement, Select, and_, false, func, or_, select
+
+from futuramaapi.db.catalog import catalog
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.db.search import NGramIndex, character_names, get_words
+from futuramaapi.routers.services import BaseSessionService
+
+from .get_character import GetCharacterResponse
+
+
+class SearchCharacterResponse(GetCharacterResponse):
+    pass
+
+
+class SearchCharactersService(BaseSessionService[list[SearchCharacterResponse]]):
+    """
+    Typeahead search of characters by name.
+
+    Characters with a name word starting with the last typed word come first, the rest are ranked by trigram
+    similarity. Served from the catalog's n-gram index when the catalog is loaded, otherwise by PostgreSQL
+    through the ``pg_trgm`` GIN index on ``characters.name``.
+    """
+
+    readonly: ClassVar[bool] = True
+    index: ClassVar[NGramIndex] = character_names
+
+    query: str = Field(
+        min_length=1,
+        max_length=128,
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=25,
+    )
+
+    def _get_cached(self) -> list[SearchCharacterResponse]:
+        return [
+            SearchCharacterResponse.model_validate(catalog.characters[match.id])
+            for match in self.index.search(self.query, limit=self.limit)
+        ]
+
+    @property
+    def _is_prefix(self) -> ColumnElement[bool]:
+        words: list[str] = get_words(self.query)
+        if not words:
+            return false()
+
+        # ``\m`` matches the beginning of a word, the same way the n-gram index splits words.
+        return and_(
+            *(CharacterModel.name.regexp_match(rf"\m{re.escape(word)}\M", flags="i") for word in words[:-1]),
+            CharacterModel.name.regexp_match(rf"\m{re.escape(words[-1])}", flags="i"),
+        )
+
+    @property
+    def statement(self) -> Select[tuple[CharacterModel]]:
+        is_prefix: ColumnElement[bool] = self._is_prefix
+        return (
+            select(CharacterModel)
+            .where(or_(is_prefix, CharacterModel.name.op("%")(self.query)))
+            .order_by(
+                is_prefix.desc(),
+                func.similarity(CharacterModel.name, self.query).desc(),
+                func.length(CharacterModel.name),
+                CharacterModel.id,
+            )
+            .limit(self.limit)
+        )
+
+    async def process(self, *args, **kwargs) -> list[SearchCharacterResponse]:
+        if catalog.is_loaded:
+            return self._get_cached()
+
+        characters: list[CharacterModel] = list((await self.session.execute(self.statement)).scalars().all())
+        return [SearchCharacterResponse.model_validate(character) for character in characters]
@@ -1,13 +1,17 @@
+from collections.abc import Mapping
 from datetime import date, datetime
+from typing import ClassVar
 
 from pydantic import Field, computed_field
 from sqlalchemy import Select, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload
 
+from futuramaapi.db import Base
+from futuramaapi.db.catalog import CatalogEpisode, catalog
 from futuramaapi.db.models import EpisodeModel
 from futuramaapi.helpers.pydantic import BaseModel
-from futuramaapi.routers.services import BaseSessionService, NotFoundError
+from futuramaapi.routers.services import BaseBulkSessionService, BaseSessionService, NotFoundError
 
 
 class GetEpisodeResponse(BaseModel):
@@ -42,16 +46,38 @@ class GetEpisodeResponse(BaseModel):
 
 
 class GetEpisodeService(BaseSessionService[GetEpisodeResponse]):
+    readonly: ClassVar[bool] = True
+
     pk: int
 
     @property
     def statement(self) -> Select:
         return select(EpisodeModel).where(EpisodeModel.id == self.pk).options(selectinload(EpisodeModel.season))
 
+    def _get_cached(self) -> GetEpisodeResponse:
+        try:
+            return GetEpisodeResponse.model_validate(catalog.episodes[self.pk])
+        except KeyError:
+            raise NotFoundError("Episode not found") from None
+
     async def process(self, *args, **kwargs) -> GetEpisodeResponse:
+        if catalog.is_loaded:
+            return self._get_cached()
+
         try:
             season_model: EpisodeModel = (await self.session.execute(self.statement)).scalars().one()
         except NoResultFound:
             raise NotFoundError("Episode not found") from None
 
         return GetEpisodeResponse.model_validate(season_model)
+
+
+class GetEpisodesBulkService(BaseBulkSessionService[GetEpisodeResponse]):
+    model: ClassVar[type[Base]] = EpisodeModel
+    item_model: ClassVar[type[BaseModel]] = GetEpisodeResponse
+
+    def get_cached_items(self) -> Mapping[int, CatalogEpisode] | None:
+        if not catalog.is_loaded:
+            return None
+
+        return catalog.episodes
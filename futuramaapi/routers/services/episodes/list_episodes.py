@@ -1,10 +1,17 @@
+from typing import ClassVar
+
 from fastapi_pagination import Page
+from fastapi_pagination import paginate as paginate_items
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import Select, select
 from sqlalchemy.orm import selectinload
 
+from futuramaapi.db import Base
+from futuramaapi.db.catalog import CatalogEpisode, catalog
 from futuramaapi.db.models import EpisodeModel
+from futuramaapi.helpers.pydantic import BaseModel
 from futuramaapi.routers.services._base import BaseSessionService
+from futuramaapi.routers.services._cursor import BaseCursorSessionService
 from futuramaapi.routers.services.episodes.get_episode import GetEpisodeResponse
 
 
@@ -13,12 +20,32 @@ class ListEpisodesResponse(GetEpisodeResponse):
 
 
 class ListEpisodesService(BaseSessionService[Page[ListEpisodesResponse]]):
+    readonly: ClassVar[bool] = True
+
     @property
     def statement(self) -> Select:
         return select(EpisodeModel).filter().options(selectinload(EpisodeModel.season))
 
     async def process(self, *args, **kwargs) -> Page[ListEpisodesResponse]:
+        if catalog.is_loaded:
+            return paginate_items(list(catalog.episodes.values()), safe=True)
+
         return await paginate(
             self.session,
             self.statement,
         )
+
+
+class ListEpisodesCursorService(BaseCursorSessionService[ListEpisodesResponse]):
+    model: ClassVar[type[Base]] = EpisodeModel
+    item_model: ClassVar[type[BaseModel]] = ListEpisodesResponse
+
+    @property
+    def statement(self) -> Select:
+        return select(EpisodeModel).options(selectinload(EpisodeModel.season))
+
+    def get_cached_items(self) -> list[CatalogEpisode] | None:
+        if not catalog.is_loaded:
+            return None
+
+        return list(catalog.episodes.values())
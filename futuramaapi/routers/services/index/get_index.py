@@ -6,7 +6,9 @@ from aiocache import cached
 from sqlalchemy import Result, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from futuramaapi.core import settings
 from futuramaapi.db.models import CharacterModel, RequestsCounterModel, SystemMessage, UserModel
+from futuramaapi.helpers.caches import TTLCache
 from futuramaapi.routers.services import BaseTemplateService
 
 _TOTAL_REQUESTS_TTL: Final[int] = 60 * 60
@@ -36,24 +38,37 @@ async def _get_total_requests(session: AsyncSession, /) -> _CachedTotalRequest:
 
 class GetIndexService(BaseTemplateService):
     template_name: ClassVar[str] = "index.html"
+    page_cache: ClassVar[TTLCache[str, bytes] | None] = TTLCache(
+        ttl=settings.index_page_cache_ttl,
+        max_size=1,
+    )
 
-    async def __get_user_count(self) -> int:
-        result: Result = await self.session.execute(func.count(UserModel.id))
+    @staticmethod
+    async def __get_user_count(session: AsyncSession, /) -> int:
+        result: Result = await session.execute(func.count(UserModel.id))
         return result.scalar()
 
-    async def __get_characters(self) -> Sequence[CharacterModel]:
+    @staticmethod
+    async def __get_characters(session: AsyncSession, /) -> Sequence[CharacterModel]:
         statement: Select[tuple[CharacterModel]] = select(CharacterModel).limit(12).order_by(CharacterModel.id.asc())
-        return (await self.session.execute(statement)).scalars().all()
+        return (await session.execute(statement)).scalars().all()
 
-    async def __get_system_messages(self) -> Sequence[SystemMessage]:
+    @staticmethod
+    async def __get_system_messages(session: AsyncSession, /) -> Sequence[SystemMessage]:
         statement: Select[tuple[SystemMessage]] = select(SystemMessage)
-        return (await self.session.execute(statement)).scalars().all()
+        return (await session.execute(statement)).scalars().all()
 
     async def get_context(self, *args, **kwargs) -> dict[str, Any]:
-        cached_total_request: _CachedTotalRequest = await _get_total_requests(self.session)
+        cached_total_request: _CachedTotalRequest
+        cached_total_request, user_count, characters, system_messages = await self._gather(
+            _get_total_requests,
+            self.__get_user_count,
+            self.__get_characters,
+            self.__get_system_messages,
+        )
         return {
-            "user_count": await self.__get_user_count(),
-            "characters": await self.__get_characters(),
+            "user_count": user_count,
+            "characters": characters,
             "total_api_requests": {
                 "cache": {
                     "value": cached_total_request.value,
@@ -61,5 +76,5 @@ class GetIndexService(BaseTemplateService):
                     "ttl": cached_total_request.ttl,
                 },
             },
-            "system_messages": await self.__get_system_messages(),
+            "system_messages": system_messages,
         }
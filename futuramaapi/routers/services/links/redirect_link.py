@@ -1,26 +1,78 @@
+from collections.abc import Mapping
+from typing import NamedTuple
+
 from fastapi.responses import RedirectResponse
 from sqlalchemy import Result, Select, select
-from sqlalchemy.exc import NoResultFound
 
+from futuramaapi.core import settings
 from futuramaapi.db.models import LinkModel
+from futuramaapi.helpers.caches import TTLCache
+from futuramaapi.helpers.counters import BufferedCounter
 from futuramaapi.routers.services import BaseSessionService, NotFoundError
 
 
+class LinkClicksCounter(BufferedCounter[int]):
+    """
+    In-memory aggregator of short link clicks per link id.
+
+    Clicks are added to ``links.counter`` atomically in bulk, outside the redirect requests.
+    """
+
+    name: str = "link clicks counter"
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = settings.link_clicks_flush_interval,
+        flush_threshold: int = settings.link_clicks_flush_threshold,
+    ) -> None:
+        super().__init__(
+            flush_interval=flush_interval,
+            flush_threshold=flush_threshold,
+        )
+
+    async def write(self, counts: Mapping[int, int], /) -> None:
+        await LinkModel.count_clicks(counts)
+
+
+link_clicks: LinkClicksCounter = LinkClicksCounter()
+
+
+class LinkTarget(NamedTuple):
+    id: int
+    url: str
+
+
+# Links can't be changed, entries only leave the cache to make room or after ``link_cache_ttl``.
+link_cache: TTLCache[str, LinkTarget] = TTLCache(
+    ttl=settings.link_cache_ttl,
+    max_size=settings.link_cache_max_size,
+)
+
+
 class RedirectLinkService(BaseSessionService[RedirectResponse]):
     shortened: str
 
     @property
-    def _statement(self) -> Select[tuple[LinkModel]]:
-        return select(LinkModel).where(LinkModel.shortened == self.shortened)
+    def _statement(self) -> Select[tuple[int, str]]:
+        return select(LinkModel.id, LinkModel.url).where(LinkModel.shortened == self.shortened)
 
-    async def process(self, *args, **kwargs) -> RedirectResponse:
-        result: Result[tuple[LinkModel]] = await self.session.execute(self._statement)
-        try:
-            link: LinkModel = result.scalars().one()
-        except NoResultFound:
-            raise NotFoundError("Link not found") from None
+    async def _get_target(self) -> LinkTarget:
+        target: LinkTarget | None = link_cache.get(self.shortened)
+        if target is not None:
+            return target
+
+        result: Result[tuple[int, str]] = await self.session.execute(self._statement)
+        row = result.one_or_none()
+        if row is None:
+            raise NotFoundError("Link not found")
 
-        link.counter += 1
-        await self.session.commit()
+        target = LinkTarget(id=row.id, url=row.url)
+        link_cache.set(self.shortened, target)
+        return target
+
+    async def process(self, *args, **kwargs) -> RedirectResponse:
+        target: LinkTarget = await self._get_target()
+        link_clicks.add(target.id)
 
-        return RedirectResponse(link.url)
+        return RedirectResponse(target.url)
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable, Hashable
+from contextlib import suppress
+
+from futuramaapi.core import settings
+from futuramaapi.helpers.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+type Ticker = Callable[[], Awaitable[bytes]]
+
+
+class _Subscriber:
+    __slots__ = ("dropped", "queue")
+
+    def __init__(self, queue_size: int, /) -> None:
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=queue_size)
+        self.dropped: bool = False
+
+
+class _Channel:
+    __slots__ = ("key", "subscribers", "task")
+
+    def __init__(self, key: Hashable, /) -> None:
+        self.key: Hashable = key
+        self.subscribers: set[_Subscriber] = set()
+        self.task: asyncio.Task | None = None
+
+
+class NotificationHub:
+    """
+    Fans events out to every subscriber of a key, e.g. a character id.
+
+    One ticker runs per key while the key has subscribers. Each event is produced and encoded once, then the
+    same bytes are put to bounded per-subscriber queues. A subscriber whose queue is full is dropped instead of
+    slowing the ticker down or buffering without limit.
+
+    Usage:
+        >>> async def stream():
+        >>>     async for event in hub.subscribe(pk, ticker):
+        >>>         yield event
+    """
+
+    def __init__(self, *, queue_size: int = settings.notifications_queue_size) -> None:
+        self.queue_size: int = queue_size
+
+        self._channels: dict[Hashable, _Channel] = {}
+        self._connections: int = 0
+
+    @property
+    def connections(self) -> int:
+        """Subscribers across all keys."""
+        return self._connections
+
+    @property
+    def channels(self) -> int:
+        """Keys with at least one subscriber, i.e. running tickers."""
+        return len(self._channels)
+
+    def get_connections(self, key: Hashable, /) -> int:
+        channel: _Channel | None = self._channels.get(key)
+        return 0 if channel is None else len(channel.subscribers)
+
+    def _close(self, channel: _Channel, /) -> None:
+        if self._channels.get(channel.key) is channel:
+            del self._channels[channel.key]
+
+    def _publish(self, channel: _Channel, event: bytes, /) -> None:
+        for subscriber in list(channel.subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._drop(channel, subscriber)
+
+    def _drop(self, channel: _Channel, subscriber: _Subscriber, /) -> None:
+        channel.subscribers.discard(subscriber)
+        subscriber.dropped = True
+        # Make room for the sentinel, the consumer is too slow to care about the backlog.
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
+
+    async def _run(self, channel: _Channel, ticker: Ticker, /) -> None:
+        while True:
+            try:
+                event: bytes = await ticker()
+            except Exception:
+                logger.exception("Notification ticker failed")
+                self._close(channel)
+                for subscriber in list(channel.subscribers):
+                    self._drop(channel, subscriber)
+                return
+
+            self._publish(channel, event)
+
+    async def subscribe(self, key: Hashable, ticker: Ticker, /) -> AsyncGenerator[bytes]:
+        """
+        Yield events of ``key`` until the subscriber is dropped or the generator is closed.
+
+        ``ticker`` waits for and returns the next encoded event, it's only used if no ticker runs for ``key`` yet.
+        """
+        channel: _Channel | None = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = _Channel(key)
+            channel.task = asyncio.create_task(self._run(channel, ticker))
+
+        subscriber: _Subscriber = _Subscriber(self.queue_size)
+        channel.subscribers.add(subscriber)
+        self._connections += 1
+        try:
+            while (event := await subscriber.queue.get()) is not None:
+                yield event
+        finally:
+            self._connections -= 1
+            channel.subscribers.discard(subscriber)
+            if not channel.subscribers:
+                self._close(channel)
+                if channel.task is not None:
+                    channel.task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await channel.task
+
+
+notification_hub: NotificationHub = NotificationHub()
+metrics.gauge(
+    "sse_connections",
+    "Clients subscribed to server-sent events.",
+).set_function(lambda: notification_hub.connections)
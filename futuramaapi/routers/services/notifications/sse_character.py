@@ -2,7 +2,7 @@ from asyncio import sleep
 from collections.abc import AsyncGenerator
 from datetime import datetime
 from random import randint
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from fastapi import Request
 from pydantic import Field
@@ -16,6 +16,8 @@ from futuramaapi.helpers.pydantic import BaseModel
 from futuramaapi.routers.services import BaseService, NotFoundError
 from futuramaapi.routers.services.characters.get_character import GetCharacterResponse
 
+from .hub import NotificationHub, notification_hub
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio.session import AsyncSession
 
@@ -41,45 +43,50 @@ class CharacterNotificationResponse(BaseModel):
     notification: Notification
 
 
+class CharacterMoveTicker:
+    """Produces the moves of one character, shared by all of its subscribers through the hub."""
+
+    def __init__(self, character: GetCharacterResponse, /) -> None:
+        self.character: GetCharacterResponse = character
+
+    async def __call__(self) -> bytes:
+        await sleep(
+            randint(1, 3),  # noqa: S311
+        )
+        response: CharacterNotificationResponse = CharacterNotificationResponse(
+            item=self.character,
+            notification=CharacterNotificationResponse.Notification(
+                x=randint(MIN_COORDINATE, MAX_COORDINATE),  # noqa: S311
+                y=randint(MIN_COORDINATE, MAX_COORDINATE),  # noqa: S311
+            ),
+        )
+        return ServerSentEvent(data=response.model_dump_json()).encode()
+
+
 class GetCharacterNotificationService(BaseService):
     pk: int
 
-    async def get_move(self, request: Request, character: GetCharacterResponse, /) -> AsyncGenerator[ServerSentEvent]:
-        while True:
-            if await request.is_disconnected():
-                # Can be removed. Do not trust lib, force connection close.
-                break
-
-            yield ServerSentEvent(
-                data=CharacterNotificationResponse.model_validate(
-                    {
-                        "item": character,
-                        "notification": {
-                            "x": randint(MIN_COORDINATE, MAX_COORDINATE),  # noqa: S311
-                            "y": randint(MIN_COORDINATE, MAX_COORDINATE),  # noqa: S311
-                        },
-                    }
-                ).model_dump(
-                    mode="json",
-                )
-            )
-            await sleep(
-                randint(1, 3),  # noqa: S311
-            )
+    hub: ClassVar[NotificationHub] = notification_hub
+
+    async def get_move(self, request: Request, character: GetCharacterResponse, /) -> AsyncGenerator[bytes]:
+        # ``EventSourceResponse`` closes the generator once the client disconnects, which unsubscribes it.
+        async for event in self.hub.subscribe(self.pk, CharacterMoveTicker(character)):
+            yield event
 
     @property
     def statement(self) -> Select[tuple[CharacterModel]]:
         return select(CharacterModel).where(CharacterModel.id == self.pk)
 
-    async def __call__(self, request: Request, *args, **kwargs) -> EventSourceResponse:
-        # TODO: read data from mem bus instead of using DB session.
-        #  Memory leak possible.
+    async def _get_character(self) -> GetCharacterResponse:
         session: AsyncSession
-        async with session_manager.session() as session:
+        async with session_manager.session(readonly=True) as session:
             try:
                 character_model: CharacterModel = (await session.execute(self.statement)).scalars().one()
             except NoResultFound:
                 raise NotFoundError(f"Character with id={self.pk} not found") from None
 
-        character: GetCharacterResponse = GetCharacterResponse.model_validate(character_model)
+        return GetCharacterResponse.model_validate(character_model)
+
+    async def __call__(self, request: Request, *args, **kwargs) -> EventSourceResponse:
+        character: GetCharacterResponse = await self._get_character()
         return EventSourceResponse(self.get_move(request, character))
@@ -10,7 +10,7 @@ from sqlalchemy import Update, update
 
 from futuramaapi.core import settings
 from futuramaapi.db.models import UserModel
-from futuramaapi.routers.services import BaseSessionService
+from futuramaapi.routers.services import BaseSessionService, invalidate_user
 from futuramaapi.routers.services.auth.get_user_auth import UserAuthMessageType
 
 from .get_signature_user_password_change_form import ChangeFormError
@@ -52,8 +52,8 @@ class ChangeSignatureRequestedUserPasswordService(BaseSessionService[RedirectRes
 
         return self.context["request"]
 
-    def _get_update_user_password_statement(self, pk: int, /) -> Update:
-        password: str = self.hasher.encode(self.password1.get_secret_value())
+    async def _get_update_user_password_statement(self, pk: int, /) -> Update:
+        password: str = await self.hasher.aencode(self.password1.get_secret_value())
         return update(UserModel).where(UserModel.id == pk).values(is_confirmed=True, password=password)
 
     def _get_decoded_token(self) -> dict[str, Any]:
@@ -86,8 +86,9 @@ class ChangeSignatureRequestedUserPasswordService(BaseSessionService[RedirectRes
                 status_code=status.HTTP_303_SEE_OTHER,
             )
 
-        await self.session.execute(self._get_update_user_password_statement(token_["user"]["id"]))
+        await self.session.execute(await self._get_update_user_password_statement(token_["user"]["id"]))
         await self.session.commit()
+        await invalidate_user(token_["user"]["id"])
 
         return RedirectResponse(
             url=f"/auth?messageType={UserAuthMessageType.password_changed}",
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, ClassVar
+
+from sqlalchemy import Select
+
+from futuramaapi.db import Base
+from futuramaapi.db.catalog import catalog
+from futuramaapi.db.sampling import IdIndex
+from futuramaapi.routers.services._base import BaseSessionService
+
+
+class BaseRandomService[TResponse](BaseSessionService[TResponse], ABC):
+    """Base service picking random rows through an ``IdIndex`` instead of ``ORDER BY random()``."""
+
+    readonly: ClassVar[bool] = True
+
+    index: ClassVar[IdIndex]
+
+    @property
+    @abstractmethod
+    def cached(self) -> Mapping[int, Any]:
+        """Catalog rows by id, only used while the catalog is loaded."""
+
+    @property
+    @abstractmethod
+    def statement(self) -> Select:
+        """Statement selecting the model with its relationships, ids are filtered by the service."""
+
+    @property
+    def model(self) -> type[Base]:
+        return self.index.model
+
+    async def _get_by_ids(self, ids: list[int], /) -> list[Any]:
+        statement: Select = self.statement.where(self.model.id.in_(ids))
+        by_id: dict[int, Any] = {row.id: row for row in (await self.session.execute(statement)).scalars().all()}
+        return [by_id[id_] for id_ in ids if id_ in by_id]
+
+    async def sample(self, k: int = 1, /) -> list[Any]:
+        """Return up to ``k`` distinct random rows, in random order."""
+        if catalog.is_loaded:
+            return [self.cached[id_] for id_ in self.index.sample(k)]
+
+        if self.index.is_expired:
+            await self.index.load(self.session)
+
+        ids: list[int] = self.index.sample(k)
+        if not ids:
+            return []
+
+        rows: list[Any] = await self._get_by_ids(ids)
+        if len(rows) < len(ids):
+            # Rows were deleted since the index has been loaded.
+            await self.index.load(self.session)
+            rows = await self._get_by_ids(self.index.sample(k))
+
+        return rows
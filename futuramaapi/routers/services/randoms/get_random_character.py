@@ -1,24 +1,35 @@
-from sqlalchemy import Select, func, select
-from sqlalchemy.exc import NoResultFound
+from collections.abc import Mapping
+from typing import ClassVar
 
+from sqlalchemy import Select, select
+
+from futuramaapi.db.catalog import CatalogCharacter, catalog
 from futuramaapi.db.models import CharacterModel
-from futuramaapi.routers.services import BaseSessionService, NotFoundError
+from futuramaapi.db.sampling import IdIndex, character_ids
+from futuramaapi.routers.services import NotFoundError
 from futuramaapi.routers.services.characters.get_character import GetCharacterResponse
 
+from ._base import BaseRandomService
+
 
 class GetRandomCharacterResponse(GetCharacterResponse):
     pass
 
 
-class GetRandomCharacterService(BaseSessionService[GetRandomCharacterResponse]):
+class GetRandomCharacterService(BaseRandomService[GetRandomCharacterResponse]):
+    index: ClassVar[IdIndex] = character_ids
+
+    @property
+    def cached(self) -> Mapping[int, CatalogCharacter]:
+        return catalog.characters
+
     @property
     def statement(self) -> Select[tuple[CharacterModel]]:
-        return select(CharacterModel).order_by(func.random()).limit(1)
+        return select(CharacterModel)
 
     async def process(self, *args, **kwargs) -> GetRandomCharacterResponse:
-        try:
-            result: CharacterModel = (await self.session.execute(self.statement)).scalars().one()
-        except NoResultFound:
-            raise NotFoundError() from None
+        characters: list[CharacterModel | CatalogCharacter] = await self.sample()
+        if not characters:
+            raise NotFoundError()
 
-        return GetRandomCharacterResponse.model_validate(result)
+        return GetRandomCharacterResponse.model_validate(characters[0])
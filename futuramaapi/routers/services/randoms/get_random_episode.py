@@ -1,25 +1,36 @@
-from sqlalchemy import Select, func, select
-from sqlalchemy.exc import NoResultFound
+from collections.abc import Mapping
+from typing import ClassVar
+
+from sqlalchemy import Select, select
 from sqlalchemy.orm import selectinload
 
+from futuramaapi.db.catalog import CatalogEpisode, catalog
 from futuramaapi.db.models import EpisodeModel
-from futuramaapi.routers.services import BaseSessionService, NotFoundError
+from futuramaapi.db.sampling import IdIndex, episode_ids
+from futuramaapi.routers.services import NotFoundError
 from futuramaapi.routers.services.episodes.get_episode import GetEpisodeResponse
 
+from ._base import BaseRandomService
+
 
 class GetRandomEpisodeResponse(GetEpisodeResponse):
     pass
 
 
-class GetRandomEpisodeService(BaseSessionService[GetRandomEpisodeResponse]):
+class GetRandomEpisodeService(BaseRandomService[GetRandomEpisodeResponse]):
+    index: ClassVar[IdIndex] = episode_ids
+
+    @property
+    def cached(self) -> Mapping[int, CatalogEpisode]:
+        return catalog.episodes
+
     @property
     def statement(self) -> Select[tuple[EpisodeModel]]:
-        return select(EpisodeModel).options(selectinload(EpisodeModel.season)).order_by(func.random()).limit(1)
+        return select(EpisodeModel).options(selectinload(EpisodeModel.season))
 
     async def process(self, *args, **kwargs) -> GetRandomEpisodeResponse:
-        try:
-            result: EpisodeModel = (await self.session.execute(self.statement)).scalars().one()
-        except NoResultFound:
-            raise NotFoundError() from None
+        episodes: list[EpisodeModel | CatalogEpisode] = await self.sample()
+        if not episodes:
+            raise NotFoundError()
 
-        return GetRandomEpisodeResponse.model_validate(result)
+        return GetRandomEpisodeResponse.model_validate(episodes[0])
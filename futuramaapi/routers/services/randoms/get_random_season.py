@@ -1,25 +1,36 @@
-from sqlalchemy import Select, func, select
-from sqlalchemy.exc import NoResultFound
+from collections.abc import Mapping
+from typing import ClassVar
+
+from sqlalchemy import Select, select
 from sqlalchemy.orm import selectinload
 
+from futuramaapi.db.catalog import CatalogSeason, catalog
 from futuramaapi.db.models import SeasonModel
-from futuramaapi.routers.services import BaseSessionService, NotFoundError
+from futuramaapi.db.sampling import IdIndex, season_ids
+from futuramaapi.routers.services import NotFoundError
 from futuramaapi.routers.services.seasons.get_season import GetSeasonResponse
 
+from ._base import BaseRandomService
+
 
 class GetRandomSeasonResponse(GetSeasonResponse):
     pass
 
 
-class GetRandomSeasonService(BaseSessionService[GetRandomSeasonResponse]):
+class GetRandomSeasonService(BaseRandomService[GetRandomSeasonResponse]):
+    index: ClassVar[IdIndex] = season_ids
+
+    @property
+    def cached(self) -> Mapping[int, CatalogSeason]:
+        return catalog.seasons
+
     @property
     def statement(self) -> Select[tuple[SeasonModel]]:
-        return select(SeasonModel).options(selectinload(SeasonModel.episodes)).order_by(func.random()).limit(1)
+        return select(SeasonModel).options(selectinload(SeasonModel.episodes))
 
     async def process(self, *args, **kwargs) -> GetRandomSeasonResponse:
-        try:
-            result: SeasonModel = (await self.session.execute(self.statement)).scalars().one()
-        except NoResultFound:
-            raise NotFoundError() from None
+        seasons: list[SeasonModel | CatalogSeason] = await self.sample()
+        if not seasons:
+            raise NotFoundError()
 
-        return GetRandomSeasonResponse.model_validate(result)
+        return GetRandomSeasonResponse.model_validate(seasons[0])
@@ -0,0 +1,38 @@
+from collections.abc import Mapping
+from typing import ClassVar
+
+from pydantic import Field
+from sqlalchemy import Select, select
+
+from futuramaapi.db.catalog import CatalogCharacter, catalog
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.db.sampling import IdIndex, character_ids
+
+from ._base import BaseRandomService
+from .get_random_character import GetRandomCharacterResponse
+
+
+class ListRandomCharactersResponse(GetRandomCharacterResponse):
+    pass
+
+
+class ListRandomCharactersService(BaseRandomService[list[ListRandomCharactersResponse]]):
+    index: ClassVar[IdIndex] = character_ids
+
+    count: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+    )
+
+    @property
+    def cached(self) -> Mapping[int, CatalogCharacter]:
+        return catalog.characters
+
+    @property
+    def statement(self) -> Select[tuple[CharacterModel]]:
+        return select(CharacterModel)
+
+    async def process(self, *args, **kwargs) -> list[ListRandomCharactersResponse]:
+        characters: list[CharacterModel | CatalogCharacter] = await self.sample(self.count)
+        return [ListRandomCharactersResponse.model_validate(character) for character in characters]
@@ -1,11 +1,17 @@
+from collections.abc import Mapping
+from typing import ClassVar
+
 from pydantic import Field
 from sqlalchemy import Select, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import selectinload
 
+from futuramaapi.db import Base
+from futuramaapi.db.catalog import CatalogSeason, catalog
 from futuramaapi.db.models import SeasonModel
 from futuramaapi.helpers.pydantic import BaseModel
 from futuramaapi.routers.services._base import BaseSessionService, NotFoundError
+from futuramaapi.routers.services._bulk import BaseBulkSessionService
 
 
 class GetSeasonResponse(BaseModel):
@@ -24,16 +30,38 @@ class GetSeasonResponse(BaseModel):
 
 
 class GetSeasonService(BaseSessionService[GetSeasonResponse]):
+    readonly: ClassVar[bool] = True
+
     pk: int
 
     @property
     def statement(self) -> Select:
         return select(SeasonModel).where(SeasonModel.id == self.pk).options(selectinload(SeasonModel.episodes))
 
+    def _get_cached(self) -> GetSeasonResponse:
+        try:
+            return GetSeasonResponse.model_validate(catalog.seasons[self.pk])
+        except KeyError:
+            raise NotFoundError("Season not found") from None
+
     async def process(self, *args, **kwargs) -> GetSeasonResponse:
+        if catalog.is_loaded:
+            return self._get_cached()
+
         try:
             season_model: SeasonModel = (await self.session.execute(self.statement)).scalars().one()
         except NoResultFound:
             raise NotFoundError("Season not found") from None
 
         return GetSeasonResponse.model_validate(season_model)
+
+
+class GetSeasonsBulkService(BaseBulkSessionService[GetSeasonResponse]):
+    model: ClassVar[type[Base]] = SeasonModel
+    item_model: ClassVar[type[BaseModel]] = GetSeasonResponse
+
+    def get_cached_items(self) -> Mapping[int, CatalogSeason] | None:
+        if not catalog.is_loaded:
+            return None
+
+        return catalog.seasons
@@ -1,8 +1,12 @@
+from typing import ClassVar
+
 from fastapi_pagination import Page
+from fastapi_pagination import paginate as paginate_items
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import Select, select
 from sqlalchemy.orm import selectinload
 
+from futuramaapi.db.catalog import catalog
 from futuramaapi.db.models import SeasonModel
 from futuramaapi.routers.services._base import BaseSessionService
 from futuramaapi.routers.services.seasons.get_season import GetSeasonResponse
@@ -13,11 +17,16 @@ class ListSeasonsResponse(GetSeasonResponse):
 
 
 class ListSeasonsService(BaseSessionService[Page[ListSeasonsResponse]]):
+    readonly: ClassVar[bool] = True
+
     @property
     def statement(self) -> Select:
         return select(SeasonModel).filter().options(selectinload(SeasonModel.episodes))
 
     async def process(self, *args, **kwargs) -> Page[ListSeasonsResponse]:
+        if catalog.is_loaded:
+            return paginate_items(list(catalog.seasons.values()), safe=True)
+
         return await paginate(
             self.session,
             self.statement,
@@ -0,0 +1,160 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import ClassVar, Self
+from xml.sax.saxutils import escape
+
+from futuramaapi.core import settings
+from futuramaapi.db.catalog import catalog
+from futuramaapi.db.sampling import IdIndex, character_ids, episode_ids, season_ids
+from futuramaapi.db.session import session_manager
+
+logger = logging.getLogger(__name__)
+
+# https://www.sitemaps.org/protocol.html#index
+MAX_URLS: int = 50_000
+INDEX_NAME: str = "sitemap.xml"
+
+_PATH_PARAM: re.Pattern[str] = re.compile(r"{(\w+)(?::\w+)?}")
+
+
+@dataclass(frozen=True, slots=True)
+class SitemapDocument:
+    content: bytes
+    gzip_content: bytes
+    etag: str
+    last_modified: datetime
+
+    @classmethod
+    def from_xml(cls, xml: str, last_modified: datetime, /) -> Self:
+        content: bytes = xml.encode()
+        return cls(
+            content=content,
+            gzip_content=gzip.compress(content, mtime=0),
+            etag=f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"',
+            last_modified=last_modified,
+        )
+
+
+class Sitemap:
+    """
+    Pre-rendered sitemap documents.
+
+    Built once from the public routes, path parameters of entity routes are expanded with the ids of the
+    entity. Up to ``max_urls`` URLs are served as a single ``sitemap.xml``, more URLs are split into
+    ``sitemap-<n>.xml`` files listed by a ``sitemap.xml`` index. Documents are rebuilt when the catalog is
+    reloaded.
+    """
+
+    entity_ids: ClassVar[dict[str, IdIndex]] = {
+        "character_id": character_ids,
+        "episode_id": episode_ids,
+        "season_id": season_ids,
+    }
+
+    _url_set_tag: ClassVar[str] = (
+        '<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">%s</urlset>'
+    )
+    _url_tag: ClassVar[str] = "<url><loc>%s</loc></url>"
+    _index_tag: ClassVar[str] = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">%s</sitemapindex>'
+    )
+    _sitemap_tag: ClassVar[str] = "<sitemap><loc>%s</loc><lastmod>%s</lastmod></sitemap>"
+
+    def __init__(self, *, max_urls: int = MAX_URLS) -> None:
+        self.max_urls: int = max_urls
+
+        self._paths: tuple[str, ...] | None = None
+        self._documents: dict[str, SitemapDocument] = {}
+        self._catalog_loaded_at: datetime | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def is_built(self) -> bool:
+        return bool(self._documents)
+
+    @property
+    def is_stale(self) -> bool:
+        return catalog.loaded_at != self._catalog_loaded_at
+
+    def get(self, name: str = INDEX_NAME, /) -> SitemapDocument | None:
+        return self._documents.get(name)
+
+    async def _load_ids(self, paths: Iterable[str], /) -> None:
+        """Load the id indexes the parameters of ``paths`` are expanded with."""
+        params: set[str] = {param for path in paths for param in _PATH_PARAM.findall(path)}
+        indexes: list[IdIndex] = [
+            index for param, index in self.entity_ids.items() if param in params and not index.is_loaded
+        ]
+        if not indexes:
+            return
+
+        async with session_manager.session(readonly=True) as session:
+            for index in indexes:
+                await index.load(session)
+
+    def _expand(self, path: str, /) -> Iterator[str]:
+        params: list[str] = _PATH_PARAM.findall(path)
+        if not params:
+            yield path
+            return
+
+        if len(params) != 1 or params[0] not in self.entity_ids:
+            # Can't be listed without knowing the values.
+            return
+
+        prefix, _, suffix = _PATH_PARAM.split(path, maxsplit=1)
+        for id_ in self.entity_ids[params[0]]:
+            yield f"{prefix}{id_}{suffix}"
+
+    def _render(self, paths: Iterable[str], /) -> dict[str, SitemapDocument]:
+        base_url: str = str(settings.build_url(is_static=False)).rstrip("/")
+        built_at: datetime = datetime.now(UTC)
+
+        urls: list[str] = [
+            self._url_tag % escape(f"{base_url}{expanded}") for path in paths for expanded in self._expand(path)
+        ]
+        if len(urls) <= self.max_urls:
+            return {INDEX_NAME: SitemapDocument.from_xml(self._url_set_tag % "".join(urls), built_at)}
+
+        documents: dict[str, SitemapDocument] = {}
+        sitemaps: list[str] = []
+        for number, start in enumerate(range(0, len(urls), self.max_urls), start=1):
+            name: str = f"sitemap-{number}.xml"
+            documents[name] = SitemapDocument.from_xml(
+                self._url_set_tag % "".join(urls[start : start + self.max_urls]),
+                built_at,
+            )
+            sitemaps.append(self._sitemap_tag % (escape(f"{base_url}/sitemaps/{name}"), built_at.isoformat()))
+
+        documents[INDEX_NAME] = SitemapDocument.from_xml(self._index_tag % "".join(sitemaps), built_at)
+        return documents
+
+    async def build(self, paths: Iterable[str] | None = None, /) -> None:
+        """(Re)build the documents, ``paths`` are kept for rebuilds and can be omitted afterwards."""
+        async with self._lock:
+            if paths is not None:
+                self._paths = tuple(paths)
+            if self._paths is None:
+                raise RuntimeError("Sitemap paths are not defined.")
+
+            catalog_loaded_at: datetime | None = catalog.loaded_at
+            await self._load_ids(self._paths)
+            self._documents = self._render(self._paths)
+            self._catalog_loaded_at = catalog_loaded_at
+
+        logger.info("Sitemap built: documents=%s", len(self._documents))
+
+    def clear(self) -> None:
+        self._paths = None
+        self._documents = {}
+        self._catalog_loaded_at = None
+
+
+sitemap: Sitemap = Sitemap()
@@ -1,31 +1,83 @@
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import ClassVar
 
-from fastapi import Response
+from fastapi import Request, Response, status
 
-from futuramaapi.core import settings
-from futuramaapi.routers.services import BaseService
+from futuramaapi.routers.services import BaseService, NotFoundError
+
+from ._base import INDEX_NAME, Sitemap, SitemapDocument, sitemap
 
 
 class GetSiteMapService(BaseService[Response]):
-    _header: ClassVar[str] = '<?xml version="1.0" encoding="UTF-8"?>'
+    name: str = INDEX_NAME
+
+    sitemap: ClassVar[Sitemap] = sitemap
+
     _media_type: ClassVar[str] = "application/xml"
-    _url_tag: ClassVar[str] = """<url><loc>%s</loc></url>"""
-    _url_set_tag: ClassVar[str] = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">%s</urlset>"""
 
     @property
-    def urls(self) -> list[str]:
-        from futuramaapi.apps import app  # noqa: PLC0415
+    def request(self) -> Request | None:
+        if self.context is None:
+            return None
+
+        return self.context.get("request")
+
+    async def _build(self) -> None:
+        if not self.sitemap.is_built:
+            from futuramaapi.apps import app  # noqa: PLC0415
+
+            await self.sitemap.build(url.path for url in app.public_urls)
+        elif self.sitemap.is_stale:
+            await self.sitemap.build()
+
+    def _is_not_modified(self, document: SitemapDocument, /) -> bool:
+        if self.request is None:
+            return False
+
+        if_none_match: str | None = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            etags: set[str] = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+            return "*" in etags or document.etag in etags
 
-        return [url.path for url in app.public_urls]
+        if_modified_since: str | None = self.request.headers.get("if-modified-since")
+        if if_modified_since is None:
+            return False
+
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        return document.last_modified.replace(microsecond=0) <= modified_since
+
+    def _accepts_gzip(self) -> bool:
+        if self.request is None:
+            return False
+
+        return "gzip" in self.request.headers.get("accept-encoding", "")
 
     async def __call__(self, *args, **kwargs) -> Response:
-        urls: str = ""
-        for url in self.urls:
-            urls += self._url_tag % settings.build_url(
-                path=url,
-                is_static=False,
-            )
+        await self._build()
+
+        document: SitemapDocument | None = self.sitemap.get(self.name)
+        if document is None:
+            raise NotFoundError()
+
+        headers: dict[str, str] = {
+            "ETag": document.etag,
+            "Last-Modified": format_datetime(document.last_modified, usegmt=True),
+            "Vary": "Accept-Encoding",
+        }
+        if self._is_not_modified(document):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        content: bytes = document.content
+        if self._accepts_gzip():
+            content = document.gzip_content
+            headers["Content-Encoding"] = "gzip"
+
         return Response(
-            content=f"""{self._header}{self._url_set_tag % urls}""",
+            content=content,
             media_type=self._media_type,
+            headers=headers,
         )
@@ -79,7 +79,7 @@ class GetAuthUserTokenService(BaseSessionService[GetAuthUserTokenResponse]):
 
     async def process(self, *args, **kwargs) -> GetAuthUserTokenResponse:
         user: UserModel = await self._get_user()
-        if not self.hasher.verify(self.password.get_secret_value(), user.password):
+        if not await self.hasher.averify(self.password.get_secret_value(), user.password):
             raise UnauthorizedError()
 
         return GetAuthUserTokenResponse.from_user_model(user)
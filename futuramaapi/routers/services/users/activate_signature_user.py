@@ -8,7 +8,7 @@ from starlette.responses import RedirectResponse
 
 from futuramaapi.core import settings
 from futuramaapi.db.models import UserModel
-from futuramaapi.routers.services import BaseSessionService, UnauthorizedError
+from futuramaapi.routers.services import BaseSessionService, UnauthorizedError, invalidate_user
 
 
 class TokenDecodeError(Exception):
@@ -68,6 +68,7 @@ class ActivateSignatureUserService(BaseSessionService[RedirectResponse]):
 
         await self.session.execute(self.__get_update_user_statement(user.id))
         await self.session.commit()
+        await invalidate_user(user.id)
 
         return RedirectResponse(
             url="/auth",
@@ -45,11 +45,6 @@ class CreateUserRequest(BaseModel):
 
     forbidden_usernames: ClassVar[set[str]] = {"autostepik"}
 
-    @field_validator("password", mode="after")
-    @classmethod
-    def hash_password(cls, value: SecretStr, /) -> SecretStr:
-        return SecretStr(cls.hasher.encode(value.get_secret_value()))
-
     @field_validator("username", mode="after")
     @classmethod
     def check_username(cls, value: str) -> str:
@@ -122,20 +117,20 @@ class CreateUserService(BaseSessionService[CreateUserResponse]):
             "emails/confirmation.html",
         )
 
-    def _get_user(self) -> UserModel:
-        return UserModel(
-            **self.request_data.to_dict(
-                by_alias=False,
-                reveal_secrets=True,
-                exclude_unset=True,
-            )
+    async def _get_user(self) -> UserModel:
+        data: dict[str, Any] = self.request_data.to_dict(
+            by_alias=False,
+            reveal_secrets=True,
+            exclude_unset=True,
         )
+        data["password"] = await self.hasher.aencode(data["password"])
+        return UserModel(**data)
 
     async def process(self, *args, **kwargs) -> CreateUserResponse:
         if not feature_flags.user_signup:
             raise RegistrationDisabledError()
 
-        user: UserModel = self._get_user()
+        user: UserModel = await self._get_user()
         self.session.add(user)
 
         try:
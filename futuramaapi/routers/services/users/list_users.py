@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import ClassVar
 
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
@@ -31,6 +32,8 @@ class ListUsersResponse(BaseModel):
 
 
 class ListUsersService(BaseSessionService[Page[ListUsersResponse]]):
+    readonly: ClassVar[bool] = True
+
     offset: int = Field(
         default=0,
     )
@@ -1,7 +1,7 @@
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr
 
 from futuramaapi.helpers.pydantic import BaseModel
-from futuramaapi.routers.services import BaseUserAuthenticatedService, EmptyUpdateError
+from futuramaapi.routers.services import BaseUserAuthenticatedService, EmptyUpdateError, invalidate_user
 
 from .get_user_me import GetUserMeResponse
 
@@ -29,13 +29,6 @@ class UpdateUserRequest(BaseModel):
     )
     is_subscribed: bool | None = None
 
-    @field_validator("password", mode="after")
-    @classmethod
-    def hash_password(cls, value: SecretStr | None, /) -> SecretStr | None:
-        if value is None:
-            return None
-        return SecretStr(cls.hasher.encode(value.get_secret_value()))
-
 
 class UpdateUserResponse(GetUserMeResponse):
     pass
@@ -49,10 +42,14 @@ class UpdateUserService(BaseUserAuthenticatedService[UpdateUserResponse]):
         if not data:
             raise EmptyUpdateError()
 
+        if data.get("password") is not None:
+            data["password"] = await self.hasher.aencode(data["password"])
+
         for field, value in data.items():
             setattr(self.user, field, value)
 
         self.session.add(self.user)
         await self.session.commit()
+        await invalidate_user(self.user.id)
 
         return UpdateUserResponse.model_validate(self.user)
@@ -6,6 +6,8 @@ from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import ValidationError
 
+from futuramaapi.core import feature_flags
+from futuramaapi.helpers.metrics import MetricsRegistry, metrics
 from futuramaapi.routers.services.about.get_about import GetAboutService
 from futuramaapi.routers.services.auth.auth_cookie_session_user import AuthCookieSessionUserService
 from futuramaapi.routers.services.auth.get_user_auth import GetUserAuthService, UserAuthMessageType
@@ -33,6 +35,18 @@ def health() -> Response:
     return Response(status_code=status.HTTP_200_OK)
 
 
+@router.get(
+    "/metrics",
+    include_in_schema=False,
+)
+async def get_metrics() -> Response:
+    # Rendered on the event loop, metrics are only ever updated from it and can't change while they're read.
+    if not feature_flags.expose_metrics:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+    return Response(content=metrics.render(), media_type=MetricsRegistry.content_type)
+
+
 @router.get(
     "/swagger",
     name="swagger",
@@ -67,8 +81,31 @@ async def robots() -> FileResponse:
 @router.get(
     "/sitemap.xml",
 )
-async def get_sitemap() -> Response:
-    service: GetSiteMapService = GetSiteMapService()
+async def get_sitemap(
+    request: Request,
+) -> Response:
+    service: GetSiteMapService = GetSiteMapService(
+        context={
+            "request": request,
+        },
+    )
+    return await service()
+
+
+@router.get(
+    "/sitemaps/{name}",
+    include_in_schema=False,
+)
+async def get_sitemap_part(
+    name: str,
+    request: Request,
+) -> Response:
+    service: GetSiteMapService = GetSiteMapService(
+        name=name,
+        context={
+            "request": request,
+        },
+    )
     return await service()
 
 
@@ -5,6 +5,8 @@ from pydantic import RedisDsn
 
 from futuramaapi.core import settings
 
+from ._middlewares import CallbackSweeperMiddleware, ClientRegistryMiddleware
+
 
 class RedisBroker(_RedisBroker):
     def __init__(
@@ -23,6 +25,8 @@ class RedisBroker(_RedisBroker):
     def _post_init(self) -> None:
         self.add_middleware(AsyncIO())
         self.add_middleware(CurrentMessage())
+        self.add_middleware(ClientRegistryMiddleware())
+        self.add_middleware(CallbackSweeperMiddleware())
         dramatiq.set_broker(self)
 
 
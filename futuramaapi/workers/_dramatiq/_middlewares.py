@@ -0,0 +1,45 @@
+from dramatiq import Broker, Middleware, Worker
+from dramatiq.asyncio import get_event_loop_thread
+
+from futuramaapi.api_clients import client_registry
+
+
+class ClientRegistryMiddleware(Middleware):
+    """Opens the process-wide HTTP client on the worker event loop, must be added after ``AsyncIO``."""
+
+    def after_worker_boot(self, broker: Broker, worker: Worker) -> None:
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is None:
+            raise RuntimeError("AsyncIO middleware is required.")
+
+        event_loop_thread.run_coroutine(client_registry.initialize())
+
+    def before_worker_shutdown(self, broker: Broker, worker: Worker) -> None:
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is None:
+            return
+
+        event_loop_thread.run_coroutine(client_registry.shutdown())
+
+
+class CallbackSweeperMiddleware(Middleware):
+    """Runs the due callbacks sweeper on the worker event loop, must be added after ``AsyncIO``."""
+
+    def after_worker_boot(self, broker: Broker, worker: Worker) -> None:
+        # Imported here, actors can only be declared once the broker is set up.
+        from .tasks import callback_sweeper  # noqa: PLC0415
+
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is None:
+            raise RuntimeError("AsyncIO middleware is required.")
+
+        event_loop_thread.run_coroutine(callback_sweeper.start())
+
+    def before_worker_shutdown(self, broker: Broker, worker: Worker) -> None:
+        from .tasks import callback_sweeper  # noqa: PLC0415
+
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is None:
+            return
+
+        event_loop_thread.run_coroutine(callback_sweeper.stop())
@@ -0,0 +1,7 @@
+from .callbacks import callback_sweeper, schedule_callback, send_due_callbacks
+
+__all__ = [
+    "callback_sweeper",
+    "schedule_callback",
+    "send_due_callbacks",
+]
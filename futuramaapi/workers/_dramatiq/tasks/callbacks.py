@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from contextlib import suppress
+
+import dramatiq
+from pydantic import HttpUrl
+
+from futuramaapi.core import settings
+from futuramaapi.workers.services.callbacks.send_callbacks import (
+    CallbackKind,
+    ScheduledCallback,
+    SendCallbacksTaskService,
+    callback_queue,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dramatiq.actor(max_retries=3)
+async def send_due_callbacks() -> None:
+    callbacks: dict[str, ScheduledCallback] = await callback_queue.claim_due()
+    if not callbacks:
+        # Already claimed by a batch triggered at the same time.
+        return
+
+    service: SendCallbacksTaskService = SendCallbacksTaskService(callbacks=list(callbacks.values()))
+    try:
+        await service()
+    except Exception:
+        # Picked up again by the retry of this message.
+        await callback_queue.release(callbacks.keys())
+        raise
+
+    await callback_queue.ack(callbacks.keys())
+
+
+async def schedule_callback(
+    kind: CallbackKind,
+    pk: int,
+    delay: int,
+    callback_url: HttpUrl,
+) -> None:
+    """Store the callback and enqueue a batch delivery for the moment it becomes due."""
+    await callback_queue.push(
+        ScheduledCallback(kind=kind, id=pk, callback_url=callback_url),
+        delay=delay,
+    )
+    # Dramatiq enqueues with a blocking Redis client.
+    await asyncio.to_thread(send_due_callbacks.send_with_options, delay=delay * 1000)
+
+
+class CallbackSweeper:
+    """
+    Periodically enqueues ``send_due_callbacks`` while callbacks are due.
+
+    Catches callbacks whose delayed message was never enqueued or got lost, and the ones whose claim lease ran out.
+    Runs in every worker process, claims are atomic so concurrent batches never deliver a callback twice.
+    """
+
+    def __init__(self, *, interval: float = settings.callback_sweep_interval) -> None:
+        self.interval: float = interval
+
+        self._task: asyncio.Task | None = None
+
+    async def sweep(self) -> bool:
+        if not await callback_queue.has_due():
+            return False
+
+        # Dramatiq enqueues with a blocking Redis client.
+        await asyncio.to_thread(send_due_callbacks.send)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Failed to sweep due callbacks")
+
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            raise RuntimeError("Callback sweeper has been started.")
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            raise RuntimeError("Callback sweeper has not been started.")
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+callback_sweeper: CallbackSweeper = CallbackSweeper()
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from typing import Any
 
-from futuramaapi.api_clients import BaseClient, HTTPXClient
+from futuramaapi.api_clients import BaseClient, client_registry
 from futuramaapi.helpers.pydantic import BaseModel
 
 
@@ -21,7 +21,7 @@ class BaseAPITaskService[T: Mapping[str, Any]](BaseTaskService[T], ABC):
     ) -> None:
         super().__init__(**data)
 
-        self._api: BaseClient = api_client or HTTPXClient()
+        self._api: BaseClient = api_client or client_registry.get()
 
     @property
     def api(self) -> BaseClient:
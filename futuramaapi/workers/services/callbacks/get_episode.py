@@ -57,6 +57,6 @@ class GetEpisodeCallbackTaskService(GetItemCallbackTaskService):
     model_class = EpisodeModel
     response_class = GetEpisodeCallbackResponse
 
-    @property
-    def _statement(self) -> Select[tuple[EpisodeModel]]:
-        return select(EpisodeModel).options(selectinload(EpisodeModel.season)).where(EpisodeModel.id == self.id)
+    @classmethod
+    def get_statement(cls) -> Select[tuple[EpisodeModel]]:
+        return select(EpisodeModel).options(selectinload(EpisodeModel.season))
@@ -40,6 +40,6 @@ class GetSeasonCallbackTaskService(GetItemCallbackTaskService):
     model_class = SeasonModel
     response_class = GetSeasonCallbackResponse
 
-    @property
-    def _statement(self) -> Select[tuple[SeasonModel]]:
-        return select(SeasonModel).options(selectinload(SeasonModel.episodes)).where(SeasonModel.id == self.id)
+    @classmethod
+    def get_statement(cls) -> Select[tuple[SeasonModel]]:
+        return select(SeasonModel).options(selectinload(SeasonModel.episodes))
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Collection
+from http import HTTPMethod
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+from uuid import uuid4
+
+from pydantic import Field, HttpUrl
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from futuramaapi.api_clients import BaseApiClientError, RequestData
+from futuramaapi.core import settings
+from futuramaapi.db import Base
+from futuramaapi.db.session import session_manager
+from futuramaapi.helpers.pydantic import BaseModel
+from futuramaapi.workers.services._base import BaseAPITaskService
+
+from ._base import GetItemCallbackTaskService
+from .get_character import GetCharacterCallbackTaskService
+from .get_episode import GetEpisodeCallbackTaskService
+from .get_season import GetSeasonCallbackTaskService
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+
+logger = logging.getLogger(__name__)
+
+type CallbackKind = Literal["Character", "Episode", "Season"]
+
+
+class ScheduledCallback(BaseModel):
+    token: str = Field(
+        default_factory=lambda: uuid4().hex,
+        description="Keeps identical callbacks apart in the queue.",
+    )
+    kind: CallbackKind
+    id: int
+    callback_url: HttpUrl
+
+    @property
+    def host(self) -> str:
+        return f"{self.callback_url.host}:{self.callback_url.port}"
+
+
+class CallbackQueue:
+    """
+    Redis sorted set of scheduled callbacks scored by due time.
+
+    Callbacks survive restarts of both the web and the worker processes. Everything due is claimed at once, so
+    deliveries scheduled close to each other are sent together. Claimed callbacks stay in the set with their score
+    pushed ``lease`` seconds forward and are only removed by ``ack`` once delivered, callbacks of a worker that
+    failed or died are claimed again when the lease runs out.
+    """
+
+    # Claims due members by moving their score forward, atomically so that concurrent batches never share them.
+    _claim_script: ClassVar[str] = """
+        local members = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", ARGV[1])
+        for _, member in ipairs(members) do
+            redis.call("ZADD", KEYS[1], "XX", ARGV[2], member)
+        end
+        return members
+    """
+
+    def __init__(self, *, key: str = "callbacks:due", lease: float = settings.callback_lease) -> None:
+        self.key: str = key
+        self.lease: float = lease
+
+    @staticmethod
+    def _get_client() -> Redis:
+        return Redis(connection_pool=settings.redis.pool)
+
+    async def push(self, callback: ScheduledCallback, /, *, delay: float) -> None:
+        await self._get_client().zadd(self.key, {callback.model_dump_json(): time() + delay})
+
+    async def has_due(self) -> bool:
+        return bool(await self._get_client().zrangebyscore(self.key, "-inf", time(), start=0, num=1))
+
+    async def claim_due(self) -> dict[str, ScheduledCallback]:
+        """Due callbacks by their queue member, to be passed to ``ack`` or ``release``."""
+        now: float = time()
+        members: list[bytes | str] = await self._get_client().eval(
+            self._claim_script,
+            1,
+            self.key,
+            now,
+            now + self.lease,
+        )
+        return {
+            member.decode() if isinstance(member, bytes) else member: ScheduledCallback.model_validate_json(member)
+            for member in members
+        }
+
+    async def ack(self, members: Collection[str], /) -> None:
+        if members:
+            await self._get_client().zrem(self.key, *members)
+
+    async def release(self, members: Collection[str], /) -> None:
+        """Make claimed callbacks due again, e.g. for a retry of the failed batch."""
+        if members:
+            await self._get_client().zadd(self.key, dict.fromkeys(members, time()), xx=True)
+
+
+callback_queue: CallbackQueue = CallbackQueue()
+
+
+class SendCallbacksTaskService(BaseAPITaskService):
+    """
+    Delivers a batch of callbacks.
+
+    Items are loaded with one query per kind, then callbacks are grouped by target host: hosts are served
+    concurrently, callbacks for one host are sent one after another over a kept-alive connection.
+    """
+
+    callbacks: list[ScheduledCallback]
+
+    services: ClassVar[dict[CallbackKind, type[GetItemCallbackTaskService]]] = {
+        "Character": GetCharacterCallbackTaskService,
+        "Episode": GetEpisodeCallbackTaskService,
+        "Season": GetSeasonCallbackTaskService,
+    }
+
+    async def _get_items(self, session: AsyncSession, /) -> dict[tuple[CallbackKind, int], Base]:
+        ids: defaultdict[CallbackKind, set[int]] = defaultdict(set)
+        for callback in self.callbacks:
+            ids[callback.kind].add(callback.id)
+
+        items: dict[tuple[CallbackKind, int], Base] = {}
+        for kind, kind_ids in ids.items():
+            service_class: type[GetItemCallbackTaskService] = self.services[kind]
+            statement: Select = service_class.get_statement().where(service_class.model_class.id.in_(kind_ids))
+            for obj in (await session.execute(statement)).scalars().all():
+                items[(kind, obj.id)] = obj
+        return items
+
+    async def _send_to_host(self, callbacks: list[tuple[ScheduledCallback, BaseModel]], /) -> None:
+        for callback, response in callbacks:
+            request_data: RequestData = RequestData(
+                url=str(callback.callback_url),
+                method=HTTPMethod.POST,
+                json=response.to_dict(),
+            )
+            try:
+                await self.api.request(request_data)
+            except BaseApiClientError:
+                logger.warning("Callback delivery failed", extra={"url": request_data.url})
+
+    async def process(self, *args, **kwargs) -> dict[str, Any]:
+        session: AsyncSession
+        async with session_manager.session() as session:
+            items: dict[tuple[CallbackKind, int], Base] = await self._get_items(session)
+
+        by_host: defaultdict[str, list[tuple[ScheduledCallback, BaseModel]]] = defaultdict(list)
+        for callback in self.callbacks:
+            response: BaseModel = self.services[callback.kind].build_response(
+                callback.id,
+                items.get((callback.kind, callback.id)),
+            )
+            by_host[callback.host].append((callback, response))
+
+        await asyncio.gather(*(self._send_to_host(callbacks) for callbacks in by_host.values()))
+
+        return {}
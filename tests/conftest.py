@@ -1,15 +1,18 @@
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from faker import Faker
 
 from futuramaapi.db import INT32
+from futuramaapi.db.catalog import Catalog, catalog
 from futuramaapi.db.models import (
     CharacterModel,
     EpisodeModel,
     SeasonModel,
 )
+from futuramaapi.db.sampling import character_ids, episode_ids, season_ids
 
 
 @pytest.fixture
@@ -91,11 +94,48 @@ def mock_session_manager(request):
     mock_session = AsyncMock()
     mock_context.__aenter__.return_value = mock_session
 
-    patcher = patch(
-        "futuramaapi.routers.services._base.session_manager.session",
-        return_value=mock_context,
-    )
-    patcher.start()
-    request.addfinalizer(patcher.stop)
+    for attribute, return_value in (("session", mock_context), ("create_session", mock_session)):
+        patcher = patch(
+            f"futuramaapi.routers.services._base.session_manager.{attribute}",
+            return_value=return_value,
+        )
+        patcher.start()
+        request.addfinalizer(patcher.stop)
 
     return mock_session
+
+
+@pytest_asyncio.fixture
+async def loaded_catalog(request, character, episode, season, mock_session_manager) -> Catalog:
+    episode.season_id = season.id
+
+    results: list[MagicMock] = []
+    for item in (character, episode, season):
+        mock_result = MagicMock()
+        mock_result.scalars.return_value = [item]
+        results.append(mock_result)
+    mock_session_manager.execute.side_effect = results
+
+    await catalog.load()
+    request.addfinalizer(catalog.clear)
+
+    mock_session_manager.execute.reset_mock(side_effect=True)
+    return catalog
+
+
+@pytest.fixture(autouse=True)
+def clear_id_indexes(request):
+    for index in (character_ids, episode_ids, season_ids):
+        request.addfinalizer(index.clear)
+
+
+@pytest.fixture
+def mock_sampled_rows(mock_session_manager):
+    def _mock(*rows) -> None:
+        ids_result = MagicMock()
+        ids_result.scalars.return_value = [row.id for row in rows]
+        rows_result = MagicMock()
+        rows_result.scalars.return_value.all.return_value = list(rows)
+        mock_session_manager.execute.side_effect = [ids_result, rows_result]
+
+    return _mock
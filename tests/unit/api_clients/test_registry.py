@@ -0,0 +1,84 @@
+import asyncio
+from http import HTTPMethod, HTTPStatus
+
+import httpx
+import pytest
+
+from futuramaapi.api_clients import ClientRegistry, HTTPXClient, RequestData
+
+
+class _TransportClient(HTTPXClient):
+    def __init__(self, transport: httpx.AsyncBaseTransport, /) -> None:
+        super().__init__(httpx_kwargs={"transport": transport})
+
+
+class _Registry(ClientRegistry):
+    def __init__(self, transport: httpx.AsyncBaseTransport, /, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._transport: httpx.AsyncBaseTransport = transport
+
+    def _build_client(self) -> HTTPXClient:
+        return _TransportClient(self._transport)
+
+
+class TestClientRegistry:
+    @pytest.mark.asyncio
+    async def test_get_not_initialized(self):
+        # Arrange
+        registry = ClientRegistry()
+
+        # Act & Assert
+        assert isinstance(registry.get(), HTTPXClient)
+        with pytest.raises(RuntimeError):
+            await registry.request(RequestData(url="https://example.com"))
+
+    @pytest.mark.asyncio
+    async def test_borrowed_client_shares_connections(self):
+        # Arrange
+        transport = httpx.MockTransport(lambda _: httpx.Response(HTTPStatus.OK, stream=httpx.ByteStream(b"")))
+        registry = _Registry(transport)
+        await registry.initialize()
+        request_data = RequestData(url="https://example.com/callback", method=HTTPMethod.POST, json={})
+
+        # Act
+        async with registry.get() as first:
+            await first.request(request_data)
+        async with registry.get() as second:
+            response = await second.request(request_data)
+
+        # Assert
+        assert response.status == HTTPStatus.OK
+        assert registry.is_initialized is True
+
+        await registry.shutdown()
+        assert registry.is_initialized is False
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        # Arrange
+        in_flight: dict[str, int] = {"example.com": 0, "example.org": 0}
+        peak: dict[str, int] = dict(in_flight)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host: str = request.url.host
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(HTTPStatus.OK, stream=httpx.ByteStream(b""))
+
+        registry = _Registry(httpx.MockTransport(handler), max_connections_per_host=2)
+        await registry.initialize()
+
+        # Act
+        await asyncio.gather(
+            *(
+                registry.get().request(RequestData(url=f"https://{host}/callback"))
+                for host in ["example.com"] * 5 + ["example.org"] * 5
+            )
+        )
+        await registry.shutdown()
+
+        # Assert
+        assert peak == {"example.com": 2, "example.org": 2}
+        assert len(registry._host_slots) == 0
@@ -0,0 +1,101 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from futuramaapi.db.auth_sessions import AuthSessionCache
+from futuramaapi.db.models import AuthSessionModel
+from futuramaapi.helpers.caches import Revocations
+
+
+def _get_row(*, created_at: datetime, expired: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(expired=expired, created_at=created_at, id=1, name="Philip", surname="Fry")
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    return session
+
+
+@pytest.fixture
+def mock_revocations():
+    revocations = AsyncMock(spec=Revocations)
+    revocations.is_revoked.return_value = False
+    return revocations
+
+
+class TestAuthSessionCache:
+    @pytest.mark.asyncio
+    async def test_get_user_cached(self, mock_session, mock_revocations):
+        # Arrange
+        mock_session.execute.return_value.one_or_none.return_value = _get_row(created_at=datetime.now(UTC))
+        cache = AuthSessionCache(ttl=60, max_size=10, revocations=mock_revocations)
+
+        # Act
+        first = await cache.get_user(mock_session, "key")
+        second = await cache.get_user(mock_session, "key")
+
+        # Assert
+        assert first is second
+        assert second.full_name == "Philip Fry"
+        mock_session.execute.assert_awaited_once()
+        mock_revocations.is_revoked.assert_awaited_once()
+        assert mock_revocations.is_revoked.await_args.args[1:] == ("session:key", "user:1")
+
+    @pytest.mark.asyncio
+    async def test_get_user_revoked(self, mock_session, mock_revocations):
+        # Arrange
+        mock_session.execute.return_value.one_or_none.return_value = _get_row(created_at=datetime.now(UTC))
+        mock_revocations.is_revoked.return_value = True
+        cache = AuthSessionCache(ttl=60, max_size=10, revocations=mock_revocations)
+        await cache.get_user(mock_session, "key")
+        mock_session.execute.return_value.one_or_none.return_value = None
+
+        # Act
+        user = await cache.get_user(mock_session, "key")
+
+        # Assert
+        assert user is None
+        assert len(cache._sessions) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "row",
+        [
+            None,
+            _get_row(created_at=datetime.now(UTC), expired=True),
+            _get_row(created_at=datetime.now(UTC) - timedelta(seconds=AuthSessionModel.cookie_expiration_time + 1)),
+        ],
+    )
+    async def test_get_user_invalid(self, mock_session, mock_revocations, row):
+        # Arrange
+        mock_session.execute.return_value.one_or_none.return_value = row
+        cache = AuthSessionCache(ttl=60, max_size=10, revocations=mock_revocations)
+
+        # Act
+        user = await cache.get_user(mock_session, "key")
+
+        # Assert
+        assert user is None
+        assert len(cache._sessions) == 0
+
+    @pytest.mark.asyncio
+    async def test_expire(self, mock_session, mock_revocations):
+        # Arrange
+        mock_session.execute.return_value.one_or_none.return_value = _get_row(created_at=datetime.now(UTC))
+        cache = AuthSessionCache(ttl=60, max_size=10, revocations=mock_revocations)
+        await cache.get_user(mock_session, "key")
+        await cache.get_user(mock_session, "other")
+
+        # Act
+        with patch("futuramaapi.db.auth_sessions.AuthSessionModel.do_expire", new_callable=AsyncMock) as do_expire:
+            await cache.expire(mock_session, "key")
+        await cache.invalidate_user(1)
+
+        # Assert
+        do_expire.assert_awaited_once_with(mock_session, "key")
+        assert len(cache._sessions) == 0
+        assert [call.args for call in mock_revocations.revoke.await_args_list] == [("session:key",), ("user:1",)]
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from futuramaapi.db.catalog import Catalog, CatalogRefresher
+from futuramaapi.db.models import CharacterModel, EpisodeModel, SeasonModel
+
+
+class TestCatalog:
+    def test_not_loaded(self):
+        # Arrange
+        catalog = Catalog()
+
+        # Act & Assert
+        assert catalog.is_loaded is False
+        with pytest.raises(RuntimeError):
+            _ = catalog.characters
+
+    @pytest.mark.asyncio
+    async def test_load(
+        self,
+        character: CharacterModel,
+        episode: EpisodeModel,
+        season: SeasonModel,
+        loaded_catalog: Catalog,
+    ):
+        # Assert
+        assert loaded_catalog.is_loaded is True
+        assert loaded_catalog.characters[character.id].name == character.name
+        assert loaded_catalog.episodes[episode.id].season.id == season.id
+        assert loaded_catalog.seasons[season.id].episodes == (loaded_catalog.episodes[episode.id],)
+
+    @pytest.mark.asyncio
+    async def test_clear(self, loaded_catalog: Catalog):
+        # Act
+        loaded_catalog.clear()
+
+        # Assert
+        assert loaded_catalog.is_loaded is False
+
+
+class TestCatalogRefresher:
+    @pytest.mark.asyncio
+    async def test_refreshes(self):
+        # Arrange
+        refresher = CatalogRefresher(interval=0)
+
+        # Act
+        with patch("futuramaapi.db.catalog.catalog.refresh", new_callable=AsyncMock) as refresh:
+            await refresher.start()
+            await asyncio.sleep(0.01)
+            await refresher.stop()
+
+        # Assert
+        refresh.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_survives_errors(self):
+        # Arrange
+        refresher = CatalogRefresher(interval=0)
+
+        # Act
+        with patch("futuramaapi.db.catalog.catalog.refresh", new_callable=AsyncMock, side_effect=OSError) as refresh:
+            await refresher.start()
+            await asyncio.sleep(0.01)
+            await refresher.stop()
+
+        # Assert
+        assert refresh.await_count > 1
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+import pytest
+
+from futuramaapi.db.catalog import Catalog
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.db.sampling import IdIndex, character_ids
+
+
+class TestIdIndex:
+    def test_not_loaded(self):
+        # Arrange
+        index = IdIndex(CharacterModel)
+
+        # Act & Assert
+        assert index.is_loaded is False
+        with pytest.raises(RuntimeError):
+            index.sample()
+
+    def test_sample_distinct(self):
+        # Arrange
+        index = IdIndex(CharacterModel)
+        population: range = range(1, 101)
+        index.set(population)
+        size: int = 10
+
+        # Act
+        ids: list[int] = index.sample(size)
+
+        # Assert
+        assert len(set(ids)) == len(ids) == size
+        assert set(ids) <= set(population)
+
+    def test_sample_more_than_loaded(self):
+        # Arrange
+        index = IdIndex(CharacterModel)
+        index.set([1, 2])
+
+        # Act & Assert
+        assert sorted(index.sample(5)) == [1, 2]
+
+    def test_expires(self):
+        # Arrange
+        index = IdIndex(CharacterModel, ttl=60)
+        with patch("futuramaapi.db.sampling.monotonic", return_value=0):
+            index.set([1])
+
+        # Act & Assert
+        with patch("futuramaapi.db.sampling.monotonic", return_value=30):
+            assert index.is_expired is False
+        with patch("futuramaapi.db.sampling.monotonic", return_value=60):
+            assert index.is_expired is True
+        assert index.is_loaded is True
+
+    @pytest.mark.asyncio
+    async def test_refreshed_by_catalog(self, character: CharacterModel, loaded_catalog: Catalog):
+        # Assert
+        assert character_ids.sample() == [character.id]
+
+        # Act
+        loaded_catalog.clear()
+
+        # Assert
+        assert character_ids.is_loaded is False
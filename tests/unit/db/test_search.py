@@ -0,0 +1,79 @@
+from futuramaapi.db.search import NGramIndex, SearchMatch, get_trigrams
+
+
+def test_get_trigrams():
+    # Act & Assert
+    assert get_trigrams("Fry") == frozenset({"  f", " fr", "fry", "ry "})
+
+
+class TestNGramIndex:
+    def test_not_loaded(self):
+        # Arrange
+        index = NGramIndex()
+
+        # Act & Assert
+        assert index.is_loaded is False
+        assert index.search("fry") == []
+
+    def test_search_prefix_first(self):
+        # Arrange
+        index = NGramIndex()
+        index.set({1: "Philip J. Fry", 2: "Leela", 3: "Fry's Dog"})
+
+        # Act
+        matches: list[SearchMatch] = index.search("fr")
+
+        # Assert
+        assert [match.id for match in matches] == [3, 1]
+        assert all(match.is_prefix for match in matches)
+
+    def test_search_previous_words_must_be_complete(self):
+        # Arrange
+        index = NGramIndex()
+        index.set({1: "Hubert Farnsworth", 2: "Cubert Farnsworth"})
+
+        # Act
+        matches: list[SearchMatch] = index.search("cubert far")
+
+        # Assert
+        assert [match.id for match in matches if match.is_prefix] == [2]
+
+    def test_search_similar(self):
+        # Arrange
+        index = NGramIndex()
+        index.set({1: "Bender", 2: "Leela", 3: "Zoidberg"})
+
+        # Act
+        matches: list[SearchMatch] = index.search("bendr")
+
+        # Assert
+        assert [match.id for match in matches] == [1]
+        assert matches[0].is_prefix is False
+
+    def test_search_threshold(self):
+        # Arrange
+        index = NGramIndex(threshold=1.0)
+        index.set({1: "Bender"})
+
+        # Act & Assert
+        assert index.search("bendr") == []
+        assert [match.id for match in index.search("bender")] == [1]
+
+    def test_search_limit(self):
+        # Arrange
+        index = NGramIndex()
+        index.set({1: "Amy", 2: "Amy Wong", 3: "Amy's Dad"})
+
+        # Act & Assert
+        assert len(index.search("amy", limit=2)) == 2  # noqa: PLR2004
+
+    def test_clear(self):
+        # Arrange
+        index = NGramIndex()
+        index.set({1: "Bender"})
+
+        # Act
+        index.clear()
+
+        # Assert
+        assert index.is_loaded is False
@@ -0,0 +1,82 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from futuramaapi.helpers.caches import Revocations, TTLCache
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        # Arrange
+        cache: TTLCache[str, int] = TTLCache(ttl=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Act
+        cache.get("a")
+        cache.set("c", 3)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == cache.max_size
+
+    def test_expires(self):
+        # Arrange
+        cache: TTLCache[str, int] = TTLCache(ttl=60, max_size=2)
+        with patch("futuramaapi.helpers.caches.monotonic", return_value=0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=10)
+            cache.set("c", 3, ttl=0)
+
+        # Act & Assert
+        with patch("futuramaapi.helpers.caches.monotonic", return_value=30):
+            assert cache.get("a") == 1
+            assert cache.get("b") is None
+            assert cache.get("c") is None
+
+
+class TestRevocations:
+    @pytest.fixture
+    def mock_client(self, request):
+        client = MagicMock()
+        client.mget = AsyncMock()
+        patcher = patch.object(Revocations, "_get_client", return_value=client)
+        patcher.start()
+        request.addfinalizer(patcher.stop)
+        return client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("revoked_at", "expected"),
+        [
+            ([None, None], False),
+            ([None, "99.5"], False),
+            (["100.0", None], True),
+            ([None, "100.5"], True),
+        ],
+    )
+    async def test_is_revoked(self, mock_client, revoked_at, expected):
+        # Arrange
+        mock_client.mget.return_value = revoked_at
+        revocations = Revocations(prefix="test", ttl=60)
+
+        # Act
+        result = await revocations.is_revoked(100.0, "session:key", "user:1")
+
+        # Assert
+        assert result is expected
+        mock_client.mget.assert_awaited_once_with(["test:session:key", "test:user:1"])
+
+    @pytest.mark.asyncio
+    async def test_is_revoked_redis_error(self, mock_client):
+        # Arrange
+        mock_client.mget.side_effect = RedisConnectionError()
+        revocations = Revocations(prefix="test", ttl=60)
+
+        # Act
+        result = await revocations.is_revoked(100.0, "user:1")
+
+        # Assert
+        assert result is True
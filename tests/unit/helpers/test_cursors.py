@@ -0,0 +1,35 @@
+import pytest
+
+from futuramaapi.helpers.cursors import decode_cursor, encode_cursor
+
+
+class TestCursors:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            (1,),
+            ("Bender", 42),
+        ],
+    )
+    def test_round_trip(self, values: tuple):
+        # Act
+        cursor: str = encode_cursor(values)
+
+        # Assert
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == values
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "",
+            "not a cursor",
+            "e30",  # {}
+            "W10",  # []
+            "W1tdXQ",  # [[]]
+        ],
+    )
+    def test_decode_invalid(self, cursor: str):
+        # Act / Assert
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
@@ -1,4 +1,8 @@
-from futuramaapi.helpers.hashers import hasher
+import asyncio
+
+import pytest
+
+from futuramaapi.helpers.hashers import HasherBusyError, PasswordHasherPBKDF2, hasher
 
 
 class TestHasher:
@@ -7,3 +11,26 @@ class TestHasher:
         decoded: str = hasher.encode(password)
 
         assert hasher.verify(password, decoded)
+
+    @pytest.mark.asyncio
+    async def test_averify(self):
+        password: str = "123"  # noqa: S105
+        decoded: str = await hasher.aencode(password)
+
+        assert await hasher.averify(password, decoded)
+        assert not await hasher.averify("1234", decoded)
+        assert hasher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_aencode_busy(self):
+        busy_hasher = PasswordHasherPBKDF2(max_workers=1, max_pending=1)
+
+        results = await asyncio.gather(
+            busy_hasher.aencode("123", iterations=1),
+            busy_hasher.aencode("123", iterations=1),
+            return_exceptions=True,
+        )
+        busy_hasher.shutdown()
+
+        assert isinstance(results[0], str)
+        assert isinstance(results[1], HasherBusyError)
@@ -0,0 +1,62 @@
+import pytest
+
+from futuramaapi.helpers.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_render_counter(self):
+        # Arrange
+        registry = MetricsRegistry(prefix="test_")
+        counter = registry.counter("queries_total", "Queries.", labels=["source"])
+
+        # Act
+        counter.inc("GetCharacterService")
+        counter.inc("GetCharacterService")
+        counter.inc('say "hi"')
+
+        # Assert
+        assert registry.render().splitlines() == [
+            "# HELP test_queries_total Queries.",
+            "# TYPE test_queries_total counter",
+            'test_queries_total{source="GetCharacterService"} 2',
+            'test_queries_total{source="say \\"hi\\""} 1',
+        ]
+
+    def test_render_histogram(self):
+        # Arrange
+        registry = MetricsRegistry()
+        histogram = registry.histogram("duration_seconds", "Duration.", buckets=[0.1, 1.0])
+
+        # Act
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(2.0)
+
+        # Assert
+        lines: list[str] = registry.render().splitlines()
+        assert 'duration_seconds_bucket{le="0.1"} 1' in lines
+        assert 'duration_seconds_bucket{le="1.0"} 2' in lines
+        assert 'duration_seconds_bucket{le="+Inf"} 3' in lines
+        assert "duration_seconds_sum 2.6" in lines
+        assert "duration_seconds_count 3" in lines
+
+    def test_render_gauge(self):
+        # Arrange
+        registry = MetricsRegistry()
+        connections: list[int] = []
+        registry.gauge("connections", "Connections.").set_function(lambda: len(connections))
+
+        # Act
+        connections.append(1)
+
+        # Assert
+        assert "connections 1" in registry.render().splitlines()
+
+    def test_register_twice(self):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.counter("queries_total", "Queries.")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("queries_total", "Queries.")
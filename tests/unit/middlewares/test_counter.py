@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from futuramaapi.middlewares.counter import APIRequestsCounter, RequestsCounter
+
+
+@pytest.fixture
+def mock_count_urls(request):
+    patcher = patch(
+        "futuramaapi.middlewares.counter.RequestsCounterModel.count_urls",
+        new_callable=AsyncMock,
+    )
+    mocked = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mocked
+
+
+@pytest.fixture
+def mock_requests_counter(request):
+    patcher = patch("futuramaapi.middlewares.counter.requests_counter")
+    mocked = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mocked
+
+
+class TestRequestsCounter:
+    @pytest.mark.asyncio
+    async def test_flush(self, mock_count_urls):
+        # Arrange
+        counter = RequestsCounter()
+        counter.add("/api/characters")
+        counter.add("/api/characters")
+        counter.add("/api/episodes")
+
+        # Act
+        await counter.flush()
+
+        # Assert
+        mock_count_urls.assert_awaited_once_with({"/api/characters": 2, "/api/episodes": 1})
+        assert counter.pending_total == 0
+        assert counter.pending == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_sorted(self, mock_count_urls):
+        # Arrange
+        counter = RequestsCounter()
+        for url in ("/api/seasons", "/api/characters", "/api/episodes"):
+            counter.add(url)
+
+        # Act
+        await counter.flush()
+
+        # Assert
+        assert list(mock_count_urls.await_args.args[0]) == ["/api/characters", "/api/episodes", "/api/seasons"]
+
+    @pytest.mark.asyncio
+    async def test_flush_failed_keeps_pending(self, mock_count_urls):
+        # Arrange
+        mock_count_urls.side_effect = ConnectionError
+        counter = RequestsCounter()
+        counter.add("/api/characters")
+
+        # Act
+        with pytest.raises(ConnectionError):
+            await counter.flush()
+
+        # Assert
+        assert counter.pending == {"/api/characters": 1}
+        assert counter.pending_total == 1
+
+    @pytest.mark.asyncio
+    async def test_threshold_triggers_flush(self, mock_count_urls):
+        # Arrange
+        counter = RequestsCounter(flush_interval=60, flush_threshold=2)
+        await counter.start()
+
+        # Act
+        counter.add("/api/characters")
+        counter.add("/api/characters")
+        await asyncio.sleep(0.01)
+
+        # Assert
+        mock_count_urls.assert_awaited_once_with({"/api/characters": 2})
+        await counter.stop()
+        mock_count_urls.assert_awaited_once()
+
+
+class TestAPIRequestsCounter:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("path", "is_counted"),
+        [
+            ("/api/characters/1", True),
+            ("/docs", False),
+        ],
+    )
+    async def test_call(self, mock_requests_counter, path: str, is_counted: bool):
+        # Arrange
+        app = AsyncMock()
+        middleware = APIRequestsCounter(app)
+        scope = {
+            "type": "http",
+            "scheme": "https",
+            "server": ("localhost", 443),
+            "path": path,
+            "query_string": b"page=2",
+            "headers": [],
+        }
+
+        # Act
+        await middleware(scope, AsyncMock(), AsyncMock())
+
+        # Assert
+        app.assert_awaited_once()
+        if is_counted:
+            mock_requests_counter.add.assert_called_once_with(f"https://localhost{path}")
+        else:
+            mock_requests_counter.add.assert_not_called()
@@ -0,0 +1,69 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import SecretStr
+from starlette.types import Message, Receive, Scope, Send
+
+from futuramaapi.helpers.profiling import current_profile, profile_phase
+from futuramaapi.middlewares.timing import ServerTimingMiddleware
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    profile = current_profile.get()
+    profile.add_statement("SELECT\n  1", 0.002)
+    with profile_phase("render"):
+        pass
+
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _call(*headers: tuple[bytes, bytes]) -> dict[str, str]:
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await ServerTimingMiddleware(_app)({"type": "http", "headers": list(headers)}, None, send)
+    return {key.decode(): value.decode() for key, value in messages[0]["headers"]}
+
+
+@pytest.fixture
+def debug_token(request) -> str:
+    patcher = patch("futuramaapi.middlewares.timing.settings.debug_token", SecretStr("token"))
+    patcher.start()
+    request.addfinalizer(patcher.stop)
+    return "token"
+
+
+class TestServerTimingMiddleware:
+    @pytest.mark.asyncio
+    async def test_server_timing(self, debug_token):
+        # Act
+        headers: dict[str, str] = await _call()
+
+        # Assert
+        metrics: list[str] = headers["server-timing"].split(", ")
+        assert [metric.split(";")[0] for metric in metrics] == ["db", "render", "total"]
+        assert metrics[0].startswith("db;dur=2.00")
+        assert "x-request-profile" not in headers
+        assert current_profile.get() is None
+
+    @pytest.mark.asyncio
+    async def test_profile_for_trusted_requests(self, debug_token):
+        # Act
+        headers: dict[str, str] = await _call((b"x-debug-token", debug_token.encode()))
+
+        # Assert
+        profile: dict = json.loads(headers["x-request-profile"])
+        assert profile["statements"] == [{"statement": "SELECT 1", "duration_ms": 2.0}]
+        assert profile["phases"]["db"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_profile_for_untrusted_requests(self, debug_token):
+        # Act
+        headers: dict[str, str] = await _call((b"x-debug-token", b"guess"))
+
+        # Assert
+        assert "x-request-profile" not in headers
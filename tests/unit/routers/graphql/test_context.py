@@ -0,0 +1,38 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.routers.graphql.context import Context
+
+
+class TestContext:
+    @pytest.mark.asyncio
+    async def test_get_loader_batches_and_caches(self, character: CharacterModel):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [character]
+        session = AsyncMock()
+        session.execute.return_value = mock_result
+
+        context = Context(session)
+        loader = context.get_loader(CharacterModel)
+
+        # Act
+        found, missing = await asyncio.gather(
+            loader.load(character.id),
+            loader.load(character.id + 1),
+        )
+        cached = await loader.load(character.id)
+
+        # Assert
+        assert found is character
+        assert missing is None
+        assert cached is character
+        assert context.get_loader(CharacterModel) is loader
+        session.execute.assert_called_once()
+
+        statement = session.execute.call_args[0][0]
+        assert "= ANY" in str(statement)
+        assert statement.compile().params["ids"] == [character.id, character.id + 1]
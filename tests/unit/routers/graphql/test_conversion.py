@@ -0,0 +1,36 @@
+import pytest
+
+from futuramaapi.db.models import CharacterModel, EpisodeModel, SeasonModel
+from futuramaapi.routers.graphql.conversion import CompiledModelConverter, ModelConverter
+from futuramaapi.routers.graphql.schemas import Character, Characters, Episode, Season
+
+
+class TestCompiledModelConverter:
+    @pytest.mark.parametrize(
+        ("type_", "fixture"),
+        [
+            (Character, "character"),
+            (Episode, "episode"),
+            (Season, "season"),
+        ],
+    )
+    def test_to_strawberry_matches_model_converter(self, request, type_: type, fixture: str):
+        # Arrange
+        instance: CharacterModel | EpisodeModel | SeasonModel = request.getfixturevalue(fixture)
+
+        # Act
+        result = CompiledModelConverter().to_strawberry(type_, instance)
+
+        # Assert
+        assert result == ModelConverter().to_strawberry(type_, instance)
+
+    def test_get_edges(self, character: CharacterModel):
+        # Arrange
+        converter = CompiledModelConverter()
+
+        # Act
+        edges = converter.get_edges(Characters, [character, character])
+
+        # Assert
+        assert edges == ModelConverter().get_edges(Characters, [character, character])
+        assert converter.get_constructor(Character) is converter.get_constructor(Character)
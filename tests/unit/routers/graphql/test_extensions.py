@@ -0,0 +1,128 @@
+from hashlib import sha256
+from unittest.mock import patch
+
+import pytest
+
+from futuramaapi.routers.graphql.api import schema
+from futuramaapi.routers.graphql.extensions import (
+    DocumentCache,
+    PersistedQueryError,
+    PersistedQueryNotFoundError,
+    QueryTooExpensiveError,
+)
+
+QUERY: str = "{ __typename }"
+
+
+def _get_extensions(query: str, /) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": sha256(query.encode()).hexdigest()}}
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache(request):
+    request.addfinalizer(DocumentCache.cache.clear)
+
+
+class TestDocumentCache:
+    @pytest.mark.asyncio
+    async def test_persisted_query_not_found(self):
+        # Act
+        result = await schema.execute(None, operation_extensions=_get_extensions(QUERY))
+
+        # Assert
+        assert result.errors is not None
+        assert isinstance(result.errors[0], PersistedQueryNotFoundError)
+
+    @pytest.mark.asyncio
+    async def test_persisted_query_registered(self):
+        # Arrange
+        await schema.execute(QUERY, operation_extensions=_get_extensions(QUERY))
+
+        # Act
+        result = await schema.execute(None, operation_extensions=_get_extensions(QUERY))
+
+        # Assert
+        assert result.errors is None
+        assert result.data == {"__typename": "Query"}
+
+    @pytest.mark.asyncio
+    async def test_persisted_query_hash_mismatch(self):
+        # Act
+        result = await schema.execute(QUERY, operation_extensions=_get_extensions("{ other }"))
+
+        # Assert
+        assert result.errors is not None
+        assert isinstance(result.errors[0], PersistedQueryError)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_skips_parse_and_validate(self, request):
+        # Arrange
+        await schema.execute("{ unknown }")
+        parse_patcher = patch("strawberry.schema.schema.parse")
+        validate_patcher = patch("strawberry.schema.schema.validate_document")
+        mock_parse = parse_patcher.start()
+        mock_validate = validate_patcher.start()
+        request.addfinalizer(parse_patcher.stop)
+        request.addfinalizer(validate_patcher.stop)
+
+        # Act
+        result = await schema.execute("{ unknown }")
+
+        # Assert
+        assert result.errors is not None
+        assert "unknown" in result.errors[0].message
+        mock_parse.assert_not_called()
+        mock_validate.assert_not_called()
+
+
+class TestQueryCostLimiter:
+    @pytest.mark.asyncio
+    async def test_cost_in_extensions(self):
+        # Act
+        result = await schema.execute(
+            "query Seasons($limit: Int) { seasons(limit: $limit) { edges { episodes { id } } } }",
+            variable_values={"limit": 2},
+        )
+
+        # Assert
+        assert result.extensions is not None
+        # The page costs 50, each of the 2 edges 1 and each of their 26 episodes 1.
+        assert result.extensions["cost"]["requested"] == 50 + 2 + 2 * 26
+        assert result.extensions["cost"]["depth"] == 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("aliases", [30, 50])
+    async def test_aliases_rejected(self, aliases):
+        # Arrange
+        query: str = "{ " + " ".join(f"c{i}: characters(limit: 50) {{ edges {{ id }} }}" for i in range(aliases)) + " }"
+
+        # Act
+        result = await schema.execute(query)
+
+        # Assert
+        assert result.data is None
+        assert result.errors is not None
+        assert isinstance(result.errors[0], QueryTooExpensiveError)
+
+    @pytest.mark.asyncio
+    async def test_depth_rejected(self, request):
+        # Arrange
+        patcher = patch("futuramaapi.routers.graphql.extensions.settings.graphql_max_depth", 2)
+        patcher.start()
+        request.addfinalizer(patcher.stop)
+
+        # Act
+        result = await schema.execute("{ characters { edges { id } } }")
+
+        # Assert
+        assert result.errors is not None
+        assert isinstance(result.errors[0], QueryTooExpensiveError)
+        assert "depth" in result.errors[0].message
+
+    @pytest.mark.asyncio
+    async def test_introspection_not_limited(self):
+        # Act
+        result = await schema.execute("{ __schema { types { fields { type { ofType { ofType { name } } } } } } }")
+
+        # Assert
+        assert result.errors is None
@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from futuramaapi.routers.graphql.context import Context
+from futuramaapi.routers.graphql.mixins import _get_total
+from futuramaapi.routers.graphql.schemas import Characters, Query
+
+
+@pytest_asyncio.fixture
+async def session():
+    mock_result = MagicMock()
+    mock_result.scalar.return_value = 3
+    mock_session = AsyncMock()
+    mock_session.execute.return_value = mock_result
+
+    yield mock_session
+
+    await _get_total.cache.clear()
+
+
+class TestStrawberryDatabaseMixin:
+    @pytest.mark.asyncio
+    async def test_get_total_filtered_and_cached(self, session):
+        # Arrange
+        extra: dict = {"gender": None, "species": Query.SpeciesFilter.robot, "status": None}
+
+        # Act
+        first: int = await Characters.get_total(Context(session), extra)
+        second: int = await Characters.get_total(Context(session), dict(extra))
+
+        # Assert
+        assert first == second == session.execute.return_value.scalar.return_value
+        session.execute.assert_called_once()
+        assert "WHERE characters.species" in str(session.execute.call_args[0][0])
+
+    @pytest.mark.asyncio
+    async def test_get_total_per_filter_combination(self, session):
+        # Act
+        await Characters.get_total(Context(session), {"species": Query.SpeciesFilter.robot})
+        await Characters.get_total(Context(session), {"species": Query.SpeciesFilter.not_robot})
+        await Characters.get_total(Context(session), None)
+
+        # Assert
+        assert session.execute.call_count == len(("robot", "!robot", "unfiltered"))
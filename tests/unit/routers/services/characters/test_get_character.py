@@ -10,7 +10,7 @@ from futuramaapi.core import settings
 from futuramaapi.db import INT32
 from futuramaapi.db.models import CharacterModel
 from futuramaapi.routers.services import NotFoundError
-from futuramaapi.routers.services.characters.get_character import GetCharacterService
+from futuramaapi.routers.services.characters.get_character import GetCharactersBulkService, GetCharacterService
 
 
 class TestGetCharacterService:
@@ -96,3 +96,88 @@ class TestGetCharacterService:
         # Act & Assert
         with pytest.raises(NotFoundError):
             await service()
+
+    @pytest.mark.asyncio
+    async def test_get_character_service_cached(
+        self,
+        character: CharacterModel,
+        loaded_catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = GetCharacterService(pk=character.id)
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.id == character.id
+        assert result.name == character.name
+        mock_session_manager.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_character_service_cached_not_found(
+        self,
+        character: CharacterModel,
+        loaded_catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = GetCharacterService(pk=character.id + 1)
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await service()
+        mock_session_manager.execute.assert_not_called()
+
+
+class TestGetCharactersBulkService:
+    @pytest.mark.asyncio
+    async def test_get_characters_bulk_keeps_order(self, character: CharacterModel, mock_session_manager):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [character]
+        mock_session_manager.execute.return_value = mock_result
+
+        missing_id: int = character.id + 1 if character.id < INT32 else character.id - 1
+        service = GetCharactersBulkService(ids=f"{missing_id},{character.id},{missing_id}")
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert [item.id if item is not None else None for item in result.items] == [None, character.id, None]
+        assert result.missing == [missing_id]
+        mock_session_manager.execute.assert_awaited_once()
+        assert "ANY" in str(mock_session_manager.execute.call_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_get_characters_bulk_out_of_range(self, mock_session_manager):
+        # Arrange
+        service = GetCharactersBulkService(ids=[INT32 + 1])
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.items == [None]
+        assert result.missing == [INT32 + 1]
+        mock_session_manager.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_characters_bulk_cached(
+        self,
+        character: CharacterModel,
+        loaded_catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = GetCharactersBulkService(ids=[character.id])
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert [item.name for item in result.items if item is not None] == [character.name]
+        assert result.missing == []
+        mock_session_manager.execute.assert_not_called()
@@ -2,8 +2,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from faker import Faker
+from fastapi_pagination import Params, set_params
 
-from futuramaapi.routers.services.characters.list_characters import ListCharactersService
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.helpers.cursors import decode_cursor, encode_cursor
+from futuramaapi.routers.services import InvalidCursorError
+from futuramaapi.routers.services.characters.list_characters import (
+    ListCharactersCursorService,
+    ListCharactersService,
+)
 
 
 @pytest.fixture
@@ -223,3 +230,173 @@ class TestListCharactersService:
 
         # Assert
         mock_paginate.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("gender", "query", "expected"),
+        [
+            ("male", None, 1),
+            ("!male", None, 0),
+            (None, "%", 1),
+            (None, r"%\%%", 0),
+        ],
+    )
+    async def test_list_characters_cached(  # noqa: PLR0913
+        self,
+        character: CharacterModel,
+        loaded_catalog,
+        mock_session_manager,
+        mock_paginate,
+        gender: str | None,
+        query: str | None,
+        expected: int,
+    ):
+        # Arrange
+        set_params(Params())
+        service = ListCharactersService(
+            gender=gender,
+            character_status=None,
+            species=None,
+            query=query,
+        )
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.total == expected
+        mock_paginate.assert_not_called()
+        mock_session_manager.execute.assert_not_called()
+
+
+class TestListCharactersCursorService:
+    @pytest.mark.asyncio
+    async def test_list_characters_cursor_next_page(
+        self,
+        character: CharacterModel,
+        mock_session_manager,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [character, character, character]
+        mock_session_manager.execute.return_value = mock_result
+
+        service = ListCharactersCursorService(
+            gender=None,
+            character_status=None,
+            species=None,
+            query=None,
+            after=encode_cursor((1,)),
+            size=2,
+        )
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert [item.id for item in result.items] == [character.id, character.id]
+        assert decode_cursor(result.next_cursor) == (character.id,)
+        assert result.total is None
+        mock_session_manager.execute.assert_called_once()
+
+        statement = str(mock_session_manager.execute.call_args[0][0])
+        assert "(characters.id) > " in statement
+        assert "LIMIT" in statement
+
+    @pytest.mark.asyncio
+    async def test_list_characters_cursor_total(
+        self,
+        mock_session_manager,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_result.scalar_one.return_value = 0
+        mock_session_manager.execute.return_value = mock_result
+
+        service = ListCharactersCursorService(
+            gender="male",
+            character_status=None,
+            species=None,
+            query=None,
+            include_total=True,
+        )
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.items == []
+        assert result.next_cursor is None
+        assert result.total == 0
+        _, count_call = mock_session_manager.execute.call_args_list
+        assert "count(*)" in str(count_call[0][0])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "after",
+        [
+            "not a cursor",
+            encode_cursor(("1",)),
+            encode_cursor((1, 2)),
+        ],
+    )
+    async def test_list_characters_cursor_invalid(
+        self,
+        mock_session_manager,
+        after: str,
+    ):
+        # Arrange
+        service = ListCharactersCursorService(
+            gender=None,
+            character_status=None,
+            species=None,
+            query=None,
+            after=after,
+        )
+
+        # Act / Assert
+        with pytest.raises(InvalidCursorError):
+            await service()
+
+        mock_session_manager.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("direction", "offset", "expected"),
+        [
+            ("asc", None, 1),
+            ("asc", -1, 1),
+            ("asc", 0, 0),
+            ("desc", 1, 1),
+            ("desc", 0, 0),
+        ],
+    )
+    async def test_list_characters_cursor_cached(  # noqa: PLR0913
+        self,
+        character: CharacterModel,
+        loaded_catalog,
+        mock_session_manager,
+        direction: str,
+        offset: int | None,
+        expected: int,
+    ):
+        # Arrange
+        service = ListCharactersCursorService(
+            gender=None,
+            character_status=None,
+            species=None,
+            query=None,
+            direction=direction,
+            after=encode_cursor((character.id + offset,)) if offset is not None else None,
+            include_total=True,
+        )
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert len(result.items) == expected
+        assert result.next_cursor is None
+        assert result.total == 1
+        mock_session_manager.execute.assert_not_called()
@@ -0,0 +1,44 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from futuramaapi.db.catalog import Catalog
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.routers.services.characters.search_characters import SearchCharactersService
+
+
+class TestSearchCharactersService:
+    @pytest.mark.asyncio
+    async def test_search_characters_cached(
+        self,
+        character: CharacterModel,
+        loaded_catalog: Catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = SearchCharactersService(query=character.name[:2])
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert [item.id for item in result] == [character.id]
+        mock_session_manager.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_search_characters_from_database(self, character: CharacterModel, mock_session_manager):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [character]
+        mock_session_manager.execute.return_value = mock_result
+
+        service = SearchCharactersService(query="fry", limit=5)
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert [item.id for item in result] == [character.id]
+        statement: str = str(mock_session_manager.execute.call_args.args[0])
+        assert "similarity" in statement
+        assert "LIMIT" in statement
@@ -2,7 +2,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from futuramaapi.routers.services.episodes.list_episodes import ListEpisodesService
+from futuramaapi.db.models import EpisodeModel
+from futuramaapi.helpers.cursors import decode_cursor, encode_cursor
+from futuramaapi.routers.services.episodes.list_episodes import ListEpisodesCursorService, ListEpisodesService
 
 
 @pytest.fixture
@@ -38,3 +40,52 @@ class TestListEpisodesService:
 
         args, _ = mock_paginate.call_args
         assert args[0] is mock_session_manager
+
+
+class TestListEpisodesCursorService:
+    @pytest.mark.asyncio
+    async def test_list_episodes_cursor_cached(
+        self,
+        episode: EpisodeModel,
+        loaded_catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = ListEpisodesCursorService(size=1)
+
+        # Act
+        first = await service()
+        second = await ListEpisodesCursorService(after=encode_cursor((episode.id,)))()
+
+        # Assert
+        assert [item.id for item in first.items] == [episode.id]
+        assert first.next_cursor is None
+        assert second.items == []
+        mock_session_manager.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_episodes_cursor_desc(
+        self,
+        episode: EpisodeModel,
+        mock_session_manager,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [episode, episode]
+        mock_session_manager.execute.return_value = mock_result
+
+        service = ListEpisodesCursorService(
+            direction="desc",
+            after=encode_cursor((episode.id + 1,)),
+            size=1,
+        )
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert decode_cursor(result.next_cursor) == (episode.id,)
+
+        statement = str(mock_session_manager.execute.call_args[0][0])
+        assert "(episodes.id) < " in statement
+        assert "ORDER BY episodes.id DESC" in statement
@@ -0,0 +1,98 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.responses import HTMLResponse
+
+from futuramaapi.db.session import session_manager
+from futuramaapi.helpers.caches import TTLCache
+from futuramaapi.routers.services.index.get_index import GetIndexService
+
+
+def _get_request(**cookies: str) -> MagicMock:
+    request = MagicMock()
+    request.cookies = cookies
+    request.url.path = "/"
+    return request
+
+
+class TestGetIndexService:
+    @pytest.fixture(autouse=True)
+    def mock_session(self, mock_session_manager):
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 0
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session_manager.execute.return_value = mock_result
+        return mock_session_manager
+
+    @pytest.fixture(autouse=True)
+    def mock_templates(self, request):
+        patcher = patch("futuramaapi.routers.services._base_template.templates")
+        templates = patcher.start()
+        request.addfinalizer(patcher.stop)
+
+        templates.TemplateResponse.side_effect = lambda *_, **__: HTMLResponse(b"<html></html>")
+        return templates
+
+    @pytest.fixture(autouse=True)
+    def page_cache(self, request):
+        patcher = patch.object(GetIndexService, "page_cache", TTLCache(ttl=10, max_size=1))
+        request.addfinalizer(patcher.stop)
+        return patcher.start()
+
+    @pytest.fixture
+    def mock_get_user(self, request):
+        patcher = patch(
+            "futuramaapi.routers.services._base_template.auth_session_cache.get_user",
+            new=AsyncMock(return_value=None),
+        )
+        request.addfinalizer(patcher.stop)
+        return patcher.start()
+
+    @pytest.mark.asyncio
+    async def test_anonymous_page_cached(self, mock_templates, mock_session):
+        # Arrange
+        first = await GetIndexService(context={"request": _get_request()})()
+        mock_session.execute.reset_mock()
+
+        # Act
+        second = await GetIndexService(context={"request": _get_request()})()
+
+        # Assert
+        assert second.body == first.body
+        mock_templates.TemplateResponse.assert_called_once()
+        mock_session.execute.assert_not_called()
+        session_manager.create_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_authenticated_page_not_cached(self, mock_templates, mock_get_user):
+        # Arrange
+        request = _get_request(Authorization="key")
+
+        # Act
+        await GetIndexService(context={"request": request})()
+        await GetIndexService(context={"request": request})()
+
+        # Assert
+        assert mock_templates.TemplateResponse.call_count == 2  # noqa: PLR2004
+        assert mock_get_user.await_count == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_queries_run_on_separate_sessions(self):
+        # Act
+        await GetIndexService(context={"request": _get_request()})()
+
+        # Assert
+        queries = ["total_requests", "user_count", "characters", "system_messages"]
+        assert session_manager.session.call_count == len(queries)
+        session_manager.create_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queries_share_session_without_spare_connections(self):
+        # Arrange
+        with patch.object(session_manager, "has_spare_connections", return_value=False):
+            # Act
+            await GetIndexService(context={"request": _get_request()})()
+
+        # Assert
+        session_manager.session.assert_not_called()
+        session_manager.create_session.assert_called_once()
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from futuramaapi.routers.services import NotFoundError
+from futuramaapi.routers.services.links.redirect_link import (
+    LinkClicksCounter,
+    RedirectLinkService,
+    link_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_link_cache(request):
+    request.addfinalizer(link_cache.clear)
+
+
+@pytest.fixture
+def link_clicks(request):
+    patcher = patch(
+        "futuramaapi.routers.services.links.redirect_link.link_clicks",
+        LinkClicksCounter(),
+    )
+    mocked = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mocked
+
+
+class TestRedirectLinkService:
+    @pytest.mark.asyncio
+    async def test_redirect_link_cached(self, mock_session_manager, link_clicks):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = SimpleNamespace(id=1, url="https://futuramaapi.com")
+        mock_session_manager.execute.return_value = mock_result
+
+        # Act
+        first = await RedirectLinkService(shortened="abcdefg")()
+        second = await RedirectLinkService(shortened="abcdefg")()
+
+        # Assert
+        assert first.headers["location"] == second.headers["location"] == "https://futuramaapi.com"
+        mock_session_manager.execute.assert_awaited_once()
+        mock_session_manager.commit.assert_not_called()
+        assert link_clicks.pending == {1: 2}
+
+    @pytest.mark.asyncio
+    async def test_redirect_link_not_found(self, mock_session_manager, link_clicks):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.one_or_none.return_value = None
+        mock_session_manager.execute.return_value = mock_result
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await RedirectLinkService(shortened="abcdefg")()
+        assert link_clicks.pending_total == 0
+
+
+class TestLinkClicksCounter:
+    @pytest.mark.asyncio
+    async def test_flush(self):
+        # Arrange
+        counter = LinkClicksCounter()
+        counter.add(1)
+        counter.add(1)
+        counter.add(2)
+
+        # Act
+        with patch(
+            "futuramaapi.routers.services.links.redirect_link.LinkModel.count_clicks",
+            new_callable=AsyncMock,
+        ) as count_clicks:
+            await counter.flush()
+
+        # Assert
+        count_clicks.assert_awaited_once_with({1: 2, 2: 1})
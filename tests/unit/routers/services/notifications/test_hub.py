@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from futuramaapi.routers.services.notifications.hub import NotificationHub
+
+
+class _Ticker:
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.release: asyncio.Event = asyncio.Event()
+
+    async def __call__(self) -> bytes:
+        await self.release.wait()
+        self.release.clear()
+        self.calls += 1
+        return f"data: {self.calls}\r\n\r\n".encode()
+
+
+class TestNotificationHub:
+    @pytest.mark.asyncio
+    async def test_fan_out(self):
+        # Arrange
+        hub = NotificationHub(queue_size=4)
+        ticker = _Ticker()
+        first = hub.subscribe(1, ticker)
+        second = hub.subscribe(1, _Ticker())
+
+        # Act
+        first_event = asyncio.ensure_future(anext(first))
+        second_event = asyncio.ensure_future(anext(second))
+        await asyncio.sleep(0)
+        ticker.release.set()
+
+        # Assert
+        assert await first_event is await second_event
+        assert ticker.calls == 1
+        assert hub.connections == 2  # noqa: PLR2004
+        assert hub.channels == 1
+
+        await first.aclose()
+        assert hub.get_connections(1) == 1
+        await second.aclose()
+        assert hub.connections == 0
+        assert hub.channels == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_dropped(self):
+        # Arrange
+        hub = NotificationHub(queue_size=1)
+        ticker = _Ticker()
+        subscriber = hub.subscribe(1, ticker)
+        first_event = asyncio.ensure_future(anext(subscriber))
+        await asyncio.sleep(0)
+
+        # Act
+        for _ in range(3):
+            ticker.release.set()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        # Assert
+        assert await first_event == b"data: 1\r\n\r\n"
+        with pytest.raises(StopAsyncIteration):
+            await anext(subscriber)
+        assert hub.connections == 0
+        assert hub.channels == 0
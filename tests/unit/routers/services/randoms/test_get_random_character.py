@@ -1,20 +1,23 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlalchemy.exc import NoResultFound
 
 from futuramaapi.db.models import CharacterModel
+from futuramaapi.db.sampling import character_ids
 from futuramaapi.routers.services import NotFoundError
 from futuramaapi.routers.services.randoms.get_random_character import GetRandomCharacterService
 
 
 class TestGetRandomCharacterService:
     @pytest.mark.asyncio
-    async def test_get_random_character_service_success(self, character: CharacterModel, mock_session_manager):
+    async def test_get_random_character_service_success(
+        self,
+        character: CharacterModel,
+        mock_session_manager,
+        mock_sampled_rows,
+    ):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.one.return_value = character
-        mock_session_manager.execute.return_value = mock_result
+        mock_sampled_rows(character)
 
         service = GetRandomCharacterService()
 
@@ -24,12 +27,13 @@ class TestGetRandomCharacterService:
         # Assert
         assert result.id == character.id
         assert result.name == character.name
+        assert "random" not in str(mock_session_manager.execute.call_args[0][0])
 
     @pytest.mark.asyncio
     async def test_get_random_character_service_not_found(self, mock_session_manager):
         # Arrange
         mock_result = MagicMock()
-        mock_result.scalars.return_value.one.side_effect = NoResultFound
+        mock_result.scalars.return_value = []
         mock_session_manager.execute.return_value = mock_result
 
         service = GetRandomCharacterService()
@@ -37,3 +41,51 @@ class TestGetRandomCharacterService:
         # Act & Assert
         with pytest.raises(NotFoundError):
             await service()
+
+    @pytest.mark.asyncio
+    async def test_get_random_character_service_stale_index(
+        self,
+        character: CharacterModel,
+        mock_session_manager,
+    ):
+        # Arrange
+        character_ids.set([character.id + 1])
+
+        missing_result = MagicMock()
+        missing_result.scalars.return_value.all.return_value = []
+        ids_result = MagicMock()
+        ids_result.scalars.return_value = [character.id]
+        rows_result = MagicMock()
+        rows_result.scalars.return_value.all.return_value = [character]
+        mock_session_manager.execute.side_effect = [missing_result, ids_result, rows_result]
+
+        service = GetRandomCharacterService()
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.id == character.id
+        assert character_ids.sample() == [character.id]
+
+    @pytest.mark.asyncio
+    async def test_get_random_character_service_expired_index(
+        self,
+        character: CharacterModel,
+        mock_session_manager,
+        mock_sampled_rows,
+    ):
+        # Arrange
+        with patch("futuramaapi.db.sampling.monotonic", return_value=0):
+            character_ids.set([character.id + 1])
+        mock_sampled_rows(character)
+
+        service = GetRandomCharacterService()
+
+        # Act
+        with patch("futuramaapi.db.sampling.monotonic", return_value=character_ids.ttl):
+            result = await service()
+
+        # Assert
+        assert result.id == character.id
+        assert character_ids.sample() == [character.id]
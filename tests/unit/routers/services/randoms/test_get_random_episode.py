@@ -1,7 +1,6 @@
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.exc import NoResultFound
 
 from futuramaapi.db.models import EpisodeModel
 from futuramaapi.routers.services import NotFoundError
@@ -10,11 +9,14 @@ from futuramaapi.routers.services.randoms.get_random_episode import GetRandomEpi
 
 class TestGetRandomEpisodeService:
     @pytest.mark.asyncio
-    async def test_get_random_episode_service_success(self, episode: EpisodeModel, mock_session_manager):
+    async def test_get_random_episode_service_success(
+        self,
+        episode: EpisodeModel,
+        mock_session_manager,
+        mock_sampled_rows,
+    ):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.one.return_value = episode
-        mock_session_manager.execute.return_value = mock_result
+        mock_sampled_rows(episode)
 
         service = GetRandomEpisodeService()
 
@@ -29,7 +31,7 @@ class TestGetRandomEpisodeService:
     async def test_get_random_episode_service_not_found(self, mock_session_manager):
         # Arrange
         mock_result = MagicMock()
-        mock_result.scalars.return_value.one.side_effect = NoResultFound
+        mock_result.scalars.return_value = []
         mock_session_manager.execute.return_value = mock_result
 
         service = GetRandomEpisodeService()
@@ -1,7 +1,6 @@
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.exc import NoResultFound
 
 from futuramaapi.db.models import SeasonModel
 from futuramaapi.routers.services import NotFoundError
@@ -10,11 +9,14 @@ from futuramaapi.routers.services.randoms.get_random_season import GetRandomSeas
 
 class TestGetRandomSeasonService:
     @pytest.mark.asyncio
-    async def test_get_random_season_service_success(self, season: SeasonModel, mock_session_manager):
+    async def test_get_random_season_service_success(
+        self,
+        season: SeasonModel,
+        mock_session_manager,
+        mock_sampled_rows,
+    ):
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.one.return_value = season
-        mock_session_manager.execute.return_value = mock_result
+        mock_sampled_rows(season)
 
         service = GetRandomSeasonService()
 
@@ -29,7 +31,7 @@ class TestGetRandomSeasonService:
     async def test_get_random_season_service_not_found(self, mock_session_manager):
         # Arrange
         mock_result = MagicMock()
-        mock_result.scalars.return_value.one.side_effect = NoResultFound
+        mock_result.scalars.return_value = []
         mock_session_manager.execute.return_value = mock_result
 
         service = GetRandomSeasonService()
@@ -37,3 +39,15 @@ class TestGetRandomSeasonService:
         # Act & Assert
         with pytest.raises(NotFoundError):
             await service()
+
+    @pytest.mark.asyncio
+    async def test_get_random_season_service_cached(self, season: SeasonModel, loaded_catalog, mock_session_manager):
+        # Arrange
+        service = GetRandomSeasonService()
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.id == season.id
+        mock_session_manager.execute.assert_not_called()
@@ -0,0 +1,52 @@
+import pytest
+
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.routers.services.randoms.list_random_characters import ListRandomCharactersService
+
+
+class TestListRandomCharactersService:
+    @pytest.mark.asyncio
+    async def test_list_random_characters_distinct(
+        self,
+        faker,
+        character: CharacterModel,
+        mock_session_manager,
+        mock_sampled_rows,
+    ):
+        # Arrange
+        other: CharacterModel = CharacterModel(
+            id=character.id + 1,
+            name=faker.name(),
+            gender=character.gender,
+            status=character.status,
+            species=character.species,
+            created_at=character.created_at,
+            image=None,
+        )
+        mock_sampled_rows(character, other)
+
+        service = ListRandomCharactersService(count=5)
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert sorted(item.id for item in result) == [character.id, other.id]
+        assert "IN" in str(mock_session_manager.execute.call_args[0][0])
+
+    @pytest.mark.asyncio
+    async def test_list_random_characters_cached(
+        self,
+        character: CharacterModel,
+        loaded_catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = ListRandomCharactersService(count=3)
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert [item.id for item in result] == [character.id]
+        mock_session_manager.execute.assert_not_called()
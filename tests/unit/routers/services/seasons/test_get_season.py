@@ -7,7 +7,7 @@ from sqlalchemy.exc import NoResultFound
 from futuramaapi.db import INT32
 from futuramaapi.db.models import SeasonModel
 from futuramaapi.routers.services import NotFoundError
-from futuramaapi.routers.services.seasons.get_season import GetSeasonService
+from futuramaapi.routers.services.seasons.get_season import GetSeasonsBulkService, GetSeasonService
 
 
 class TestGetSeasonService:
@@ -44,3 +44,22 @@ class TestGetSeasonService:
         # Act & Assert
         with pytest.raises(NotFoundError):
             await service()
+
+
+class TestGetSeasonsBulkService:
+    @pytest.mark.asyncio
+    async def test_get_seasons_bulk_success(self, season: SeasonModel, mock_session_manager):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [season]
+        mock_session_manager.execute.return_value = mock_result
+
+        service = GetSeasonsBulkService(ids=[season.id])
+
+        # Act
+        result = await service()
+
+        # Assert
+        assert result.items[0] is not None
+        assert result.items[0].episodes[0].id == season.episodes[0].id
+        assert result.missing == []
@@ -0,0 +1,156 @@
+import gzip
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import status
+
+from futuramaapi.db.sampling import character_ids, episode_ids, season_ids
+from futuramaapi.routers.services import NotFoundError
+from futuramaapi.routers.services.sitemaps._base import Sitemap
+from futuramaapi.routers.services.sitemaps.get_sitemap import GetSiteMapService
+
+
+@pytest.fixture
+def loaded_ids():
+    character_ids.set([1, 2, 3])
+    episode_ids.set([])
+    season_ids.set([])
+
+
+def _get_request(**headers: str) -> MagicMock:
+    request = MagicMock()
+    request.headers = headers
+    return request
+
+
+class TestSitemap:
+    @pytest.mark.asyncio
+    async def test_build(self, loaded_ids):
+        # Arrange
+        sitemap = Sitemap()
+
+        # Act
+        await sitemap.build(["/", "/about", "/characters/{character_id}", "/users/{user_id}"])
+
+        # Assert
+        content: str = sitemap.get().content.decode()
+        assert "<loc>https://localhost/</loc>" in content
+        assert "<loc>https://localhost/characters/3</loc>" in content
+        assert "{" not in content
+        assert content.count("<url>") == 5  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_build_index(self, loaded_ids):
+        # Arrange
+        sitemap = Sitemap(max_urls=2)
+
+        # Act
+        await sitemap.build(["/characters/{character_id}", "/about"])
+
+        # Assert
+        index: str = sitemap.get().content.decode()
+        assert "<sitemapindex" in index
+        assert "<loc>https://localhost/sitemaps/sitemap-2.xml</loc>" in index
+        assert sitemap.get("sitemap-2.xml").content.decode().count("<url>") == 2  # noqa: PLR2004
+        assert sitemap.get("sitemap-3.xml") is None
+
+    @pytest.mark.asyncio
+    async def test_build_loads_used_ids_only(self, request):
+        # Arrange
+        mock_session = AsyncMock()
+        mock_session.execute.return_value.scalars = MagicMock(return_value=[1, 2])
+        patcher = patch("futuramaapi.routers.services.sitemaps._base.session_manager.session")
+        mock_session_factory = patcher.start()
+        request.addfinalizer(patcher.stop)
+        mock_session_factory.return_value.__aenter__.return_value = mock_session
+        sitemap = Sitemap()
+
+        # Act
+        await sitemap.build(["/about", "/episodes/{episode_id}"])
+
+        # Assert
+        mock_session.execute.assert_awaited_once()
+        assert episode_ids.is_loaded
+        assert not character_ids.is_loaded
+        assert not season_ids.is_loaded
+        assert "<loc>https://localhost/episodes/2</loc>" in sitemap.get().content.decode()
+
+
+class TestGetSiteMapService:
+    @pytest.fixture
+    def sitemap(self, request, loaded_ids):
+        built = Sitemap()
+        patcher = patch.object(GetSiteMapService, "sitemap", built)
+        patcher.start()
+        request.addfinalizer(patcher.stop)
+        return built
+
+    @pytest.mark.asyncio
+    async def test_get_sitemap_gzip(self, sitemap):
+        # Arrange
+        await sitemap.build(["/about"])
+        service = GetSiteMapService(context={"request": _get_request(**{"accept-encoding": "gzip, br"})})
+
+        # Act
+        response = await service()
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(response.body) == sitemap.get().content
+
+    @pytest.mark.asyncio
+    async def test_get_sitemap_not_modified(self, sitemap):
+        # Arrange
+        await sitemap.build(["/about"])
+        response = await GetSiteMapService()()
+
+        # Act
+        by_etag = await GetSiteMapService(
+            context={"request": _get_request(**{"if-none-match": response.headers["etag"]})},
+        )()
+        by_date = await GetSiteMapService(
+            context={"request": _get_request(**{"if-modified-since": response.headers["last-modified"]})},
+        )()
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert by_etag.status_code == status.HTTP_304_NOT_MODIFIED
+        assert by_date.status_code == status.HTTP_304_NOT_MODIFIED
+        assert by_etag.body == b""
+
+    @pytest.mark.asyncio
+    async def test_get_sitemap_rebuilt_on_catalog_refresh(  # noqa: PLR0913
+        self,
+        sitemap,
+        character,
+        episode,
+        season,
+        loaded_catalog,
+        mock_session_manager,
+    ):
+        # Arrange
+        await sitemap.build(["/characters/{character_id}"])
+        character.id += 1
+        results: list[MagicMock] = []
+        for item in (character, episode, season):
+            mock_result = MagicMock()
+            mock_result.scalars.return_value = [item]
+            results.append(mock_result)
+        mock_session_manager.execute.side_effect = results
+
+        # Act
+        await loaded_catalog.refresh()
+        response = await GetSiteMapService()()
+
+        # Assert
+        assert f"<loc>https://localhost/characters/{character.id}</loc>" in response.body.decode()
+        assert f"<loc>https://localhost/characters/{character.id - 1}</loc>" not in response.body.decode()
+
+    @pytest.mark.asyncio
+    async def test_get_sitemap_not_found(self, sitemap):
+        # Arrange
+        await sitemap.build(["/about"])
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await GetSiteMapService(name="sitemap-1.xml")()
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from futuramaapi.db.metrics import _after_cursor_execute, _before_cursor_execute, queries, query_rows
+from futuramaapi.routers.services import BaseSessionService
+from futuramaapi.routers.services._base import service_duration, service_errors
+
+
+class _QueryingService(BaseSessionService[None]):
+    rows: int
+
+    async def process(self, *args, **kwargs) -> None:
+        conn = MagicMock(info={})
+        _before_cursor_execute(conn)
+        _after_cursor_execute(conn, MagicMock(rowcount=self.rows), "SELECT 1")
+
+        if self.rows == 0:
+            raise LookupError
+
+
+class TestServiceMetrics:
+    @pytest.mark.asyncio
+    async def test_queries_attributed_to_service(self, mock_session_manager):
+        # Arrange
+        name: str = _QueryingService.__name__
+        calls: int = service_duration.get_count(name)
+        executed: float = queries.get(name)
+        rows: float = query_rows.get(name)
+
+        # Act
+        await _QueryingService(rows=3)()
+
+        # Assert
+        assert service_duration.get_count(name) == calls + 1
+        assert queries.get(name) == executed + 1
+        assert query_rows.get(name) == rows + 3
+
+    @pytest.mark.asyncio
+    async def test_errors_counted(self, mock_session_manager):
+        # Arrange
+        name: str = _QueryingService.__name__
+        errors: float = service_errors.get(name)
+
+        # Act
+        with pytest.raises(LookupError):
+            await _QueryingService(rows=0)()
+
+        # Assert
+        assert service_errors.get(name) == errors + 1
+
+
+class TestQueryMetrics:
+    def test_failed_query_not_kept(self):
+        # Arrange
+        conn = MagicMock(info={})
+        _before_cursor_execute(conn)
+
+        # Act
+        _before_cursor_execute(conn)
+        _after_cursor_execute(conn, MagicMock(rowcount=1), "SELECT 1")
+
+        # Assert
+        assert conn.info == {}
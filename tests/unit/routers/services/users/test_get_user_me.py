@@ -0,0 +1,166 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt
+import pytest
+
+from futuramaapi.core import settings
+from futuramaapi.db.models import UserModel
+from futuramaapi.db.session import session_manager
+from futuramaapi.routers.services import UnauthorizedError, invalidate_user
+from futuramaapi.routers.services._base import token_cache, user_cache
+from futuramaapi.routers.services.users.get_user_me import GetUserMeService
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches(request):
+    request.addfinalizer(token_cache.clear)
+    request.addfinalizer(user_cache.clear)
+
+
+@pytest.fixture(autouse=True)
+def mock_revocations(request):
+    is_revoked_patcher = patch(
+        "futuramaapi.routers.services._base.auth_revocations.is_revoked",
+        new_callable=AsyncMock,
+        return_value=False,
+    )
+    revoke_patcher = patch("futuramaapi.routers.services._base.auth_revocations.revoke", new_callable=AsyncMock)
+    is_revoked = is_revoked_patcher.start()
+    revoke = revoke_patcher.start()
+    request.addfinalizer(is_revoked_patcher.stop)
+    request.addfinalizer(revoke_patcher.stop)
+    return SimpleNamespace(is_revoked=is_revoked, revoke=revoke)
+
+
+@pytest.fixture
+def user(faker):
+    return UserModel(
+        id=faker.random_int(min=1),
+        uuid=faker.uuid4(cast_to=None),
+        name=faker.first_name(),
+        surname=faker.last_name(),
+        email=faker.email(),
+        username=faker.user_name(),
+        password="pbkdf2_sha256.1.salt.hash",  # noqa: S106
+        is_confirmed=True,
+        is_subscribed=True,
+        created_at=datetime.now(UTC),
+    )
+
+
+def _get_token(user: UserModel, /, *, type_: str = "access") -> str:
+    return jwt.encode(
+        {
+            "exp": datetime.now(UTC) + timedelta(minutes=15),
+            "type": type_,
+            "user": {
+                "id": user.id,
+            },
+        },
+        settings.secret_key.get_secret_value(),
+        algorithm="HS256",
+    )
+
+
+class TestGetUserMeService:
+    @pytest.mark.asyncio
+    async def test_get_user_me_cached(
+        self,
+        user: UserModel,
+        mock_session_manager,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.one.return_value = user
+        mock_session_manager.execute.return_value = mock_result
+        token: str = _get_token(user)
+
+        # Act
+        first = await GetUserMeService(token=token)()
+        second = await GetUserMeService(token=token)()
+
+        # Assert
+        # The password is only ever rendered masked, the cached user has a placeholder instead of the hash.
+        assert first.model_dump(mode="json") == second.model_dump(mode="json")
+        assert second.username == user.username
+        mock_session_manager.execute.assert_awaited_once()
+        # The second call is served from the cache without acquiring a session.
+        session_manager.create_session.assert_called_once()
+        mock_session_manager.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_user_me_invalidated(
+        self,
+        user: UserModel,
+        mock_session_manager,
+        mock_revocations,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.one.return_value = user
+        mock_session_manager.execute.return_value = mock_result
+        token: str = _get_token(user)
+
+        # Act
+        await GetUserMeService(token=token)()
+        await invalidate_user(user.id)
+        await GetUserMeService(token=token)()
+
+        # Assert
+        assert mock_session_manager.execute.await_count == 2  # noqa: PLR2004
+        mock_revocations.revoke.assert_awaited_once_with(f"user:{user.id}")
+
+    @pytest.mark.asyncio
+    async def test_get_user_me_revoked(
+        self,
+        user: UserModel,
+        mock_session_manager,
+        mock_revocations,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.one.return_value = user
+        mock_session_manager.execute.return_value = mock_result
+        token: str = _get_token(user)
+        await GetUserMeService(token=token)()
+        mock_revocations.is_revoked.return_value = True
+
+        # Act
+        await GetUserMeService(token=token)()
+
+        # Assert
+        assert mock_session_manager.execute.await_count == 2  # noqa: PLR2004
+        assert mock_revocations.is_revoked.await_args.args[1:] == (f"user:{user.id}",)
+
+    @pytest.mark.asyncio
+    async def test_get_user_me_password_not_cached(
+        self,
+        user: UserModel,
+        mock_session_manager,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.one.return_value = user
+        mock_session_manager.execute.return_value = mock_result
+
+        # Act
+        await GetUserMeService(token=_get_token(user))()
+
+        # Assert
+        assert "password" not in user_cache.get(user.id).columns
+
+    @pytest.mark.asyncio
+    async def test_get_user_me_refresh_token(
+        self,
+        user: UserModel,
+        mock_session_manager,
+    ):
+        # Arrange
+        service = GetUserMeService(token=_get_token(user, type_="refresh"))
+
+        # Act & Assert
+        with pytest.raises(UnauthorizedError):
+            await service()
+        assert len(token_cache) == 0
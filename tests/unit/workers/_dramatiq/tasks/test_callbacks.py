@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from futuramaapi.workers._dramatiq.tasks import callback_sweeper, send_due_callbacks
+from futuramaapi.workers.services.callbacks.send_callbacks import ScheduledCallback
+
+
+@pytest.fixture
+def mock_callback_queue(request):
+    patcher = patch("futuramaapi.workers._dramatiq.tasks.callbacks.callback_queue", new_callable=AsyncMock)
+    mocked = patcher.start()
+    request.addfinalizer(patcher.stop)
+
+    callback = ScheduledCallback(kind="Character", id=1, callback_url="https://example.com/callback")
+    mocked.claim_due.return_value = {callback.model_dump_json(): callback}
+    return mocked
+
+
+@pytest.fixture
+def mock_send_callbacks_call(request):
+    patcher = patch(
+        "futuramaapi.workers._dramatiq.tasks.callbacks.SendCallbacksTaskService.__call__",
+        new_callable=AsyncMock,
+    )
+    mocked = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mocked
+
+
+class TestSendDueCallbacks:
+    @pytest.mark.asyncio
+    async def test_acked_after_delivery(self, mock_callback_queue, mock_send_callbacks_call):
+        # Act
+        await send_due_callbacks.fn.__wrapped__()
+
+        # Assert
+        mock_send_callbacks_call.assert_awaited_once()
+        mock_callback_queue.ack.assert_awaited_once()
+        mock_callback_queue.release.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_released_on_failure(self, mock_callback_queue, mock_send_callbacks_call):
+        # Arrange
+        mock_send_callbacks_call.side_effect = ConnectionError()
+
+        # Act & Assert
+        with pytest.raises(ConnectionError):
+            await send_due_callbacks.fn.__wrapped__()
+        mock_callback_queue.release.assert_awaited_once()
+        mock_callback_queue.ack.assert_not_awaited()
+
+
+class TestCallbackSweeper:
+    @pytest.mark.asyncio
+    async def test_sweep_enqueues_due(self, request, mock_callback_queue):
+        # Arrange
+        patcher = patch.object(send_due_callbacks, "send")
+        mock_send = patcher.start()
+        request.addfinalizer(patcher.stop)
+        mock_callback_queue.has_due.return_value = True
+
+        # Act
+        swept: bool = await callback_sweeper.sweep()
+
+        # Assert
+        assert swept is True
+        mock_send.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_sweep_nothing_due(self, request, mock_callback_queue):
+        # Arrange
+        patcher = patch.object(send_due_callbacks, "send")
+        mock_send = patcher.start()
+        request.addfinalizer(patcher.stop)
+        mock_callback_queue.has_due.return_value = False
+
+        # Act
+        swept: bool = await callback_sweeper.sweep()
+
+        # Assert
+        assert swept is False
+        mock_send.assert_not_called()
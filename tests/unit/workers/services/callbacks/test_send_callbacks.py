@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from futuramaapi.db.models import CharacterModel
+from futuramaapi.workers.services.callbacks.send_callbacks import ScheduledCallback, SendCallbacksTaskService
+
+
+@pytest.fixture
+def mock_worker_session(request):
+    mock_context = AsyncMock()
+    mock_session = AsyncMock()
+    mock_context.__aenter__.return_value = mock_session
+
+    patcher = patch(
+        "futuramaapi.workers.services.callbacks.send_callbacks.session_manager.session",
+        return_value=mock_context,
+    )
+    patcher.start()
+    request.addfinalizer(patcher.stop)
+
+    return mock_session
+
+
+class TestSendCallbacksTaskService:
+    @pytest.mark.asyncio
+    async def test_send_callbacks_grouped(
+        self,
+        character: CharacterModel,
+        mock_worker_session,
+    ):
+        # Arrange
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [character]
+        mock_worker_session.execute.return_value = mock_result
+
+        api_client = AsyncMock()
+        callbacks = [
+            ScheduledCallback(kind="Character", id=character.id, callback_url="https://example.com/first"),
+            ScheduledCallback(kind="Character", id=character.id + 1, callback_url="https://example.org/callback"),
+            ScheduledCallback(kind="Character", id=character.id, callback_url="https://example.com/second"),
+        ]
+        service = SendCallbacksTaskService(callbacks=callbacks, api_client=api_client)
+
+        # Act
+        await service()
+
+        # Assert
+        mock_worker_session.execute.assert_awaited_once()
+        sent = {call.args[0].url: call.args[0].json for call in api_client.request.await_args_list}
+        assert [url for url in sent if "example.com" in url] == [
+            "https://example.com/first",
+            "https://example.com/second",
+        ]
+        assert sent["https://example.com/first"]["item"]["name"] == character.name
+        assert sent["https://example.org/callback"]["item"] == {"id": character.id + 1, "detail": "Not found"}
+
+    @pytest.mark.asyncio
+    async def test_send_callbacks_host(self):
+        # Arrange
+        callback = ScheduledCallback(kind="Season", id=1, callback_url="http://example.com/callback")
+
+        # Act & Assert
+        assert callback.host == "example.com:80"
+        assert ScheduledCallback.model_validate_json(callback.model_dump_json()) == callback